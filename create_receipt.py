@@ -1,44 +1,56 @@
 from PIL import Image, ImageDraw, ImageFont
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
 
+# Receipt text
+RECEIPT_TEXT = [
+    "RECEIPT #12345",
+    "Date: 2025-06-17",
+    "",
+    "Item      Qty  Price  Total",
+    "-" * 30,
+    "Coffee    2    $3.50  $7.00",
+    "Sandwich  1    $8.99  $8.99",
+    "-" * 30,
+    "Subtotal: $15.99",
+    "Tax:      $1.28",
+    "Total:    $17.27",
+    "",
+    "Thank you for your business!"
+]
+
+@lru_cache(maxsize=None)
+def get_font():
+    """Load the receipt font once per process"""
+    try:
+        return ImageFont.truetype("Arial.ttf", 12)
+    except IOError:
+        return ImageFont.load_default()
+
 def create_receipt_image(output_path):
     # Create a new image with white background
     width, height = 400, 300
     image = Image.new('RGB', (width, height), 'white')
     draw = ImageDraw.Draw(image)
+    font = get_font()
     
-    # Use default font
-    try:
-        font = ImageFont.truetype("Arial.ttf", 12)
-    except IOError:
-        font = ImageFont.load_default()
-    
-    # Receipt text
-    receipt_text = [
-        "RECEIPT #12345",
-        "Date: 2025-06-17",
-        "",
-        "Item      Qty  Price  Total",
-        "-" * 30,
-        "Coffee    2    $3.50  $7.00",
-        "Sandwich  1    $8.99  $8.99",
-        "-" * 30,
-        "Subtotal: $15.99",
-        "Tax:      $1.28",
-        "Total:    $17.27",
-        "",
-        "Thank you for your business!"
-    ]
-    
-    # Draw text on image
-    y_position = 10
-    for line in receipt_text:
-        draw.text((10, y_position), line, fill='black', font=font)
-        y_position += 15
+    # Draw all lines in one call; pad Pillow's line height to a 15px pitch
+    line_height = draw.textbbox((0, 0), "A", font=font)[3]
+    draw.multiline_text(
+        (10, 10), "\n".join(RECEIPT_TEXT), fill='black', font=font,
+        spacing=15 - line_height
+    )
     
     # Save the image
     image.save(output_path)
     print(f"Receipt image saved as {os.path.abspath(output_path)}")
 
+def create_receipt_images(output_paths, max_workers=None):
+    """Render several receipts, encoding and writing them on a thread pool"""
+    get_font()  # load before the workers start so they share one font object
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        list(executor.map(create_receipt_image, output_paths))
+
 if __name__ == "__main__":
     create_receipt_image("receipt.jpg")
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 import sys
 import json
+import logging
 import re
 from pdf2json import extract_text_from_pdf
 
+# Compiled once at import; these run inside per-line loops
+_RX_INV = re.compile(r'Invoice number\s+([A-Za-z0-9-]+)')
+_RX_DATE = re.compile(r'Date paid\s+([A-Za-z]+ \d+, \d{4})')
+_RX_QTY_PRICE = re.compile(r'(\d+)\s+\$(\d+\.\d+)')
+_RX_AMOUNT = re.compile(r'\$(\d+\.\d+)')
+
+log = logging.getLogger(__name__)
+
 def extract_openrouter_data(text):
     """Special extraction just for OpenRouter receipts"""
-    lines = text.split('\n')
+    lines = text.splitlines()
     
     # Initialize data structure
     data = {
@@ -18,47 +27,41 @@ def extract_openrouter_data(text):
         "totals": {"net": None, "tax": None, "gross": None, "currency": "USD"}
     }
     
-    # Print all lines for debugging
-    print("--- LINE BY LINE ANALYSIS ---")
-    for i, line in enumerate(lines):
-        print(f"Line {i}: '{line}'")
+    # Dump all lines for debugging as one message, only when it will be shown
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("--- LINE BY LINE ANALYSIS ---\n%s", "\n".join(
+            f"Line {i}: {line!r}" for i, line in enumerate(lines)
+        ))
     
-    # Extract invoice number
-    for line in lines:
-        if "Invoice number" in line:
-            match = re.search(r'Invoice number\s+([A-Za-z0-9-]+)', line)
+    # Single pass over the lines; the single-value fields are looked up until
+    # first found, while every Qty/Unit price header adds an item
+    need_invnum = need_date = need_amount = True
+    last = len(lines) - 1
+    for i, line in enumerate(lines):
+        if need_invnum and "Invoice number" in line:
+            match = _RX_INV.search(line)
             if match:
                 data["invoice_number"] = match.group(1)
-                print(f"Found invoice number: {data['invoice_number']}")
-                break
-    
-    # Extract date
-    for line in lines:
-        if "Date paid" in line:
-            match = re.search(r'Date paid\s+([A-Za-z]+ \d+, \d{4})', line)
+                log.debug("Found invoice number: %s", data["invoice_number"])
+                need_invnum = False
+        if need_date and "Date paid" in line:
+            match = _RX_DATE.search(line)
             if match:
                 data["invoice_date"] = match.group(1)
-                print(f"Found date: {data['invoice_date']}")
-                break
-    
-    # Find quantity and price
-    qty_found = False
-    price_found = False
-    for i, line in enumerate(lines):
+                log.debug("Found date: %s", data["invoice_date"])
+                need_date = False
         if "Qty" in line and "Unit price" in line:
-            print(f"Found Qty/Unit price header at line {i}")
+            log.debug("Found Qty/Unit price header at line %d", i)
             # Check the next line for quantity and price
-            if i + 1 < len(lines):
+            if i < last:
                 qty_line = lines[i + 1]
-                print(f"Checking line {i+1} for qty/price: '{qty_line}'")
-                match = re.search(r'(\d+)\s+\$(\d+\.\d+)', qty_line)
+                log.debug("Checking line %d for qty/price: %r", i + 1, qty_line)
+                match = _RX_QTY_PRICE.search(qty_line)
                 if match:
                     qty = int(match.group(1))
                     price = float(match.group(2))
-                    print(f"Found quantity: {qty}, price: ${price}")
-                    qty_found = True
-                    price_found = True
-                    
+                    log.debug("Found quantity: %d, price: $%s", qty, price)
+
                     # Add item
                     item = {
                         "description": "OpenRouter Credits",
@@ -71,39 +74,42 @@ def extract_openrouter_data(text):
                     }
                     data["items"].append(item)
                     data["totals"]["net"] = qty * price
-                    print(f"Added item: {item}")
-    
-    # Find amount/total
-    for i, line in enumerate(lines):
-        if "Amount" in line and i + 1 < len(lines):
+                    log.debug("Added item: %s", item)
+
+        # The amount header can share a line with the fields above
+        if need_amount and "Amount" in line and i < last:
             amount_line = lines[i + 1]
-            print(f"Checking line {i+1} for amount: '{amount_line}'")
-            match = re.search(r'\$(\d+\.\d+)', amount_line)
+            log.debug("Checking line %d for amount: %r", i + 1, amount_line)
+            match = _RX_AMOUNT.search(amount_line)
             if match:
                 amount = float(match.group(1))
-                print(f"Found amount: ${amount}")
+                log.debug("Found amount: $%s", amount)
                 data["totals"]["gross"] = amount
-                break
+                need_amount = False
     
     # If we still don't have a gross amount, look for "paid"
     if not data["totals"]["gross"]:
         for line in lines:
             if "paid" in line:
-                match = re.search(r'\$(\d+\.\d+)', line)
+                match = _RX_AMOUNT.search(line)
                 if match:
                     amount = float(match.group(1))
-                    print(f"Found paid amount: ${amount}")
+                    log.debug("Found paid amount: $%s", amount)
                     data["totals"]["gross"] = amount
                     break
     
     return data
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python debug_extraction.py <pdf_path>")
+    args = sys.argv[1:]
+    verbose = "-v" in args or "--verbose" in args
+    args = [arg for arg in args if arg not in ("-v", "--verbose")]
+    if not args:
+        print("Usage: python debug_extraction.py [-v] <pdf_path>")
         sys.exit(1)
     
-    pdf_path = sys.argv[1]
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO, format="%(message)s")
+    pdf_path = args[0]
     print(f"Extracting text from {pdf_path}...")
     text = extract_text_from_pdf(pdf_path)
     
@@ -1,6 +1,37 @@
 """Debug script for receipt item extraction."""
 import re
 
+# Patterns under test, compiled once with their flags baked in.
+# The items block is line-anchored: each body line is consumed once, so a
+# missing SUBTOTAL cannot send the engine back over the whole text.
+_RX_ITEMS_BLOCK = re.compile(
+    r'^[ \t]*ITEM[^\n]*TOTAL[ \t]*\n[ \t]*-+[ \t]*\n'
+    r'((?:(?![ \t]*SUBTOTAL)[^\n]*\n)*)[ \t]*SUBTOTAL',
+    re.IGNORECASE | re.MULTILINE,
+)
+_RX_GROCERIES = re.compile(r'(?s)GROCERIES\s*\n(.*?)\n\s*\n', re.IGNORECASE)
+_RX_ITEM_LINE = re.compile(
+    r'^[ \t]*([A-Za-z]+)[ \t]+([\d.]+(?:lb)?)[ \t]+([\d.]+)[ \t]+([\d.]+)[ \t]*$',
+    re.MULTILINE,
+)
+
+def _find_between_dashes(text):
+    """Return the lines between the first two dashed separators, or None."""
+    start = text.find("-----")
+    if start < 0:
+        return None
+    body_start = text.find("\n", start)
+    if body_start < 0:
+        return None
+    end = text.find("-----", body_start)
+    if end < 0:
+        return None
+    body_end = text.rfind("\n", body_start, end)
+    if body_end <= body_start:
+        return None
+    return text[body_start + 1:body_end]
+
+
 def test_receipt_patterns():
     """Test different regex patterns for extracting receipt items."""
     # Sample receipt text
@@ -35,18 +66,16 @@ def test_receipt_patterns():
     print("=== Testing receipt patterns ===\n")
     
     # Pattern 1: Match between ITEM header and SUBTOTAL
-    pattern1 = r'(?s)ITEM.*?TOTAL\s*-+\s*(.*?)\s*SUBTOTAL'
-    match1 = re.search(pattern1, text, re.IGNORECASE)
+    match1 = _RX_ITEMS_BLOCK.search(text)
     print("Pattern 1 (ITEM to SUBTOTAL):")
     if match1:
         print("✅ Match found!")
-        print("Captured group:\n---\n{}\\n---\n".format(match1.group(1)))
+        print("Captured group:\n---\n{}\\n---\n".format(match1.group(1).strip()))
     else:
         print("❌ No match")
     
     # Pattern 2: Match GROCERIES section
-    pattern2 = r'(?s)GROCERIES\s*\n(.*?)\n\s*\n'
-    match2 = re.search(pattern2, text, re.IGNORECASE)
+    match2 = _RX_GROCERIES.search(text)
     print("\nPattern 2 (GROCERIES section):")
     if match2:
         print("✅ Match found!")
@@ -56,23 +85,19 @@ def test_receipt_patterns():
     
     # Pattern 3: Match individual item lines
     print("\nPattern 3 (Individual items):")
-    item_pattern = r'^\s*([A-Za-z]+)\s+([\d.]+(?:lb)?)\s+([\d.]+)\s+([\d.]+)\s*$'
-    for line in text.split('\n'):
-        if re.match(item_pattern, line.strip()):
-            print(f"✅ Item line: {line.strip()}")
-            match = re.match(item_pattern, line.strip())
-            print(f"   - Description: {match.group(1).strip()}")
-            print(f"   - Quantity: {match.group(2).strip()}")
-            print(f"   - Price: {match.group(3).strip()}")
-            print(f"   - Total: {match.group(4).strip()}")
+    for match in _RX_ITEM_LINE.finditer(text):
+        print(f"✅ Item line: {match.group(0).strip()}")
+        print(f"   - Description: {match.group(1)}")
+        print(f"   - Quantity: {match.group(2)}")
+        print(f"   - Price: {match.group(3)}")
+        print(f"   - Total: {match.group(4)}")
     
     # Pattern 4: Match between dashes
-    pattern4 = r'(?s)-{5,}\s*\n(.*?)\n\s*-{5,}'
-    match4 = re.search(pattern4, text)
+    block4 = _find_between_dashes(text)
     print("\nPattern 4 (Between dashes):")
-    if match4:
+    if block4 is not None:
         print("✅ Match found!")
-        print("Captured group:\n---\n{}\\n---\n".format(match4.group(1)))
+        print("Captured group:\n---\n{}\\n---\n".format(block4))
     else:
         print("❌ No match")
 
@@ -6,13 +6,25 @@ This script provides detailed logging of the decision tree process during invoic
 It shows step-by-step how document detection, extractor selection, and data extraction work.
 """
 
+import argparse
+import functools
+import io
+import itertools
 import os
 import sys
 import json
 import logging
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Dict, Any, Optional, List, Tuple
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure detailed logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -24,9 +36,22 @@ logging.basicConfig(
 
 logger = logging.getLogger("decision_tree_debug")
 
+# Number of leading pages used for document type detection
+DETECTION_PAGES = 2
+
+# An English-only OCR pass is kept when English markers score at least this
+# (get_document_language_confidence units, ~3 marker hits) and beat every other
+# language by this ratio; otherwise OCR is rerun with the full language list
+ENGLISH_MIN_SCORE = 0.3
+ENGLISH_MIN_RATIO = 2.0
+
+# OCR output is cached here, keyed by file content hash and OCR languages
+OCR_CACHE_DIR = os.path.expanduser("~/.cache/invocr/ocr")
+
 # Import invocr modules
 try:
-    from invocr.utils.ocr import extract_text
+    from invocr.utils.ocr import get_document_language_confidence, iter_page_text
+    from invocr.utils.helpers import get_file_hash
     from invocr.core.detection.document_detector import DocumentDetector
     from invocr.core.detection.extractor_selector import ExtractorSelector
     from invocr.core.validators.extraction_validator import ExtractionValidator
@@ -40,13 +65,38 @@ except ImportError as e:
     sys.exit(1)
 
 
+def _json_default(obj: Any) -> str:
+    """Serialize types JSON has no native form for (dates as ISO strings)"""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def to_json(data: Any) -> str:
+    """Pretty-print data as JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=_json_default
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles those
+    return json.dumps(data, indent=2, default=_json_default)
+
+
 class DecisionTreeDebugger:
     """Debug class for tracing the decision tree process"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = OCR_CACHE_DIR, ocr_workers: Optional[int] = None,
+                 multi_lang: bool = False):
         self.detector = DocumentDetector()
         self.selector = ExtractorSelector()
         self.validator = ExtractionValidator()
+        self.cache_dir = cache_dir
+        # Skip the English-only probe and always OCR with every requested language
+        self.multi_lang = multi_lang
+        # Pages OCR'd concurrently when a PDF has no text layer
+        self.ocr_workers = ocr_workers or min(os.cpu_count() or 1, 6)
         self.step_count = 0
         
     def log_step(self, title: str, message: str = "", data: Any = None):
@@ -58,7 +108,7 @@ class DecisionTreeDebugger:
             logger.info(f"{message}")
         if data:
             if isinstance(data, dict):
-                logger.info(json.dumps(data, indent=2, default=str))
+                logger.info(to_json(data))
             else:
                 logger.info(f"{data}")
         logger.info(f"{'='*80}\n")
@@ -80,26 +130,28 @@ class DecisionTreeDebugger:
             
         self.log_step("Starting Processing", f"File: {file_path}")
         
-        # Extract text from PDF
+        # Extract text from PDF; detection only needs the first pages
         self.log_step("Extracting Text", "Extracting text from PDF using OCR")
-        ocr_text = extract_text(file_path, languages=languages)
+        pages, ocr_buffer = self._start_text_extraction(file_path, languages)
+        head_text = ocr_buffer.getvalue()
         
         # Log a sample of the extracted text
-        text_sample = ocr_text[:500] + "..." if len(ocr_text) > 500 else ocr_text
+        text_sample = head_text[:500] + "..." if len(head_text) > 500 else head_text
         self.log_step("OCR Text Sample", "First 500 characters of extracted text:", text_sample)
         
         # Prepare metadata
         metadata = {
             "filename": os.path.basename(file_path),
             "file_extension": os.path.splitext(file_path)[1].lower(),
-            "ocr_text_length": len(ocr_text),
+            "ocr_text_length": len(head_text),
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
         }
         self.log_step("Document Metadata", "Metadata prepared for document detection:", metadata)
         
         # Detect document type
-        self.log_step("Document Detection", "Detecting document type using patterns and metadata")
-        doc_type, confidence, features = self.detector.detect_document_type(ocr_text, metadata)
+        self.log_step("Document Detection",
+                      f"Detecting document type from the first {DETECTION_PAGES} pages using patterns and metadata")
+        doc_type, confidence, features = self.detector.detect_document_type(head_text, metadata)
         
         detection_results = {
             "document_type": doc_type,
@@ -108,6 +160,12 @@ class DecisionTreeDebugger:
         }
         self.log_step("Detection Results", "Document detection results:", detection_results)
         
+        # Extraction and validation work on the whole document
+        for page in pages:
+            self._append_page(ocr_buffer, page)
+        ocr_text = ocr_buffer.getvalue()
+        metadata["ocr_text_length"] = len(ocr_text)
+        
         # Select appropriate extractor
         self.log_step("Extractor Selection", "Selecting appropriate extractor based on document type and features")
         extractor = self.selector.select_extractor(doc_type, ocr_text, metadata, features)
@@ -145,9 +203,7 @@ class DecisionTreeDebugger:
             self.log_step("Extraction Stats", "Extraction performance metrics:", extraction_stats)
             
         except Exception as e:
-            logger.error(f"Error during extraction: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Error during extraction: %s", e)
             return {"error": str(e)}
         
         # Validate extraction results
@@ -170,33 +226,190 @@ class DecisionTreeDebugger:
         
         return invoice_data
 
+    def _start_text_extraction(self, file_path: str, languages: Optional[List[str]]):
+        """
+        Read the first pages used for detection and return (remaining pages, text buffer)
+        
+        OCR time grows with the number of languages, so multi-language runs first try
+        English alone and only restart with every language when English looks wrong.
+        """
+        if not self.multi_lang and languages and len(languages) > 1 and "eng" in languages:
+            pages = self._iter_pages(file_path, ["eng"])
+            ocr_buffer = self._read_pages(pages, DETECTION_PAGES)
+            if self._is_confident_english(ocr_buffer.getvalue()):
+                logger.info("English-only OCR looks sufficient; skipping the multi-language pass")
+                return pages, ocr_buffer
+            pages.close()
+            logger.info(f"English-only OCR inconclusive; rerunning with {'+'.join(languages)}")
+        
+        pages = self._iter_pages(file_path, languages)
+        return pages, self._read_pages(pages, DETECTION_PAGES)
+    
+    def _read_pages(self, pages, count: int) -> io.StringIO:
+        """Pull up to count pages into a new text buffer"""
+        ocr_buffer = io.StringIO()
+        for page in itertools.islice(pages, count):
+            self._append_page(ocr_buffer, page)
+        return ocr_buffer
+    
+    @staticmethod
+    def _is_confident_english(text: str) -> bool:
+        """Check whether English markers clearly dominate the other languages"""
+        scores = get_document_language_confidence(text)
+        english = scores.pop("en", 0.0)
+        runner_up = max(scores.values(), default=0.0)
+        return english >= ENGLISH_MIN_SCORE and english >= ENGLISH_MIN_RATIO * runner_up
+    
+    def _iter_pages(self, file_path: str, languages: Optional[List[str]]):
+        """Yield page texts, reusing cached OCR output when this file was seen before"""
+        if not self.cache_dir:
+            yield from iter_page_text(file_path, languages=languages, ocr_workers=self.ocr_workers)
+            return
+        
+        cache_key = f"{get_file_hash(file_path)}-{'+'.join(languages or ['default'])}"
+        cache_path = os.path.join(self.cache_dir, cache_key + ".json")
+        if os.path.exists(cache_path):
+            logger.info(f"Using cached OCR text from {cache_path}")
+            yield from _load_cached_pages(cache_path)
+            return
+        
+        pages = []
+        for page in iter_page_text(file_path, languages=languages, ocr_workers=self.ocr_workers):
+            pages.append(page)
+            yield page
+        
+        # Write atomically so parallel workers never read a partial file
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(pages, f)
+        os.replace(tmp_path, cache_path)
+    
+    @staticmethod
+    def _append_page(buffer: io.StringIO, page: str):
+        """Append a page of text to the OCR buffer, separating pages with a blank line"""
+        if buffer.tell():
+            buffer.write("\n\n")
+        buffer.write(page)
+
+    def process_files(self, file_paths: List[str], languages: Optional[List[str]] = None,
+                      workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Process several files, in parallel worker processes when more than one worker is used
+        
+        Each worker builds its debugger once and reuses it for every file it receives.
+        
+        Args:
+            file_paths: Paths to the PDF files
+            languages: List of languages for OCR
+            workers: Number of worker processes (default: min(cpu count, 4))
+            
+        Returns:
+            Mapping of file path to extracted invoice data
+        """
+        workers = workers or min(os.cpu_count() or 1, 4)
+        if workers == 1 or len(file_paths) <= 1:
+            return {path: self.process_file(path, languages=languages) for path in file_paths}
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.cache_dir, self.multi_lang)) as executor:
+            futures = {
+                executor.submit(_process_in_worker, path, languages): path
+                for path in file_paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed on {path}: {e}")
+                    results[path] = {"error": str(e)}
+        return results
+
+
+# Per-process debugger, created once by the pool initializer
+_worker_debugger: Optional[DecisionTreeDebugger] = None
+
+
+def _init_worker(cache_dir: Optional[str], multi_lang: bool):
+    global _worker_debugger
+    # Files already run in parallel here, so OCR each file's pages one at a time
+    _worker_debugger = DecisionTreeDebugger(cache_dir=cache_dir, ocr_workers=1, multi_lang=multi_lang)
+
+
+def _process_in_worker(file_path: str, languages: Optional[List[str]]) -> Dict[str, Any]:
+    return _worker_debugger.process_file(file_path, languages=languages)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached_pages(cache_path: str) -> Tuple[str, ...]:
+    """Read cached page texts; the path embeds the content hash, so entries never go stale"""
+    with open(cache_path, encoding='utf-8') as f:
+        return tuple(json.load(f))
+
+
+def _save_results(invoice_data: Dict[str, Any], output_path: str):
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(to_json(invoice_data))
+    print(f"\nResults saved to {output_path}")
+
 
 def main():
     """Main function to run the debug script"""
-    if len(sys.argv) < 2:
-        print(f"Usage: {sys.argv[0]} <pdf_file_path> [output_json_path]")
-        sys.exit(1)
-        
-    pdf_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    parser = argparse.ArgumentParser(description="Trace the invoice extraction decision tree")
+    parser.add_argument("pdf_path", help="PDF file or directory of PDF files")
+    parser.add_argument("output_path", nargs="?", help="Output JSON file (or directory for a folder)")
+    parser.add_argument("--no-cache", action="store_true", help="Always re-run OCR instead of using cached text")
+    parser.add_argument("--multi-lang", action="store_true",
+                        help="OCR with all languages straight away instead of trying English first")
+    args = parser.parse_args()
+    
+    pdf_path = args.pdf_path
+    output_path = args.output_path
     
     # Create debugger
-    debugger = DecisionTreeDebugger()
+    debugger = DecisionTreeDebugger(
+        cache_dir=None if args.no_cache else OCR_CACHE_DIR,
+        multi_lang=args.multi_lang
+    )
+    
+    # Use multiple languages for better OCR results
+    languages = ["eng", "pol", "est", "deu"]
+    
+    if os.path.isdir(pdf_path):
+        pdf_files = sorted(
+            os.path.join(pdf_path, name) for name in os.listdir(pdf_path)
+            if name.lower().endswith('.pdf')
+        )
+        print(f"\n{'*'*100}")
+        print(f"DECISION TREE DEBUG: Processing {len(pdf_files)} files in {pdf_path}")
+        print(f"{'*'*100}\n")
+        
+        results = debugger.process_files(pdf_files, languages=languages)
+        
+        if output_path:
+            os.makedirs(output_path, exist_ok=True)
+            for file_path, invoice_data in results.items():
+                name = os.path.splitext(os.path.basename(file_path))[0] + '.json'
+                _save_results(invoice_data, os.path.join(output_path, name))
+        
+        failed = sum(1 for data in results.values() if not data or 'error' in data)
+        print(f"\n{'*'*100}")
+        print(f"PROCESSING COMPLETE: {len(results) - failed} succeeded, {failed} failed")
+        print(f"{'*'*100}\n")
+        return
     
     # Process file with detailed logging
     print(f"\n{'*'*100}")
     print(f"DECISION TREE DEBUG: Processing {pdf_path}")
     print(f"{'*'*100}\n")
     
-    # Use multiple languages for better OCR results
-    languages = ["eng", "pol", "est", "deu"]
     invoice_data = debugger.process_file(pdf_path, languages=languages)
     
     # Save results if output path provided
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(invoice_data, f, indent=2, default=str)
-        print(f"\nResults saved to {output_path}")
+        _save_results(invoice_data, output_path)
     
     # Final summary
     print(f"\n{'*'*100}")
@@ -6,38 +6,100 @@ Simple PDF examination script to extract text and analyze content.
 import sys
 import os
 import json
+import re
+import shutil
 import subprocess
+from itertools import chain
+
+# Resolved once; None when pdftotext is not installed
+_PDFTOTEXT = shutil.which("pdftotext")
+
+# Every keyword any field check looks for; currencies stay case-sensitive.
+_KEYWORDS = (
+    "invoice", "number", "faktura", "nr", "arve",
+    "date", "kuupäev", "data",
+    "ltd", "llc", "inc", "gmbh", "ou", "sp. z o.o.",
+    "vat", "tax", "nip", "kmkr", "reg",
+    "item", "description", "quantity", "price", "opis", "cena", "toode", "hind",
+)
+_CURRENCIES = ("$", "€", "£", "PLN", "EUR", "USD")
+
+# One sweep per line finds all keywords; the lookahead keeps overlapping hits
+_KEYWORD_RX = re.compile(
+    "(?=({}|(?-i:{})))".format(
+        "|".join(map(re.escape, _KEYWORDS)),
+        "|".join(map(re.escape, _CURRENCIES)),
+    ),
+    re.IGNORECASE,
+)
+
+# (category, label, keyword sets) - a line matches if any set is fully present
+_FIELD_CHECKS = (
+    ("invoice_number", "Potential invoice number line", [{"invoice", "number"}]),
+    ("invoice_number", "Potential invoice number line (Polish)", [{"faktura", "nr"}]),
+    ("invoice_number", "Potential invoice number line (Estonian)", [{"arve", "nr"}]),
+    ("date", "Potential date line", [{"date"}, {"kuupäev"}, {"data"}]),
+    ("company", "Potential company name",
+     [{"ltd"}, {"llc"}, {"inc"}, {"gmbh"}, {"ou"}, {"sp. z o.o."}]),
+    ("tax_id", "Potential tax ID line",
+     [{"vat"}, {"tax"}, {"nip"}, {"kmkr"}, {"reg"}]),
+    ("amount", "Potential amount line",
+     [{"$"}, {"€"}, {"£"}, {"pln"}, {"eur"}, {"usd"}]),
+    ("item_header", "Potential item table header",
+     [{"item", "description"}, {"quantity", "price"}, {"opis", "cena"}, {"toode", "hind"}]),
+)
+_CATEGORIES = tuple(dict.fromkeys(category for category, _, _ in _FIELD_CHECKS))
 
 def extract_text_with_pdftotext(pdf_path):
-    """Extract text from PDF using pdftotext command line tool"""
-    try:
-        # Check if pdftotext is available
-        subprocess.run(['which', 'pdftotext'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # Extract text using pdftotext
-        result = subprocess.run(
-            ['pdftotext', '-layout', pdf_path, '-'],
-            check=True, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        return result.stdout
-    except subprocess.CalledProcessError:
+    """Stream text lines from PDF using pdftotext command line tool"""
+    if _PDFTOTEXT is None:
         print("Error: pdftotext command failed or not available")
         return None
+    try:
+        proc = subprocess.Popen(
+            [_PDFTOTEXT, '-layout', pdf_path, '-'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
     except Exception as e:
         print(f"Error extracting text: {e}")
         return None
+    return _iter_output_lines(proc)
 
-def analyze_text(text):
-    """Analyze extracted text to identify key invoice fields"""
-    if not text:
+def _iter_output_lines(proc):
+    """Yield pdftotext output line by line while the process is still running"""
+    with proc:
+        for line in proc.stdout:
+            # splitlines also breaks on the form feeds pdftotext puts between pages
+            yield from line.splitlines()
+        if proc.wait() != 0:
+            print("Error: pdftotext command failed or not available")
+
+def analyze_text(lines):
+    """Analyze extracted text lines (or a full text string) to identify key invoice fields"""
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    lines = iter(lines)
+    first_line = next(lines, None)
+    if first_line is None:
         return {}
     
-    # Print the full text for inspection
+    # Print the full text for inspection while sweeping each line for keywords,
+    # bucketing hits by field category
     print("\n--- FULL TEXT CONTENT ---\n")
-    print(text)
+    hits_by_category = {category: [] for category in _CATEGORIES}
+    line_count = 0
+    for i, line in enumerate(chain((first_line,), lines)):
+        print(line)
+        line_count += 1
+        found = {keyword.lower() for keyword in _KEYWORD_RX.findall(line)}
+        if not found:
+            continue
+        for category, label, keyword_sets in _FIELD_CHECKS:
+            if any(keywords <= found for keywords in keyword_sets):
+                hits_by_category[category].append(f"{label} ({i}): {line}")
     print("\n--- END OF TEXT CONTENT ---\n")
     
     # Initialize results dictionary
@@ -65,51 +127,14 @@ def analyze_text(text):
         }
     }
     
-    # Split text into lines for analysis
-    lines = text.split('\n')
-    print(f"\nFound {len(lines)} lines of text")
+    print(f"\nFound {line_count} lines of text")
     
     # Look for key invoice fields
     print("\n--- FIELD DETECTION ---\n")
     
-    # Look for invoice number
-    for i, line in enumerate(lines):
-        if "invoice" in line.lower() and "number" in line.lower():
-            print(f"Potential invoice number line ({i}): {line}")
-        if "faktura" in line.lower() and "nr" in line.lower():
-            print(f"Potential invoice number line (Polish) ({i}): {line}")
-        if "arve" in line.lower() and "nr" in line.lower():
-            print(f"Potential invoice number line (Estonian) ({i}): {line}")
-    
-    # Look for dates
-    for i, line in enumerate(lines):
-        if any(date_term in line.lower() for date_term in ["date", "kuupäev", "data"]):
-            print(f"Potential date line ({i}): {line}")
-    
-    # Look for company names
-    for i, line in enumerate(lines):
-        if any(term in line.lower() for term in ["ltd", "llc", "inc", "gmbh", "ou", "sp. z o.o."]):
-            print(f"Potential company name ({i}): {line}")
-    
-    # Look for tax IDs
-    for i, line in enumerate(lines):
-        if any(tax_term in line.lower() for tax_term in ["vat", "tax", "nip", "kmkr", "reg"]):
-            print(f"Potential tax ID line ({i}): {line}")
-    
-    # Look for amounts and currency
-    for i, line in enumerate(lines):
-        if any(currency in line for currency in ["$", "€", "£", "PLN", "EUR", "USD"]):
-            print(f"Potential amount line ({i}): {line}")
-    
-    # Look for item table headers
-    for i, line in enumerate(lines):
-        if any(all(term in line.lower() for term in pair) for pair in [
-            ("item", "description"), 
-            ("quantity", "price"),
-            ("opis", "cena"),
-            ("toode", "hind")
-        ]):
-            print(f"Potential item table header ({i}): {line}")
+    for category in _CATEGORIES:
+        for hit in hits_by_category[category]:
+            print(hit)
     
     return results
 
@@ -127,16 +152,14 @@ def main():
     
     print(f"Examining PDF: {pdf_path}")
     
-    # Extract text from PDF
-    text = extract_text_with_pdftotext(pdf_path)
+    # Stream text lines from PDF straight into the analyzer
+    lines = extract_text_with_pdftotext(pdf_path)
+    results = analyze_text(lines) if lines is not None else {}
     
-    if not text:
+    if not results:
         print("Failed to extract text from PDF")
         sys.exit(1)
     
-    # Analyze the extracted text
-    results = analyze_text(text)
-    
     # Save results if output path provided
     if output_path:
         with open(output_path, 'w', encoding='utf-8') as f:
@@ -1,19 +1,9 @@
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 import os
 
-# Create a new image with white background
-width, height = 400, 300
-image = Image.new('RGB', (width, height), 'white')
-draw = ImageDraw.Draw(image)
-
-# Use default font (you might need to install a specific font for better results)
-try:
-    font = ImageFont.truetype("DejaVuSans.ttf", 12)
-except IOError:
-    font = ImageFont.load_default()
-
 # Receipt text
-receipt_text = """RECEIPT #12345
+RECEIPT_TEXT = """RECEIPT #12345
 Date: 2025-06-17
 
 Item      Qty  Price  Total
@@ -27,13 +17,31 @@ Total:    $17.27
 
 Thank you for your business!"""
 
-# Draw text on image
-y_position = 10
-for line in receipt_text.split('\n'):
-    draw.text((10, y_position), line, fill='black', font=font)
-    y_position += 15  # Adjust line spacing
+@lru_cache(maxsize=None)
+def get_font():
+    """Load the receipt font once per process"""
+    # Use default font (you might need to install a specific font for better results)
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", 12)
+    except IOError:
+        return ImageFont.load_default()
+
+def generate_receipt(text, output_path):
+    """Render receipt text on a white 400x300 image and save it"""
+    # Create a new image with white background
+    width, height = 400, 300
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+    font = get_font()
+
+    # Draw text on image, one line every 15 pixels; multiline_text spacing is
+    # the gap added below the height of a line
+    line_spacing = 15 - draw.textbbox((0, 0), "A", font=font)[3]
+    draw.multiline_text((10, 10), text, fill='black', font=font, spacing=line_spacing)
+
+    # Save the image
+    image.save(output_path)
+    print(f"Receipt image saved as {os.path.abspath(output_path)}")
 
-# Save the image
-output_path = "receipt.jpg"
-image.save(output_path)
-print(f"Receipt image saved as {os.path.abspath(output_path)}")
+if __name__ == "__main__":
+    generate_receipt(RECEIPT_TEXT, "receipt.jpg")
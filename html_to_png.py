@@ -1,30 +1,251 @@
 #!/usr/bin/env python3
+import hashlib
+import importlib.util
+import json
 import os
+import queue
+import re
 import sys
+import threading
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
+# Playwright keeps one headless Chromium open per worker for all its files;
+# imgkit starts a new wkhtmltoimage process for every file. imgkit is only
+# imported when it is used: without Playwright, or when Chromium cannot start
 try:
-    import imgkit
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
 except ImportError:
-    print("Error: imgkit is not installed. Please install it with:")
+    PLAYWRIGHT_AVAILABLE = False
+
+IMGKIT_AVAILABLE = importlib.util.find_spec('imgkit') is not None
+
+if not PLAYWRIGHT_AVAILABLE and not IMGKIT_AVAILABLE:
+    print("Error: neither playwright nor imgkit is installed. Please install one with:")
+    print("pip install playwright && playwright install chromium")
+    print("or:")
     print("pip install imgkit")
-    print("You also need to install wkhtmltopdf:")
+    print("You also need to install wkhtmltopdf for imgkit:")
     print("On Ubuntu/Debian: sudo apt-get install wkhtmltopdf")
     print("On macOS: brew install wkhtmltopdf")
     sys.exit(1)
 
-def convert_html_to_png(html_dir, output_dir=None, width=900, height=1600, delay=1):
+# Sidecar file in the output directory mapping HTML file names to the SHA-256
+# of the content their PNG was rendered from
+CACHE_FILE = '.html2png_cache.json'
+
+# Set once a worker has reported falling back from Chromium to imgkit
+_IMGKIT_FALLBACK_REPORTED = threading.Event()
+
+# Pages without a script tag are rendered without waiting for JavaScript
+_SCRIPT_RX = re.compile(rb'<script\b', re.IGNORECASE)
+
+def _scan_html(path):
+    """Return the hex SHA-256 of an HTML file and whether it contains a script tag, reading it once."""
+    with open(path, 'rb') as f:
+        content = f.read()
+    return hashlib.sha256(content).hexdigest(), _SCRIPT_RX.search(content) is not None
+
+def _load_cache(output_dir):
+    """Load the digest cache of an output directory; empty if missing or unreadable."""
+    try:
+        with open(os.path.join(output_dir, CACHE_FILE), encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_cache(output_dir, cache):
+    """Write the digest cache atomically, so an interrupted run cannot corrupt it."""
+    cache_file = os.path.join(output_dir, CACHE_FILE)
+    tmp_file = f"{cache_file}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, cache_file)
+
+def _imgkit_renderer(options):
+    """Return a function rendering an HTML file to a PNG file with imgkit."""
+    import imgkit
+    
+    static_options = {**options, 'javascript-delay': '0'}
+    return lambda html_file, png_file, has_script: imgkit.from_file(
+        str(html_file),
+        output_path=png_file,
+        options=options if has_script else static_options
+    )
+
+@contextmanager
+def _open_renderer(options, width, height, delay):
+    """
+    Yield a function rendering an HTML file to a PNG file, for one worker thread.
+    
+    The function takes the HTML file (Path), the PNG file (str) and whether
+    the HTML contains a script tag, which _convert_one() already knows from
+    hashing the file, so the HTML is not read again to find out.
+    
+    With Playwright, every call reuses the same browser page; Playwright
+    objects belong to the thread that created them, so each worker opens
+    its own. Pages without a script tag are captured without the delay.
+    When Chromium cannot be launched (e.g. its download is missing), the
+    worker renders with imgkit instead, if that is installed.
+    
+    Args:
+        options (dict): imgkit options, used when Playwright is not installed
+            or Chromium cannot be launched
+        width (int): Viewport width in pixels
+        height (int): Viewport height in pixels
+        delay (int): Seconds to wait for JavaScript to execute
+    """
+    if not PLAYWRIGHT_AVAILABLE:
+        yield _imgkit_renderer(options)
+        return
+    
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Exception as e:
+            launch_error = str(e).splitlines()[0] if str(e) else type(e).__name__
+        else:
+            try:
+                page = browser.new_page(viewport={'width': width, 'height': height})
+                # Don't load images for faster conversion, as with imgkit
+                page.route("**/*", lambda route: route.abort()
+                           if route.request.resource_type == "image" else route.continue_())
+                
+                def render(html_file, png_file, has_script):
+                    page.goto(html_file.resolve().as_uri())
+                    if has_script:
+                        page.wait_for_timeout(delay * 1000)
+                    page.screenshot(path=png_file)
+                
+                yield render
+            finally:
+                browser.close()
+            return
+    
+    if not IMGKIT_AVAILABLE:
+        raise RuntimeError(f"cannot launch Chromium ({launch_error}) and imgkit is not installed")
+    if not _IMGKIT_FALLBACK_REPORTED.is_set():
+        _IMGKIT_FALLBACK_REPORTED.set()
+        print(f"Cannot launch Chromium ({launch_error}), rendering with imgkit instead")
+    yield _imgkit_renderer(options)
+
+def _iter_html_files(html_dir):
+    """Yield the os.DirEntry of every HTML file in a directory, in directory order."""
+    try:
+        entries = os.scandir(html_dir)
+    except OSError:  # Missing directory: no HTML files, as with Path.glob()
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith('.html') and entry.is_file():
+                yield entry
+
+def _convert_worker(pending, done, output_dir, cache, renderer_args):
+    """
+    Convert files taken from the pending queue until it is empty.
+    
+    Puts one _convert_one() result per file taken on the done queue, also
+    when the renderer cannot be started.
+    
+    Args:
+        pending (queue.Queue): os.DirEntry of the HTML files left to convert
+        done (queue.Queue): Results of the converted files
+        output_dir (str): Directory to save the PNG files
+        cache (dict): Digests the existing PNGs were rendered from, by file name
+        renderer_args (tuple): Arguments for _open_renderer()
+    """
+    def convert_pending(render):
+        while True:
+            try:
+                entry = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                html_mtime = entry.stat().st_mtime
+            except OSError:
+                html_mtime = None  # Reported by _convert_one()
+            done.put(_convert_one(Path(entry.path), output_dir, render,
+                                  cache.get(entry.name), html_mtime))
+    
+    try:
+        with _open_renderer(*renderer_args) as render:
+            convert_pending(render)
+    except Exception as e:
+        message = str(e)
+        
+        def fail(html_file, png_file, has_script):
+            raise RuntimeError(f"renderer unavailable: {message}")
+        
+        convert_pending(fail)
+
+def _convert_one(html_file, output_dir, render, cached_digest=None, html_mtime=None):
+    """
+    Convert one HTML file to PNG unless its PNG is already up to date.
+    
+    The PNG is up to date when it exists and the HTML content still has the
+    digest it was rendered from. Files without a cached digest (e.g. on the
+    first run with the cache) fall back to comparing modification times.
+    
+    Args:
+        html_file (Path): HTML file to convert
+        output_dir (str): Directory to save the PNG file
+        render (callable): Renders an HTML file (Path) to a PNG file (str), see _open_renderer()
+        cached_digest (str, optional): Digest the existing PNG was rendered from
+        html_mtime (float, optional): Modification time of the HTML file, if already known
+    
+    Returns:
+        tuple: (file name, whether the PNG is there, message to report,
+        digest of the HTML content)
+    """
+    digest = None
+    try:
+        # Create output filename
+        png_file = os.path.join(output_dir, f"{html_file.stem}.png")
+        digest, has_script = _scan_html(html_file)
+        
+        # Skip if the PNG already exists and was rendered from this content
+        if os.path.exists(png_file):
+            if cached_digest is None:
+                if html_mtime is None:
+                    html_mtime = os.path.getmtime(html_file)
+                up_to_date = html_mtime <= os.path.getmtime(png_file)
+            else:
+                up_to_date = cached_digest == digest
+            if up_to_date:
+                return html_file.name, True, "Skipping (up to date)", digest
+        
+        # Convert HTML to PNG
+        render(html_file, png_file, has_script)
+        
+        # Verify the output file was created
+        if os.path.exists(png_file) and os.path.getsize(png_file) > 0:
+            return html_file.name, True, f"Converted -> {os.path.basename(png_file)}", digest
+        return html_file.name, False, f"Error: Failed to create {png_file}", digest
+    
+    except Exception as e:
+        return html_file.name, False, f"Error converting: {str(e)}", digest
+
+def convert_html_to_png(html_dir, output_dir=None, width=900, height=1600, delay=1, workers=None):
     """
     Convert all HTML files in the specified directory to PNG images.
     
+    The files are shared out to a pool of worker threads. Each worker
+    renders with its own headless Chromium when Playwright is installed and
+    Chromium can be launched; otherwise every file is rendered by its own
+    wkhtmltoimage process, which the worker waits on.
+    
     Args:
         html_dir (str): Path to directory containing HTML files
         output_dir (str, optional): Directory to save PNG files. Defaults to 'png' subdirectory.
         width (int): Viewport width in pixels
         height (int): Viewport height in pixels
         delay (int): Seconds to wait for JavaScript to execute
+        workers (int, optional): Number of files converted at once. Defaults to the CPU count.
     """
     # Set default output directory if not specified
     if output_dir is None:
@@ -33,8 +254,9 @@ def convert_html_to_png(html_dir, output_dir=None, width=900, height=1600, delay
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
-    # Find all HTML files in the directory
-    html_files = sorted(list(Path(html_dir).glob('*.html')))
+    # Find all HTML files in the directory; the workers finish them out of
+    # order anyway, so they are not sorted
+    html_files = list(_iter_html_files(html_dir))
     
     if not html_files:
         print(f"No HTML files found in {html_dir}")
@@ -43,7 +265,7 @@ def convert_html_to_png(html_dir, output_dir=None, width=900, height=1600, delay
     total_files = len(html_files)
     print(f"Found {total_files} HTML files to convert...")
     
-    # Configure imgkit options
+    # Configure imgkit options (when Playwright or its Chromium is not available)
     options = {
         'format': 'png',
         'encoding': 'UTF-8',
@@ -59,39 +281,32 @@ def convert_html_to_png(html_dir, output_dir=None, width=900, height=1600, delay
     
     successful = 0
     failed = 0
+    cache = _load_cache(output_dir)
     
-    # Convert each HTML file to PNG
-    for i, html_file in enumerate(html_files, 1):
-        try:
-            # Create output filename
-            png_file = os.path.join(output_dir, f"{html_file.stem}.png")
-            
-            # Skip if PNG already exists and is newer than HTML
-            if os.path.exists(png_file) and \
-               os.path.getmtime(html_file) <= os.path.getmtime(png_file):
-                print(f"[{i}/{total_files}] Skipping (up to date): {html_file.name}")
-                successful += 1
-                continue
-                
-            print(f"[{i}/{total_files}] Converting: {html_file.name} -> {os.path.basename(png_file)}")
-            
-            # Convert HTML to PNG
-            imgkit.from_file(
-                str(html_file),
-                output_path=png_file,
-                options=options
-            )
-            
-            # Verify the output file was created
-            if os.path.exists(png_file) and os.path.getsize(png_file) > 0:
+    pending = queue.Queue()
+    for entry in html_files:
+        pending.put(entry)
+    done = queue.Queue()
+    workers = min(workers or os.cpu_count() or 1, total_files)
+    renderer_args = (options, width, height, delay)
+    # The workers read the digests while results are recorded in cache
+    cached_digests = dict(cache)
+    
+    # Convert the HTML files in parallel, reporting them as they finish
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in range(workers):
+            executor.submit(_convert_worker, pending, done, output_dir, cached_digests, renderer_args)
+        for i in range(1, total_files + 1):
+            name, ok, message, digest = done.get()
+            print(f"[{i}/{total_files}] {name}: {message}")
+            if ok:
                 successful += 1
+                cache[name] = digest
             else:
-                print(f"  Error: Failed to create {png_file}")
                 failed += 1
-                
-        except Exception as e:
-            print(f"  Error converting {html_file.name}: {str(e)}")
-            failed += 1
+                cache.pop(name, None)
+    
+    _save_cache(output_dir, cache)
     
     # Print summary
     print("\nConversion complete!")
@@ -109,6 +324,7 @@ if __name__ == "__main__":
     parser.add_argument('--delay', type=int, default=2, help='Seconds to wait for JavaScript (default: 2)')
     parser.add_argument('--month', type=int, help='Month to process (1-12)')
     parser.add_argument('--year', type=int, help='Year to process (e.g., 2025)')
+    parser.add_argument('--workers', type=int, help='Number of files converted at once (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -128,7 +344,8 @@ if __name__ == "__main__":
             output_dir=output_dir,
             width=args.width,
             height=args.height,
-            delay=args.delay
+            delay=args.delay,
+            workers=args.workers
         )
     else:
         # Use the provided or default directories
@@ -137,5 +354,6 @@ if __name__ == "__main__":
             output_dir=args.output_dir,
             width=args.width,
             height=args.height,
-            delay=args.delay
+            delay=args.delay,
+            workers=args.workers
         )
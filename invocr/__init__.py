@@ -19,11 +19,13 @@ from .core.converter import (
 from .core.extractor import DataExtractor, create_extractor
 from .core.ocr import OCREngine, create_ocr_engine
 
-# Import adapters for modularized packages
-from .adapters.utils_adapter import *
-from .adapters.validation_adapter import *
-from .adapters.extraction_adapter import *
-from .adapters.detection_adapter import *
+# Adapters for modularized packages; their names are imported on first access
+from .adapters import (
+    detection_adapter,
+    extraction_adapter,
+    utils_adapter,
+    validation_adapter,
+)
 
 # Import format handlers
 from .formats.html_handler import HTMLHandler
@@ -43,6 +45,20 @@ PACKAGE_INFO = {
     "license": "MIT",
 }
 
+# Searched in this order, as the last star import used to win
+_ADAPTERS = (detection_adapter, extraction_adapter, validation_adapter, utils_adapter)
+
+
+def __getattr__(name):
+    """Load names re-exported by the adapters on first access."""
+    for adapter in _ADAPTERS:
+        if name in adapter.__all__:
+            value = getattr(adapter, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Main exports
 __all__ = [
     # Core functionality
@@ -8,22 +8,12 @@ This module serves as the entry point for the invocr CLI, allowing commands like
 import sys
 import click
 from invocr.utils.logger import get_logger
-from invocr.cli.commands import (
-    convert_command,
-    extract_command,
-    batch_command,
-    validate_command,
-    config_command,
-    debug_command,
-    ocr_text_command,
-    workflow_command,
-    pdf2json_command
-)
+from invocr.cli.commands import COMMANDS, LazyGroup
 
 # Initialize logger
 logger = get_logger(__name__)
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.version_option(message="InvOCR Version %(version)s")
 def cli():
     """
@@ -33,17 +23,6 @@ def cli():
     """
     pass
 
-# Register commands
-cli.add_command(convert_command)
-cli.add_command(extract_command)
-cli.add_command(batch_command)
-cli.add_command(validate_command)
-cli.add_command(config_command)
-cli.add_command(debug_command)
-cli.add_command(ocr_text_command)
-cli.add_command(workflow_command)
-cli.add_command(pdf2json_command)
-
 def main():
     """Main entry point for CLI."""
     try:
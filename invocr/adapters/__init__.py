@@ -4,3 +4,36 @@ Adapter module for compatibility with modularized packages.
 This module provides backward compatibility by re-exporting functionality
 from the new modularized packages (invutil, valider, dextra, dotect).
 """
+
+import importlib
+
+
+def lazy_reexport(module_globals, exports, package):
+    """
+    Build a module __getattr__ (PEP 562) importing re-exported names on first access.
+
+    Args:
+        module_globals: globals() of the adapter module
+        exports: Re-exported name -> module defining it
+        package: Package whose other public names the adapter also re-exports
+    """
+
+    def __getattr__(name):
+        if name in exports:
+            module = exports[name]
+        elif not name.startswith("_"):
+            module = package
+        else:
+            raise AttributeError(
+                f"module {module_globals['__name__']!r} has no attribute {name!r}"
+            )
+        try:
+            value = getattr(importlib.import_module(module), name)
+        except AttributeError:
+            raise AttributeError(
+                f"module {module_globals['__name__']!r} has no attribute {name!r}"
+            ) from None
+        module_globals[name] = value
+        return value
+
+    return __getattr__
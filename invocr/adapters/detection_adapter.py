@@ -5,29 +5,24 @@ This module re-exports functionality from the dotect package
 to maintain backward compatibility with existing code.
 """
 
-# Re-export detection functionality from dotect
-from dotect.base import (
-    Detector,
-    DocumentDetector,
-    DetectionResult,
-    DocumentType
-)
+from invocr.adapters import lazy_reexport
 
-from dotect.rule_detector import (
-    RuleBasedDetector,
-    PatternMatcher,
-    KeywordDetector
-)
+# Re-exported name -> dotect module defining it; other public names of
+# dotect itself resolve too, for backward compatibility
+_EXPORTS = {
+    "Detector": "dotect.base",
+    "DocumentDetector": "dotect.base",
+    "DetectionResult": "dotect.base",
+    "DocumentType": "dotect.base",
+    "RuleBasedDetector": "dotect.rule_detector",
+    "PatternMatcher": "dotect.rule_detector",
+    "KeywordDetector": "dotect.rule_detector",
+    "MLDocumentClassifier": "dotect.ml_classifier",
+    "TransformerClassifier": "dotect.ml_classifier",
+    "DetectorFactory": "dotect.detector_factory",
+    "UnifiedDetectorFactory": "dotect.detector_factory",
+}
 
-from dotect.ml_classifier import (
-    MLDocumentClassifier,
-    TransformerClassifier
-)
+__all__ = list(_EXPORTS)
 
-from dotect.detector_factory import (
-    DetectorFactory,
-    UnifiedDetectorFactory
-)
-
-# For backward compatibility
-from dotect import *
+__getattr__ = lazy_reexport(globals(), _EXPORTS, "dotect")
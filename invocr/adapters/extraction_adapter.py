@@ -5,32 +5,31 @@ This module re-exports functionality from the dextra package
 to maintain backward compatibility with existing code.
 """
 
-# Re-export extraction functionality from dextra
-from dextra.base import (
-    Extractor,
-    FieldExtractor,
-    DocumentExtractor,
-    ExtractorFactory,
-    ExtractionResult,
-    DocumentType
-)
+from invocr.adapters import lazy_reexport
 
-from dextra.regex_extractor import (
-    RegexFieldExtractor,
-    RegexInvoiceExtractor,
-    RegexReceiptExtractor,
-    RegexExtractorFactory
-)
+# Re-exported name -> dextra module defining it; other public names of
+# dextra itself resolve too, for backward compatibility
+_EXPORTS = {
+    "Extractor": "dextra.base",
+    "FieldExtractor": "dextra.base",
+    "DocumentExtractor": "dextra.base",
+    "ExtractorFactory": "dextra.base",
+    "ExtractionResult": "dextra.base",
+    "DocumentType": "dextra.base",
+    "RegexFieldExtractor": "dextra.regex_extractor",
+    "RegexInvoiceExtractor": "dextra.regex_extractor",
+    "RegexReceiptExtractor": "dextra.regex_extractor",
+    "RegexExtractorFactory": "dextra.regex_extractor",
+    "MLFieldExtractor": "dextra.ml_extractor",
+    "MLInvoiceExtractor": "dextra.ml_extractor",
+    "MLReceiptExtractor": "dextra.ml_extractor",
+    "MLExtractorFactory": "dextra.ml_extractor",
+    "UnifiedExtractorFactory": "dextra.extractor_factory",
+    "ExtractionWorkflow": "dextra.integration",
+    "process_document": "dextra.integration",
+    "batch_process": "dextra.integration",
+}
 
-from dextra.ml_extractor import (
-    MLFieldExtractor,
-    MLInvoiceExtractor,
-    MLReceiptExtractor,
-    MLExtractorFactory
-)
+__all__ = list(_EXPORTS)
 
-from dextra.extractor_factory import UnifiedExtractorFactory
-from dextra.integration import ExtractionWorkflow, process_document, batch_process
-
-# For backward compatibility
-from dextra import *
+__getattr__ = lazy_reexport(globals(), _EXPORTS, "dextra")
@@ -5,29 +5,35 @@ This module re-exports functionality from the invutil package
 to maintain backward compatibility with existing code.
 """
 
-# Re-export core utilities from invutil
-from invutil.config import Settings, get_settings, load_config_from_file, create_default_config, validate_config
-from invutil.logger import InvOCRLogger, setup_logging, get_logger
-from invutil.helpers import (
-    get_file_extension, 
-    is_valid_file, 
-    ensure_directory_exists, 
-    get_output_path,
-    read_json_file,
-    write_json_file
-)
-from invutil.date_utils import (
-    parse_date, 
-    format_date, 
-    is_valid_date_format,
-    normalize_date
-)
-from invutil.numeric_utils import (
-    extract_numeric_value,
-    normalize_amount,
-    format_currency,
-    validate_amount_range
-)
+from invocr.adapters import lazy_reexport
 
-# For backward compatibility
-from invutil import *
+# Re-exported name -> invutil module defining it; other public names of
+# invutil itself resolve too, for backward compatibility
+_EXPORTS = {
+    "Settings": "invutil.config",
+    "get_settings": "invutil.config",
+    "load_config_from_file": "invutil.config",
+    "create_default_config": "invutil.config",
+    "validate_config": "invutil.config",
+    "InvOCRLogger": "invutil.logger",
+    "setup_logging": "invutil.logger",
+    "get_logger": "invutil.logger",
+    "get_file_extension": "invutil.helpers",
+    "is_valid_file": "invutil.helpers",
+    "ensure_directory_exists": "invutil.helpers",
+    "get_output_path": "invutil.helpers",
+    "read_json_file": "invutil.helpers",
+    "write_json_file": "invutil.helpers",
+    "parse_date": "invutil.date_utils",
+    "format_date": "invutil.date_utils",
+    "is_valid_date_format": "invutil.date_utils",
+    "normalize_date": "invutil.date_utils",
+    "extract_numeric_value": "invutil.numeric_utils",
+    "normalize_amount": "invutil.numeric_utils",
+    "format_currency": "invutil.numeric_utils",
+    "validate_amount_range": "invutil.numeric_utils",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = lazy_reexport(globals(), _EXPORTS, "invutil")
@@ -5,30 +5,28 @@ This module re-exports functionality from the valider package
 to maintain backward compatibility with existing code.
 """
 
-# Re-export validation functionality from valider
-from valider.base import (
-    Validator,
-    FieldValidator, 
-    DocumentValidator,
-    ValidationResult,
-    ValidationError
-)
+from invocr.adapters import lazy_reexport
 
-from valider.field_validators import (
-    AmountValidator,
-    DateValidator,
-    TextValidator,
-    TaxIDValidator,
-    PercentageValidator,
-    EmailValidator,
-    PhoneValidator
-)
+# Re-exported name -> valider module defining it; other public names of
+# valider itself resolve too, for backward compatibility
+_EXPORTS = {
+    "Validator": "valider.base",
+    "FieldValidator": "valider.base",
+    "DocumentValidator": "valider.base",
+    "ValidationResult": "valider.base",
+    "ValidationError": "valider.base",
+    "AmountValidator": "valider.field_validators",
+    "DateValidator": "valider.field_validators",
+    "TextValidator": "valider.field_validators",
+    "TaxIDValidator": "valider.field_validators",
+    "PercentageValidator": "valider.field_validators",
+    "EmailValidator": "valider.field_validators",
+    "PhoneValidator": "valider.field_validators",
+    "InvoiceValidator": "valider.document_validators",
+    "ReceiptValidator": "valider.document_validators",
+    "BankStatementValidator": "valider.document_validators",
+}
 
-from valider.document_validators import (
-    InvoiceValidator,
-    ReceiptValidator,
-    BankStatementValidator
-)
+__all__ = list(_EXPORTS)
 
-# For backward compatibility
-from valider import *
+__getattr__ = lazy_reexport(globals(), _EXPORTS, "valider")
@@ -4,17 +4,7 @@ This package provides the CLI commands for extracting data from invoices,
 receiving various file formats and configuration options.
 """
 
-from .commands import (
-    convert_command,
-    extract_command,
-    batch_command,
-    validate_command,
-    config_command,
-    debug_command,
-    ocr_text_command,
-    workflow_command,
-    pdf2json_command
-)
+from . import commands
 
 __all__ = [
     "convert_command",
@@ -26,4 +16,11 @@ __all__ = [
     "ocr_text_command",
     "workflow_command",
     "pdf2json_command"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Load commands from invocr.cli.commands on first access."""
+    if name in __all__:
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
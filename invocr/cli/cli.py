@@ -9,15 +9,14 @@ import sys
 from typing import Optional
 
 from invocr.utils.logger import get_logger
-from .commands import (
-    convert_command, extract_command, batch_command, validate_command, config_command,
-    debug_command, ocr_text_command, workflow_command
-)
+from .commands import LazyGroup
 
 logger = get_logger(__name__)
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=[
+    "convert", "extract", "batch", "validate", "config", "debug", "ocr-text", "workflow"
+])
 @click.version_option(message="InvOCR Version %(version)s")
 def cli():
     """
@@ -28,17 +27,6 @@ def cli():
     pass
 
 
-# Register commands
-cli.add_command(convert_command)
-cli.add_command(extract_command)
-cli.add_command(batch_command)
-cli.add_command(validate_command)
-cli.add_command(config_command)
-cli.add_command(debug_command)
-cli.add_command(ocr_text_command)
-cli.add_command(workflow_command)
-
-
 def main():
     """
     Main entry point for CLI.
@@ -2,26 +2,56 @@
 CLI command modules for InvOCR.
 
 This package contains command modules that implement the InvOCR CLI functionality.
+Command modules are imported on first use, so running one command does not
+load the OCR and extraction code of all the others.
 """
 
-from .convert_command import convert_command
-from .extract_command import extract_command
-from .batch_command import batch_command
-from .validate_command import validate_command
-from .config_command import config_command
-from .debug_command import debug_command
-from .ocr_text_command import ocr_text_command
-from .workflow_command import workflow_command
-from .pdf2json_command import pdf2json_command
-
-__all__ = [
-    "convert_command",
-    "extract_command",
-    "batch_command",
-    "validate_command",
-    "config_command",
-    "debug_command",
-    "ocr_text_command",
-    "workflow_command",
-    "pdf2json_command"
-]
+import importlib
+
+import click
+
+# CLI command name -> command object, defined in the module of the same name
+COMMANDS = {
+    "convert": "convert_command",
+    "extract": "extract_command",
+    "batch": "batch_command",
+    "validate": "validate_command",
+    "config": "config_command",
+    "debug": "debug_command",
+    "ocr-text": "ocr_text_command",
+    "workflow": "workflow_command",
+    "pdf2json": "pdf2json_command",
+}
+
+__all__ = list(COMMANDS.values()) + ["COMMANDS", "LazyGroup"]
+
+
+def __getattr__(name):
+    """Import a command module when its command is first accessed."""
+    if name in COMMANDS.values():
+        command = getattr(importlib.import_module(f".{name}", __name__), name)
+        # Importing the submodule bound its name here to the module
+        globals()[name] = command
+        return command
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LazyGroup(click.Group):
+    """
+    Click group loading its commands from this package only when they are used.
+
+    Args:
+        lazy_commands: CLI names of the commands in COMMANDS to offer
+    """
+
+    def __init__(self, *args, lazy_commands=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = list(lazy_commands)
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            self.add_command(__getattr__(COMMANDS[cmd_name]), cmd_name)
+        return super().get_command(ctx, cmd_name)
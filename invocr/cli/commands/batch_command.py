@@ -6,14 +6,17 @@ Handles the 'batch' command for processing multiple files.
 
 import os
 import sys
-import json
 import click
 import concurrent.futures
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime
 
+from invocr.utils.helpers import write_json
 from invocr.utils.logger import get_logger
 from invocr.core.converter import convert_document
+from invocr.core.workflow.extraction_pipeline import process_file
+from invocr.utils.ocr import extract_text
 from ..common import load_yaml_config, find_files, ensure_output_dir, get_matching_output_path, process_month_year_dir
 
 logger = get_logger(__name__)
@@ -31,11 +34,14 @@ logger = get_logger(__name__)
               help='Input file extensions to process (e.g., pdf,jpg,png)')
 @click.option('-r', '--recursive', is_flag=True, help='Process directories recursively')
 @click.option('-p', '--parallel', is_flag=True, help='Process files in parallel')
-@click.option('-w', '--workers', type=int, default=4, help='Number of parallel workers')
+@click.option('-w', '--workers', type=int,
+              help='Number of parallel workers (default: CPU count; each runs single-threaded OCR)')
 @click.option('-m', '--month', type=int, help='Process files for specific month')
 @click.option('-y', '--year', type=int, help='Process files for specific year')
+@click.option('--compact-json/--pretty-json', default=True,
+              help='Write JSON output without indentation (default: compact)')
 def batch_command(input_dir, output_dir, output_format, languages, config_file, 
-                 extensions, recursive, parallel, workers, month, year):
+                 extensions, recursive, parallel, workers, month, year, compact_json):
     """Process multiple files in batch mode"""
     try:
         # Load configuration if provided
@@ -53,7 +59,7 @@ def batch_command(input_dir, output_dir, output_format, languages, config_file,
             if not parallel and 'processing' in config and 'parallel' in config['processing']:
                 parallel = config['processing']['parallel']
                 
-            if workers == 4 and 'processing' in config and 'max_workers' in config['processing']:
+            if workers is None and 'processing' in config and 'max_workers' in config['processing']:
                 workers = config['processing']['max_workers']
         
         # Handle month/year specific processing
@@ -86,34 +92,36 @@ def batch_command(input_dir, output_dir, output_format, languages, config_file,
         # Set proper output extension
         output_ext = f".{output_format}"
         
+        # Resolve all input/output paths up front
+        input_paths = [str(file_path) for file_path in files]
+        output_paths = [get_matching_output_path(input_path, output_dir, output_ext)
+                        for input_path in input_paths]
+        
         # Process files
         if parallel and len(files) > 1:
+            workers = workers or os.cpu_count() or 1
             logger.info(f"Processing in parallel with {workers} workers")
-            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
-                futures = []
-                for file_path in files:
-                    output_path = get_matching_output_path(str(file_path), output_dir, output_ext)
-                    futures.append(
-                        executor.submit(
-                            _process_single_file,
-                            str(file_path),
-                            output_path,
-                            output_format,
-                            lang_list
-                        )
-                    )
-                    
-                # Process results as they complete
-                for i, future in enumerate(concurrent.futures.as_completed(futures), 1):
-                    # Each future.result() returns (success, file_path, error)
-                    success, file_path, error = future.result()
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                        initializer=_init_worker) as executor:
+                # Send files to the workers in chunks, about four per worker,
+                # to save pickling round trips; results come back in order
+                chunksize = max(1, len(files) // (workers * 4))
+                results = executor.map(
+                    _process_single_file,
+                    input_paths,
+                    output_paths,
+                    repeat(output_format),
+                    repeat(lang_list),
+                    repeat(compact_json),
+                    chunksize=chunksize
+                )
+                for i, (success, file_path, error) in enumerate(results, 1):
                     _log_progress(i, len(files), file_path, success, error)
         else:
             # Process sequentially
-            for i, file_path in enumerate(files, 1):
-                output_path = get_matching_output_path(str(file_path), output_dir, output_ext)
-                success, file_path, error = _process_single_file(str(file_path), output_path, output_format, lang_list)
-                _log_progress(i, len(files), str(file_path), success, error)
+            for i, (input_path, output_path) in enumerate(zip(input_paths, output_paths), 1):
+                success, file_path, error = _process_single_file(input_path, output_path, output_format, lang_list, compact_json)
+                _log_progress(i, len(files), file_path, success, error)
                 
         logger.info(f"Batch processing complete. Output saved to {output_dir}")
         
@@ -124,17 +132,18 @@ def batch_command(input_dir, output_dir, output_format, languages, config_file,
         sys.exit(1)
 
 
-def _process_single_file(input_path, output_path, output_format, languages):
+def _init_worker():
+    """Limit Tesseract to one OpenMP thread, as the pool already has a worker per core"""
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+
+def _process_single_file(input_path, output_path, output_format, languages, compact_json=False):
     """Process a single file and return result
     
     Returns:
         Tuple[bool, str, Optional[str]]: (success, file_path, error_message)
     """
     try:
-        # Use the new extraction pipeline for processing
-        from invocr.core.workflow.extraction_pipeline import process_file
-        from invocr.utils.ocr import extract_text
-        
         # Prepare metadata
         metadata = {
             "filename": os.path.basename(input_path),
@@ -156,8 +165,7 @@ def _process_single_file(input_path, output_path, output_format, languages):
         
         # Write output to file based on format
         if output_format == 'json':
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(invoice_data, f, indent=2, default=str)
+            write_json(output_path, invoice_data, compact=compact_json)
         else:
             # For other formats, fall back to convert_document
             success, error = convert_document(
@@ -11,6 +11,7 @@ import click
 import logging
 from pathlib import Path
 
+from invocr.utils.helpers import write_json
 from invocr.utils.logger import get_logger
 from invocr.utils.ocr import extract_text
 from invocr.core.detection.document_detector import DocumentDetector
@@ -26,7 +27,11 @@ logger = get_logger(__name__)
 @click.argument('output_file', type=click.Path(), required=False)
 @click.option('-l', '--languages', help='OCR languages (e.g., en,pl,de)')
 @click.option('-v', '--verbose', is_flag=True, help='Enable verbose logging')
-def debug_command(input_file, output_file, languages, verbose):
+@click.option('--force/--no-force', default=False,
+              help='Rerun even if OUTPUT_FILE is newer than INPUT_FILE')
+@click.option('--compact-json/--pretty-json', default=False,
+              help='Write OUTPUT_FILE without indentation (default: pretty)')
+def debug_command(input_file, output_file, languages, verbose, force, compact_json):
     """
     Run detailed debugging of extraction process for a document.
     
@@ -45,6 +50,12 @@ def debug_command(input_file, output_file, languages, verbose):
     
     debug_logger = get_logger("debug")
     
+    # Skip the whole pipeline if the saved results are newer than the input
+    if (output_file and not force and os.path.exists(output_file)
+            and os.path.getmtime(output_file) >= os.path.getmtime(input_file)):
+        debug_logger.info(f"{output_file} is up to date with {input_file}, skipping (use --force to rerun)")
+        return
+    
     # Print header
     debug_logger.info("*" * 100)
     debug_logger.info(f"SIMPLE DEBUG: Processing {input_file}")
@@ -164,6 +175,9 @@ def debug_command(input_file, output_file, languages, verbose):
         # Step 10: Validation
         log_step(step, "Validation", "Attempting to validate extracted data")
         validation_results = validate_extraction(invoice_data, ocr_text)
+        # Only the sample is kept from here on; drop the full OCR text (and the
+        # extractor, which may hold it) before the results are serialized
+        del ocr_text, extractor
         
         validation_summary = {
             "is_valid": validation_results.get("is_valid", False),
@@ -191,8 +205,7 @@ def debug_command(input_file, output_file, languages, verbose):
             }
             
             # Save to file
-            with open(output_file, 'w') as f:
-                json.dump(debug_results, f, indent=2, default=str)
+            write_json(output_file, debug_results, compact=compact_json)
             
             debug_logger.info(f"\nResults saved to {output_file}")
         
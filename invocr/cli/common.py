@@ -4,10 +4,12 @@ Common utilities for CLI commands.
 This module provides shared functionality used by multiple CLI commands.
 """
 
+import copy
 import os
 import sys
 import click
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
@@ -17,10 +19,18 @@ from invocr.config import load_config, validate_config, create_default_config
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _load_yaml_config_cached(config_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """Load a config file once per modification time (part of the cache key)."""
+    return load_config(config_file)
+
+
 def load_yaml_config(config_file: str) -> Dict[str, Any]:
     """
     Load YAML configuration file.
     
+    The parsed file is cached until it is modified; callers get their own copy.
+    
     Args:
         config_file: Path to config file
         
@@ -28,7 +38,8 @@ def load_yaml_config(config_file: str) -> Dict[str, Any]:
         Loaded configuration
     """
     try:
-        return load_config(config_file)
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        return copy.deepcopy(_load_yaml_config_cached(str(config_file), mtime_ns))
     except Exception as e:
         logger.error(f"Error loading config: {e}")
         sys.exit(1)
@@ -8,7 +8,7 @@ from .converter import (
     create_batch_converter,
     create_converter,
 )
-from .extractor import DataExtractor, create_extractor
+from .extractor import DataExtractor, create_extractor, extract_batch
 from .ocr import OCREngine, create_ocr_engine
 from .pdf_processor import PDFProcessor
 
@@ -19,6 +19,7 @@ __all__ = [
     "create_batch_converter",
     "DataExtractor",
     "create_extractor",
+    "extract_batch",
     "OCREngine",
     "create_ocr_engine",
     "PDFProcessor",
@@ -3,14 +3,147 @@ Data extraction from invoice text
 Simplified version focusing on invoice data extraction
 """
 
+import functools
+import itertools
+import os
+import pickle
 import re
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Markers that identify a Polish document; any single hit is enough
+_POLISH_MARKERS_RX = re.compile(
+    r"softreck|faktura|nip|sprzedawca|klient|polska|vat:|reverse charge|pln",
+    re.IGNORECASE,
+)
+
+# Day-first (DD-MM-YYYY, DD-MM-YY) or ISO-ordered (YYYY-MM-DD) numeric dates,
+# with '-', '.' or '/' separators
+_NUMERIC_DATE_RX = re.compile(
+    r"(?P<d1>\d{1,2})[-./](?P<m1>\d{1,2})[-./](?P<y1>\d{4}|\d{2})"
+    r"|(?P<y2>\d{4})[-./](?P<m2>\d{1,2})[-./](?P<d2>\d{1,2})"
+)
+
+# (multiplier, value) per IBAN character for the mod-97 fold in
+# DataExtractor._validate_iban: digits shift the remainder by one decimal
+# place, letters (A=10 ... Z=35) by two
+_IBAN_DIGITS = {
+    **{str(digit): (10, digit) for digit in range(10)},
+    **{chr(code): (100, code - 55) for code in range(ord("A"), ord("Z") + 1)},
+}
+
+# Registered IBAN length per country code (ISO 13616), used by
+# DataExtractor._trim_iban to cut a loosely captured IBAN to its own characters
+_IBAN_LENGTHS = {
+    "AD": 24, "AE": 23, "AL": 28, "AT": 20, "AZ": 28, "BA": 20, "BE": 16, "BG": 22,
+    "BH": 22, "BR": 29, "BY": 28, "CH": 21, "CR": 22, "CY": 28, "CZ": 24, "DE": 22,
+    "DK": 18, "DO": 28, "EE": 20, "EG": 29, "ES": 24, "FI": 18, "FO": 18, "FR": 27,
+    "GB": 22, "GE": 22, "GI": 23, "GL": 18, "GR": 27, "GT": 28, "HR": 21, "HU": 28,
+    "IE": 22, "IL": 23, "IQ": 23, "IS": 26, "IT": 27, "JO": 30, "KW": 30, "KZ": 20,
+    "LB": 28, "LC": 32, "LI": 21, "LT": 20, "LU": 20, "LV": 21, "MC": 27, "MD": 24,
+    "ME": 22, "MK": 19, "MR": 27, "MT": 31, "MU": 30, "NL": 18, "NO": 15, "PK": 24,
+    "PL": 28, "PS": 29, "PT": 25, "QA": 29, "RO": 24, "RS": 22, "SA": 24, "SC": 31,
+    "SE": 24, "SI": 19, "SK": 24, "SM": 27, "ST": 25, "SV": 28, "TL": 23, "TN": 24,
+    "TR": 26, "UA": 29, "VA": 22, "VG": 24, "XK": 20,
+}
+
+# Base structures returned (as copies) by DataExtractor._get_document_template.
+# Nesting is at most one level of dicts/lists, which is all the copy handles.
+_DOCUMENT_TEMPLATES = {
+    "invoice": {
+        "document_type": "invoice",
+        "document_number": "",
+        "issue_date": "",
+        "due_date": "",
+        "seller": {
+            "name": "",
+            "address": "",
+            "tax_id": "",
+            "email": "",
+            "phone": "",
+        },
+        "buyer": {"name": "", "address": "", "tax_id": ""},
+        "items": [],
+        "totals": {
+            "subtotal": 0.0,
+            "tax_amount": 0.0,
+            "total": 0.0,
+            "currency": "",
+        },
+        "payment_terms": "",
+        "payment_method": "",
+        "bank_account": "",
+        "notes": "",
+    },
+    "receipt": {
+        "document_type": "receipt",
+        "document_number": "",
+        "date": "",
+        "seller": {"name": "", "tax_id": ""},
+        "items": [],
+        "totals": {
+            "subtotal": 0.0,
+            "tax_amount": 0.0,
+            "total": 0.0,
+            "currency": "",
+            "payment_method": "",
+        },
+    },
+    "payment": {
+        "document_type": "payment",
+        "document_number": "",
+        "date": "",
+        "amount": 0.0,
+        "currency": "",
+        "payer": {"name": "", "account": ""},
+        "recipient": {"name": "", "account": ""},
+        "reference": "",
+        "payment_method": "",
+        "notes": "",
+    },
+}
+
+# (weight, check) pairs summed by DataExtractor._calculate_confidence
+_CONFIDENCE_RULES = (
+    # Basic document info
+    (2, lambda d: d.get("document_number")),
+    (1, lambda d: d.get("issue_date")),
+    # Seller information
+    (1, lambda d: d.get("seller", {}).get("name")),
+    (1, lambda d: d.get("seller", {}).get("tax_id") or d.get("seller", {}).get("address")),
+    # Buyer information
+    (1, lambda d: d.get("buyer", {}).get("name")),
+    (1, lambda d: d.get("buyer", {}).get("tax_id") or d.get("buyer", {}).get("address")),
+    # Items and totals
+    (2, lambda d: d.get("items")),
+    (2, lambda d: d.get("totals", {}).get("total", 0) > 0),
+    # Payment information
+    (2, lambda d: d.get("payment_method") or d.get("bank_account")),
+)
+_CONFIDENCE_MAX_SCORE = 10
+
+# Content patterns of the specialized document formats picked by
+# create_extractor(), each behind a lowercase literal the pattern cannot
+# match without. Most documents lack the literals, so the patterns (some
+# with backtracking .* runs) are skipped after a substring check. The
+# literals avoid i, s and k, which IGNORECASE also matches on a few
+# non-ASCII letters that str.lower() leaves alone
+_FORMAT_SIGNATURES = {
+    "adobe": (
+        ("adobe", re.compile(r'Adobe Systems Software Ireland', re.IGNORECASE)),
+        ("adobe", re.compile(r'Adobe.*Invoice', re.IGNORECASE)),
+        ("number", re.compile(r'Invoice Number.*?\d+', re.IGNORECASE)),
+        ("product number", re.compile(r'PRODUCT NUMBER.*PRODUCT DESCRIPTION', re.IGNORECASE)),
+        # Handle both TOTAL and TOUAL (typo)
+        ("grand to", re.compile(r'GRAND TO[TU]AL', re.IGNORECASE)),
+    ),
+}
+
 
 class DataExtractor:
     """
@@ -18,6 +151,10 @@ class DataExtractor:
     Supports multiple languages and various invoice formats.
     """
 
+    # Language code of extractors built for a single language; when set,
+    # extract_invoice_data uses it instead of detecting the language
+    DEFAULT_LANGUAGE: Optional[str] = None
+
     def __init__(self, languages: List[str] = None):
         """
         Initialize the DataExtractor with specified languages.
@@ -46,7 +183,7 @@ class DataExtractor:
         data = self._get_document_template(document_type)
 
         # Detect document language
-        detected_lang = self._detect_language(text)
+        detected_lang = self.DEFAULT_LANGUAGE or self._detect_language(text)
 
         # Extract basic information
         data.update(self._extract_basic_info(text, detected_lang))
@@ -71,10 +208,33 @@ class DataExtractor:
         }
 
         # Clean and validate the extracted data
-        data = self._clean_and_validate_data(data)
+        self._validate_and_clean(data)
 
         return data
 
+    def extract_many(
+        self,
+        texts: List[str],
+        document_type: str = "invoice",
+        workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract invoice data from many texts with this extractor's class.
+
+        Works like extract_batch(), but every worker builds an instance of
+        this class (with the same languages) instead of going through
+        create_extractor().
+
+        Args:
+            texts: OCR texts to extract from
+            document_type: Type of document (e.g., "invoice", "receipt")
+            workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            Extracted data for each text, in input order
+        """
+        return _run_batch(type(self), self.languages, texts, document_type, workers, self)
+
     def _get_document_template(self, doc_type: str) -> Dict[str, Any]:
         """
         Get base template for different document types.
@@ -85,62 +245,15 @@ class DataExtractor:
         Returns:
             Dictionary with the document template structure
         """
-        templates = {
-            "invoice": {
-                "document_type": "invoice",
-                "document_number": "",
-                "issue_date": "",
-                "due_date": "",
-                "seller": {
-                    "name": "",
-                    "address": "",
-                    "tax_id": "",
-                    "email": "",
-                    "phone": "",
-                },
-                "buyer": {"name": "", "address": "", "tax_id": ""},
-                "items": [],
-                "totals": {
-                    "subtotal": 0.0,
-                    "tax_amount": 0.0,
-                    "total": 0.0,
-                    "currency": "",
-                },
-                "payment_terms": "",
-                "payment_method": "",
-                "bank_account": "",
-                "notes": "",
-            },
-            "receipt": {
-                "document_type": "receipt",
-                "document_number": "",
-                "date": "",
-                "seller": {"name": "", "tax_id": ""},
-                "items": [],
-                "totals": {
-                    "subtotal": 0.0,
-                    "tax_amount": 0.0,
-                    "total": 0.0,
-                    "currency": "",
-                    "payment_method": "",
-                },
-            },
-            "payment": {
-                "document_type": "payment",
-                "document_number": "",
-                "date": "",
-                "amount": 0.0,
-                "currency": "",
-                "payer": {"name": "", "account": ""},
-                "recipient": {"name": "", "account": ""},
-                "reference": "",
-                "payment_method": "",
-                "notes": "",
-            },
+        template = _DOCUMENT_TEMPLATES.get(doc_type)
+        if template is None:
+            return {"document_type": doc_type}
+        # Copy the nested containers directly; deepcopy is several times slower
+        return {
+            key: value.copy() if type(value) in (dict, list) else value
+            for key, value in template.items()
         }
 
-        return templates.get(doc_type, {"document_type": doc_type})
-
     def _detect_language(self, text: str) -> str:
         """
         Detect the language of the document text.
@@ -151,24 +264,91 @@ class DataExtractor:
         Returns:
             Detected language code (e.g., 'en', 'pl')
         """
-        text_lower = text.lower()
-        logger.info(f"[DataExtractor] Language detection input (first 500 chars): {text_lower[:500]}")
-        if (
-            "softreck" in text_lower or
-            "faktura" in text_lower or
-            "nip" in text_lower or
-            "sprzedawca" in text_lower or
-            "klient" in text_lower or
-            "polska" in text_lower or
-            "vat:" in text_lower or
-            "reverse charge" in text_lower or
-            "pln" in text_lower
-        ):
+        logger.info(
+            f"[DataExtractor] Language detection input (first 500 chars): {text[:500].lower()}"
+        )
+        if _POLISH_MARKERS_RX.search(text):
             logger.info("[DataExtractor] Detected language: pl")
             return "pl"
         logger.info("[DataExtractor] Detected language: en")
         return "en"
 
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_date(date_str: str) -> str:
+        """
+        Parse a numeric date string into YYYY-MM-DD format.
+
+        Accepts DD-MM-YYYY, YYYY-MM-DD and DD-MM-YY with '-', '.' or '/'
+        separators. Two-digit years follow strptime's %y pivot (69-99 -> 19xx).
+        Results are cached, as the same dates recur across an invoice batch.
+
+        Args:
+            date_str: Date string to parse
+
+        Returns:
+            ISO formatted date, or the input unchanged if it is not a valid date
+        """
+        match = _NUMERIC_DATE_RX.fullmatch(date_str)
+        if not match:
+            return date_str
+
+        if match["y1"]:
+            year, month, day = match["y1"], match["m1"], match["d1"]
+        else:
+            year, month, day = match["y2"], match["m2"], match["d2"]
+        year_num = int(year)
+        if len(year) == 2:
+            year_num += 1900 if year_num >= 69 else 2000
+
+        try:
+            return date(year_num, int(month), int(day)).isoformat()
+        except ValueError:
+            return date_str
+
+    @staticmethod
+    def _trim_iban(iban: str) -> str:
+        """
+        Cut an IBAN captured by a loose pattern to its country's registered length.
+
+        Such a capture can run on into the next word (e.g. "BIC"); IBANs of
+        unknown countries are returned unchanged.
+
+        Args:
+            iban: Captured IBAN without whitespace
+
+        Returns:
+            The IBAN, at most as long as registered for its country
+        """
+        length = _IBAN_LENGTHS.get(iban[:2].upper())
+        return iban[:length] if length else iban
+
+    @staticmethod
+    def _validate_iban(iban: str) -> bool:
+        """
+        Check the ISO 7064 mod-97 checksum of an IBAN.
+
+        The remainder is folded in one character at a time, so no digit
+        string or large integer is built.
+
+        Args:
+            iban: IBAN without spaces
+
+        Returns:
+            True if the checksum is valid
+        """
+        iban = iban.upper()
+        if len(iban) < 5:
+            return False
+        remainder = 0
+        for char in iban[4:] + iban[:4]:
+            digit = _IBAN_DIGITS.get(char)
+            if digit is None:
+                return False
+            multiplier, value = digit
+            remainder = (remainder * multiplier + value) % 97
+        return remainder == 1
+
     def _extract_basic_info(self, text: str, language: str) -> Dict[str, str]:
         """Extract basic document information"""
         result = {}
@@ -350,22 +530,27 @@ class DataExtractor:
     def _validate_and_clean(self, data: Dict) -> None:
         """Validate and clean extracted data"""
         # Clean numeric values
-        if "totals" in data:
-            for key, value in data["totals"].items():
+        totals = data.get("totals")
+        if isinstance(totals, dict):
+            for key, value in totals.items():
                 if isinstance(value, str):
                     try:
-                        data["totals"][key] = float(value.replace(",", "."))
+                        totals[key] = float(value.replace(",", "."))
                     except ValueError:
-                        data["totals"][key] = 0.0
-
-        # Clean whitespace in text fields
-        for key, value in data.items():
-            if isinstance(value, str):
-                data[key] = value.strip()
-            elif isinstance(value, dict):
-                for subkey, subvalue in value.items():
-                    if isinstance(subvalue, str):
-                        value[subkey] = subvalue.strip()
+                        totals[key] = 0.0
+
+        # Clean whitespace in text fields at any depth, including item dicts
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            for key, value in node.items():
+                value_type = type(value)
+                if value_type is str:
+                    node[key] = value.strip()
+                elif value_type is dict:
+                    stack.append(value)
+                elif value_type is list:
+                    stack.extend(item for item in value if type(item) is dict)
 
     def _calculate_confidence(self, data: Dict, text: str) -> float:
         """
@@ -378,45 +563,14 @@ class DataExtractor:
         Returns:
             Confidence score between 0.0 and 1.0
         """
+        # The weights add up to more than the maximum, so stop once it is reached
         score = 0
-        max_score = 10  # Total possible score
-
-        # Basic document info
-        if data.get("document_number"):
-            score += 2
-        if data.get("issue_date"):
-            score += 1
-
-        # Seller information
-        seller = data.get("seller", {})
-        if seller.get("name"):
-            score += 1
-        if seller.get("tax_id") or seller.get("address"):
-            score += 1
-
-        # Buyer information
-        buyer = data.get("buyer", {})
-        if buyer.get("name"):
-            score += 1
-        if buyer.get("tax_id") or buyer.get("address"):
-            score += 1
-
-        # Items and totals
-        if data.get("items") and len(data["items"]) > 0:
-            score += 2
-        if data.get("totals", {}).get("total", 0) > 0:
-            score += 2
-
-        # Payment information
-        if data.get("payment_method") or data.get("bank_account"):
-            score += 1
-
-        # Payment information
-        if data.get("payment_method") or data.get("bank_account"):
-            score += 1
-
-        # Calculate final score (normalized to 0.0-1.0)
-        return min(score / max_score, 1.0)
+        for weight, check in _CONFIDENCE_RULES:
+            if check(data):
+                score += weight
+                if score >= _CONFIDENCE_MAX_SCORE:
+                    return 1.0
+        return score / _CONFIDENCE_MAX_SCORE
 
 
 def create_extractor(languages: List[str] = None, **kwargs) -> DataExtractor:
@@ -443,17 +597,12 @@ def create_extractor(languages: List[str] = None, **kwargs) -> DataExtractor:
 
     # Check for special document formats first by examining content patterns 
     def detect_document_format(text):
-        # Look for Adobe invoice specific patterns
-        adobe_patterns = [
-            r'Adobe Systems Software Ireland',
-            r'Adobe.*Invoice',
-            r'Invoice Number.*?\d+',
-            r'PRODUCT NUMBER.*PRODUCT DESCRIPTION',
-            r'GRAND TO[TU]AL',  # Handle both TOTAL and TOUAL (typo)
-        ]
-        
-        # Count matches for Adobe patterns
-        adobe_score = sum(1 for pattern in adobe_patterns if re.search(pattern, text or "", re.IGNORECASE))
+        # Count matches for Adobe patterns, skipping those whose literal is absent
+        lower = (text or "").lower()
+        adobe_score = sum(
+            1 for literal, pattern in _FORMAT_SIGNATURES["adobe"]
+            if literal in lower and pattern.search(text)
+        )
         
         logger.info(f"[FormatDetector] Adobe score: {adobe_score}/5")
         
@@ -494,3 +643,104 @@ def create_extractor(languages: List[str] = None, **kwargs) -> DataExtractor:
     else:
         logger.info(f"[ExtractorFactory] Using EnglishExtractor for languages={languages}")
         return EnglishExtractor(languages)
+
+
+# Extractor built once per worker process by _init_batch_worker
+_batch_extractor: Optional[DataExtractor] = None
+_batch_init_error: Optional[str] = None
+
+
+class _BatchInitError(RuntimeError):
+    """Raised for every text sent to a worker that could not create its extractor."""
+
+
+def _init_batch_worker(factory, languages: Optional[List[str]]) -> None:
+    global _batch_extractor, _batch_init_error
+    try:
+        _batch_extractor = factory(languages)
+    except Exception as e:
+        # Raising here would kill the worker, which the parent could not
+        # tell apart from a worker dying on a text
+        _batch_init_error = f"{type(e).__name__}: {e}"
+
+
+def _extract_in_worker(text: str, document_type: str) -> Dict[str, Any]:
+    if _batch_extractor is None:
+        raise _BatchInitError(_batch_init_error)
+    return _batch_extractor.extract_invoice_data(text, document_type)
+
+
+def _run_batch(
+    factory,
+    languages: Optional[List[str]],
+    texts: List[str],
+    document_type: str,
+    workers: Optional[int],
+    extractor: Optional[DataExtractor] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run extract_invoice_data over texts in worker processes built by factory.
+
+    Falls back to extracting in this process when factory cannot be sent to
+    the workers or fails there. Errors raised by the extraction itself are
+    propagated as in a serial run; a worker dying on a text (e.g. killed
+    for running out of memory) raises BrokenProcessPool rather than
+    feeding that text to this process.
+    """
+
+    def run_serial():
+        serial_extractor = extractor or factory(languages)
+        return [serial_extractor.extract_invoice_data(text, document_type) for text in texts]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(texts) < 2:
+        return run_serial()
+
+    try:
+        pickle.dumps((factory, languages))
+    except (pickle.PicklingError, AttributeError, TypeError) as e:
+        logger.warning(f"Cannot send extractor factory to worker processes ({e}), extracting serially")
+        return run_serial()
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(texts)),
+            initializer=_init_batch_worker,
+            initargs=(factory, languages),
+        ) as executor:
+            return list(
+                executor.map(
+                    _extract_in_worker,
+                    texts,
+                    itertools.repeat(document_type),
+                    chunksize=max(1, len(texts) // (workers * 4)),
+                )
+            )
+    except _BatchInitError as e:
+        logger.warning(f"Cannot create the extractor in workers ({e}), extracting serially")
+        return run_serial()
+
+
+def extract_batch(
+    texts: List[str],
+    languages: List[str] = None,
+    document_type: str = "invoice",
+    workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Extract invoice data from many texts, in parallel worker processes.
+
+    Extraction is CPU-bound pure Python, so threads would serialize on the
+    GIL. Each worker creates its extractor (and compiles its patterns) once
+    and reuses it for every text it receives.
+
+    Args:
+        texts: OCR texts to extract from
+        languages: Languages passed to create_extractor
+        document_type: Type of document (e.g., "invoice", "receipt")
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Extracted data for each text, in input order
+    """
+    return _run_batch(create_extractor, languages, texts, document_type, workers)
@@ -13,8 +13,17 @@ Available language extractors:
 
 Each language module provides an extractor class that implements the same interface,
 making it easy to switch between languages while maintaining a consistent API.
+Use get_extractor() to share one instance per language instead of building a
+new extractor for every document, and extract_invoice_data() to also reuse the
+result for a text seen before.
 """
 
+import copy
+import functools
+from typing import Any, Dict
+
+from invocr.core.extractor import DataExtractor
+
 from .de import GermanExtractor
 
 # Import extractors to make them available at the package level
@@ -23,7 +32,80 @@ from .es import SpanishExtractor
 from .fr import FrenchExtractor
 from .pl import PolishExtractor
 
+_EXTRACTOR_CLASSES = {
+    "en": EnglishExtractor,
+    "de": GermanExtractor,
+    "es": SpanishExtractor,
+    "fr": FrenchExtractor,
+    "pl": PolishExtractor,
+}
+
+# Shared instances created by get_extractor(), keyed by language code
+_extractor_cache: Dict[str, DataExtractor] = {}
+
+
+def get_extractor(language: str) -> DataExtractor:
+    """
+    Return the shared extractor for a language code.
+
+    Extractors keep no per-document state, so a single instance per
+    language can serve every caller, including concurrent threads.
+
+    Args:
+        language: Language code (en, de, es, fr or pl)
+
+    Returns:
+        Extractor instance for the language
+    """
+    language = language.lower()
+    extractor = _extractor_cache.get(language)
+    if extractor is None:
+        if language not in _EXTRACTOR_CLASSES:
+            raise ValueError(f"Unsupported language: {language}")
+        extractor = _extractor_cache.setdefault(
+            language, _EXTRACTOR_CLASSES[language]([language])
+        )
+    return extractor
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_cached(text: str, language: str, document_type: str) -> Dict[str, Any]:
+    return get_extractor(language).extract_invoice_data(text, document_type)
+
+
+def extract_invoice_data(
+    text: str,
+    language: str = "en",
+    document_type: str = "invoice",
+    no_cache: bool = False,
+) -> Dict[str, Any]:
+    """
+    Extract invoice data from text with the shared extractor for a language.
+
+    Pipelines often run the same OCR text through extraction again (retries,
+    reprocessing), so results of the last 256 distinct calls are kept and
+    handed out as copies; a repeated text then costs a dict copy instead of
+    a full extraction. Cached results keep their original extraction
+    metadata, such as the timestamp.
+
+    Args:
+        text: Raw text from OCR
+        language: Language code (en, de, es, fr or pl)
+        document_type: Type of document (e.g., "invoice", "receipt")
+        no_cache: Always run the extractor and leave the cache untouched
+
+    Returns:
+        Dict containing structured invoice data
+    """
+    language = language.lower()
+    if no_cache:
+        return get_extractor(language).extract_invoice_data(text, document_type)
+    return copy.deepcopy(_extract_cached(text, language, document_type))
+
+
 __all__ = [
+    "extract_invoice_data",
+    "get_extractor",
     "EnglishExtractor",
     "GermanExtractor",
     "SpanishExtractor",
@@ -1,16 +1,109 @@
 """
 German language extractor implementation.
 """
-from typing import Any, Dict, List, Optional
+import functools
+from datetime import date
+from typing import Any, Dict, List, Optional, Pattern
 import re
-from datetime import datetime
 import logging
 
 from invocr.core.extractor import DataExtractor
+from invocr.utils.helpers import RE2_AVAILABLE, AsciiRe2Pattern
+
+# Written-out German dates such as "5. März 2024" or "05. Dez. 2024"
+_MONTH_NAMES = (
+    r'jan(?:uar)?|feb(?:ruar)?|m(?:ä|ae)r(?:z)?|apr(?:il)?|mai|jun(?:i)?|jul(?:i)?'
+    r'|aug(?:ust)?|sep(?:t(?:ember)?)?|okt(?:ober)?|nov(?:ember)?|dez(?:ember)?'
+)
+_MONTH_DATE_RX = re.compile(
+    r'(\d{1,2})\.\s*(' + _MONTH_NAMES + r')\.?\s+(\d{4})', re.IGNORECASE
+)
+# Date value captured by the issue/due date patterns, numeric or written-out
+_DATE_VALUE = (
+    r'\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}'
+    r'|\d{1,2}\.\s*(?:' + _MONTH_NAMES + r')\.?\s+\d{4}'
+)
+# Month number keyed by the first three letters of the (lowercased) name
+_MONTHS = {
+    "jan": 1, "feb": 2, "mär": 3, "mae": 3, "apr": 4, "mai": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "okt": 10, "nov": 11, "dez": 12,
+}
+
+# Normalizes a captured amount for float() in one pass: drops (non-breaking)
+# spaces used as thousands separators and turns the decimal comma into a dot
+_AMOUNT_TRANS = str.maketrans({" ": None, "\xa0": None, ",": "."})
+
+# Extraction patterns keyed by the field they extract
+_GERMAN_PATTERNS_RAW = {
+    # Basic info
+    "document_number": r'(?i)(?:Rechnungsnummer|Rechnungs-Nr\.?|Nr\.?)[:\s]*(\w[\w\s-]*\d+)',
+    "issue_date": r'(?i)(?:Rechnungsdatum|Datum)[:\s]*(' + _DATE_VALUE + ')',
+    "due_date": r'(?i)(?:Fällig(?:keit)?(?:sd?atum)?|Zahlbar bis)[:\s]*(' + _DATE_VALUE + ')',
+    "currency": r'(?i)(?:Währung|Betrag in)[:\s]*([A-Z]{3})',
+
+    # Labels of the three party fields below, one named group per field.
+    # Scanning them together also keeps the "käufer" inside "Verkäufer"
+    # from being read as the buyer label
+    "party_labels": (
+        r'(?i)(?P<seller_name>Verkäufer|Lieferant|Rechnungssteller)'
+        r'|(?P<seller_tax_id>USt-?ID|Umsatzsteuer-?Identifikationsnummer)'
+        r'|(?P<buyer_name>Käufer|Rechnungsempfänger)'
+    ),
+    # Parties; the name must be followed by at least two address-like lines.
+    # Written as one lazy run over a single class rather than a repeated group
+    # of overlapping pieces, so the engine has nothing to backtrack into
+    "seller_name": r'(?i)(?:Verkäufer|Lieferant|Rechnungssteller)[:\s]*([^\n]+)\n[A-Z0-9\s,.-]+?\n[A-Z0-9\s,.-]',
+    "seller_tax_id": r'(?i)(?:USt-?ID|Umsatzsteuer-?Identifikationsnummer)[:\s]*([A-Z]{2}\s*[0-9]+[0-9A-Z]*)',
+    "buyer_name": r'(?i)(?:Käufer|Rechnungsempfänger)[:\s]*([^\n]+)\n[A-Z0-9\s,.-]+?\n[A-Z0-9\s,.-]',
+
+    # Line items
+    "line_item": r'(?i)(\d+[\.,]?\d*)\s+(?:x|X|\*)\s+([^\n]+?)\s+(\d+[\s,.]\d{2})\s+[A-Z]{3}\s+(\d+[\s,.]\d{2})',
+
+    # Totals; searched in the lowercased text (see _extract_totals), so the
+    # labels are lowercase and the patterns need no IGNORECASE
+    "net_amount": r'(?:nettobetrag|netto(?:summe)?|zwischensumme)[:\s]*([\d\s,.-]+)\s*[a-z]{3}',
+    "tax_amount": r'(?:mehrwertsteuer|umsatzsteuer|ust\.?|mwst\.?)[\s\d%]*(?:\d+[\s,.]\d+)\s*[a-z]{3}\s*([\d\s,.-]+)\s*[a-z]{3}',
+    "tax_rate": r'(?:mehrwertsteuer|umsatzsteuer|ust\.?|mwst\.?)[\s]*(\d+)[\s%]*',
+    "total_amount": r'(?:gesamtbetrag|endbetrag|rechnungsbetrag|zu zahlender betrag)[:\s]*([\d\s,.-]+)\s*([a-z]{3})',
+
+    # Payment info
+    # Labels of the four payment fields below, one named group per field
+    "payment_labels": (
+        r'(?i)(?P<payment_method>Zahlungsart|Zahlungsweise|Bezahlung)'
+        r'|(?P<bank_account>IBAN|Kontonummer|Konto-Nr)'
+        r'|(?P<bic>BIC|SWIFT|Bankleitzahl)'
+        r'|(?P<payment_terms>Zahlungsbedingungen|Zahlbar innerhalb von|Zahlungsziel)'
+    ),
+    "payment_method": r'(?i)(?:Zahlungsart|Zahlungsweise|Bezahlung)[:\s]*([^\n]+)',
+    "bank_account": r'(?i)(?:IBAN|Kontonummer|Konto-Nr\.?)[:\s]*([A-Z]{2}\s*[0-9]{2}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{0,2})',
+    "bic": r'(?i)(?:BIC|SWIFT|Bankleitzahl)[:\s]*([A-Z0-9]{8,11})',
+    "payment_terms": r'(?i)(?:Zahlungsbedingungen|Zahlbar innerhalb von|Zahlungsziel)[\s:]*([^\n]+)',
+    "payment_terms_days": r'(\d+)\s*(?:Tage|Tagen|Tag)',
+}
+
+
+def _compile_pattern(pattern: str):
+    r"""Compile a pattern, with RE2 for ASCII text when installed.
+
+    RE2 matches in linear time, so noisy OCR text cannot trigger
+    backtracking. Its \s, \d and \w only match ASCII, so text with
+    umlauts or non-breaking spaces is matched by re.
+    """
+    if RE2_AVAILABLE:
+        return AsciiRe2Pattern(pattern, fallback=re.compile(pattern))
+    return re.compile(pattern)
+
+
+# Compiled once at import and shared by every GermanExtractor instance
+_GERMAN_PATTERNS = {
+    field: _compile_pattern(pattern) for field, pattern in _GERMAN_PATTERNS_RAW.items()
+}
 
 class GermanExtractor(DataExtractor):
     """German language extractor implementation."""
 
+    DEFAULT_LANGUAGE = "de"
+
     def __init__(self, languages=None):
         """Initialize the German extractor with supported languages.
 
@@ -19,6 +112,11 @@ class GermanExtractor(DataExtractor):
         """
         super().__init__(languages or ["de"])
         self.logger = logging.getLogger(__name__)
+        self.patterns = self._load_extraction_patterns()
+
+    def _load_extraction_patterns(self) -> Dict[str, Pattern]:
+        """Return the German extraction patterns, keyed by the field they extract."""
+        return _GERMAN_PATTERNS
 
     def extract_invoice_data(self, text: str, document_type: str = "invoice") -> Dict[str, Any]:
         """Extract structured data from German invoice text.
@@ -34,8 +132,8 @@ class GermanExtractor(DataExtractor):
         self.logger.debug(f"Raw text input (first 500 chars): {text[:500]}")
         result = self._get_document_template(document_type)
         
-        # Detect language if not specified
-        language = self._detect_language(text)
+        # Only detect the language if this extractor does not fix it
+        language = self.DEFAULT_LANGUAGE or self._detect_language(text)
         self.logger.debug(f"Detected language: {language}")
         
         # Extract basic info
@@ -73,34 +171,22 @@ class GermanExtractor(DataExtractor):
         result = {}
         
         # Document number (Rechnungsnummer)
-        doc_number_match = re.search(
-            r'(?i)(?:Rechnungsnummer|Rechnungs-Nr\.?|Nr\.?)[:\s]*(\w[\w\s-]*\d+)', 
-            text
-        )
+        doc_number_match = self.patterns["document_number"].search(text)
         if doc_number_match:
             result["document_number"] = doc_number_match.group(1).strip()
         
         # Issue date (Rechnungsdatum)
-        issue_date_match = re.search(
-            r'(?i)(?:Rechnungsdatum|Datum)[:\s]*(\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4})', 
-            text
-        )
+        issue_date_match = self.patterns["issue_date"].search(text)
         if issue_date_match:
-            result["issue_date"] = self._parse_date(issue_date_match.group(1))
+            result["issue_date"] = self._parse_german_date(issue_date_match.group(1))
             
         # Due date (Fälligkeitsdatum)
-        due_date_match = re.search(
-            r'(?i)(?:Fällig(?:keit)?(?:sd?atum)?|Zahlbar bis)[:\s]*(\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4})', 
-            text
-        )
+        due_date_match = self.patterns["due_date"].search(text)
         if due_date_match:
-            result["due_date"] = self._parse_date(due_date_match.group(1))
+            result["due_date"] = self._parse_german_date(due_date_match.group(1))
             
         # Currency (Währung)
-        currency_match = re.search(
-            r'(?i)(?:Währung|Betrag in)[:\s]*([A-Z]{3})', 
-            text
-        )
+        currency_match = self.patterns["currency"].search(text)
         if currency_match:
             result["currency"] = currency_match.group(1)
         else:
@@ -113,27 +199,21 @@ class GermanExtractor(DataExtractor):
         """Extract seller and buyer information."""
         result = {"seller": {}, "buyer": {}}
         
+        # One pass over the party labels finds all three fields
+        matches = self._scan_labeled_fields(text, "party_labels")
+        
         # Extract seller name (Verkäufer/Lieferant)
-        seller_name_match = re.search(
-            r'(?i)(?:Verkäufer|Lieferant|Rechnungssteller)[:\s]*([^\n]+)(?:\n\s*[A-Z0-9\s,.-]+){2,}', 
-            text
-        )
+        seller_name_match = matches.get("seller_name")
         if seller_name_match:
             result["seller"]["name"] = seller_name_match.group(1).strip()
             
         # Extract seller tax ID (USt-IdNr.)
-        tax_id_match = re.search(
-            r'(?i)(?:USt-?ID|Umsatzsteuer-?Identifikationsnummer)[:\s]*([A-Z]{2}\s*[0-9]+[0-9A-Z]*)', 
-            text
-        )
+        tax_id_match = matches.get("seller_tax_id")
         if tax_id_match:
             result["seller"]["tax_id"] = tax_id_match.group(1).strip()
             
         # Extract buyer name (Käufer/Rechnungsempfänger)
-        buyer_name_match = re.search(
-            r'(?i)(?:Käufer|Rechnungsempfänger)[:\s]*([^\n]+)(?:\n\s*[A-Z0-9\s,.-]+){2,}', 
-            text
-        )
+        buyer_name_match = matches.get("buyer_name")
         if buyer_name_match:
             result["buyer"]["name"] = buyer_name_match.group(1).strip()
             
@@ -141,20 +221,15 @@ class GermanExtractor(DataExtractor):
         
     def _extract_items(self, text: str, language: str) -> List[Dict[str, Any]]:
         """Extract line items from the invoice."""
+        # Look for item patterns in the text; findall hands back the four
+        # groups as tuples without building a match object per item
         items = []
-        
-        # Look for item patterns in the text
-        item_matches = re.finditer(
-            r'(?i)(\d+[\.,]?\d*)\s+(?:x|X|\*)\s+([^\n]+?)\s+(\d+[\s,.]\d{2})\s+[A-Z]{3}\s+(\d+[\s,.]\d{2})',
-            text
-        )
-        
-        for match in item_matches:
+        for quantity, description, unit_price, amount in self.patterns["line_item"].findall(text):
             items.append({
-                "description": match.group(2).strip(),
-                "quantity": float(match.group(1).replace(",", ".")),
-                "unit_price": float(match.group(3).replace(",", ".").replace(" ", "")),
-                "amount": float(match.group(4).replace(",", ".").replace(" ", "")),
+                "description": description.strip(),
+                "quantity": float(quantity.translate(_AMOUNT_TRANS)),
+                "unit_price": float(unit_price.translate(_AMOUNT_TRANS)),
+                "amount": float(amount.translate(_AMOUNT_TRANS)),
             })
             
         return items
@@ -163,39 +238,31 @@ class GermanExtractor(DataExtractor):
         """Extract total amounts from the invoice."""
         result = {}
         
+        # Only numbers are captured here, so case can be folded once up front
+        # instead of per character inside every IGNORECASE match
+        text = text.lower()
+        
         # Net amount (Nettobetrag)
-        net_match = re.search(
-            r'(?i)(?:Nettobetrag|Netto(?:summe)?|Zwischensumme)[:\s]*([\d\s,.-]+)\s*[A-Z]{3}', 
-            text
-        )
+        net_match = self.patterns["net_amount"].search(text)
         if net_match:
-            result["net_amount"] = float(net_match.group(1).replace(" ", "").replace(",", "."))
+            result["net_amount"] = float(net_match.group(1).translate(_AMOUNT_TRANS))
             
         # Tax amount (Mehrwertsteuer/Umsatzsteuer)
-        tax_match = re.search(
-            r'(?i)(?:Mehrwertsteuer|Umsatzsteuer|USt\.?|MwSt\.?)[\s\d%]*(?:\d+[\s,.]\d+)\s*[A-Z]{3}\s*([\d\s,.-]+)\s*[A-Z]{3}', 
-            text
-        )
+        tax_match = self.patterns["tax_amount"].search(text)
         if tax_match:
-            result["tax_amount"] = float(tax_match.group(1).replace(" ", "").replace(",", "."))
+            result["tax_amount"] = float(tax_match.group(1).translate(_AMOUNT_TRANS))
         
         # Tax rate (Steuersatz)
-        tax_rate_match = re.search(
-            r'(?i)(?:Mehrwertsteuer|Umsatzsteuer|USt\.?|MwSt\.?)[\s]*(\d+)[\s%]*', 
-            text
-        )
+        tax_rate_match = self.patterns["tax_rate"].search(text)
         if tax_rate_match:
             result["tax_rate"] = float(tax_rate_match.group(1))
             
         # Total amount (Gesamtbetrag)
-        total_match = re.search(
-            r'(?i)(?:Gesamtbetrag|Endbetrag|Rechnungsbetrag|Zu zahlender Betrag)[:\s]*([\d\s,.-]+)\s*([A-Z]{3})', 
-            text
-        )
+        total_match = self.patterns["total_amount"].search(text)
         if total_match:
-            result["total_amount"] = float(total_match.group(1).replace(" ", "").replace(",", "."))
+            result["total_amount"] = float(total_match.group(1).translate(_AMOUNT_TRANS))
             if "currency" not in result:
-                result["currency"] = total_match.group(2)
+                result["currency"] = total_match.group(2).upper()
                 
         return result
         
@@ -203,38 +270,31 @@ class GermanExtractor(DataExtractor):
         """Extract payment information."""
         result = {}
         
+        # One pass over the payment labels finds all four fields
+        matches = self._scan_labeled_fields(text, "payment_labels")
+        
         # Payment method (Zahlungsart)
-        payment_method_match = re.search(
-            r'(?i)(?:Zahlungsart|Zahlungsweise|Bezahlung)[:\s]*([^\n]+)', 
-            text
-        )
+        payment_method_match = matches.get("payment_method")
         if payment_method_match:
             result["payment_method"] = payment_method_match.group(1).strip()
             
         # Bank account (Bankverbindung)
-        iban_match = re.search(
-            r'(?i)(?:IBAN|Kontonummer|Konto-Nr\.?)[:\s]*([A-Z]{2}\s*[0-9]{2}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{0,2})', 
-            text
-        )
+        iban_match = matches.get("bank_account")
         if iban_match:
             result["bank_account"] = iban_match.group(1).replace(" ", "")
+            if not self._validate_iban(result["bank_account"]):
+                self.logger.warning(f"IBAN checksum mismatch: {result['bank_account']}")
             
         # BIC/SWIFT
-        bic_match = re.search(
-            r'(?i)(?:BIC|SWIFT|Bankleitzahl)[:\s]*([A-Z0-9]{8,11})', 
-            text
-        )
+        bic_match = matches.get("bic")
         if bic_match:
             result["bic"] = bic_match.group(1)
             
         # Payment terms (Zahlungsbedingungen)
-        terms_match = re.search(
-            r'(?i)(?:Zahlungsbedingungen|Zahlbar innerhalb von|Zahlungsziel)[\s:]*([^\n]+)', 
-            text
-        )
+        terms_match = matches.get("payment_terms")
         if terms_match:
             # Try to extract number of days
-            days_match = re.search(r'(\d+)\s*(?:Tage|Tagen|Tag)', terms_match.group(1))
+            days_match = self.patterns["payment_terms_days"].search(terms_match.group(1))
             if days_match:
                 result["payment_terms_days"] = int(days_match.group(1))
             else:
@@ -242,23 +302,49 @@ class GermanExtractor(DataExtractor):
             
         return result
         
-    def _parse_date(self, date_str: str) -> str:
-        """Parse date string into YYYY-MM-DD format."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_german_date(date_str: str) -> str:
+        """Parse a numeric or written-out German date into YYYY-MM-DD format.
+        
+        Written-out dates ("5. März 2024") are handled with one regex match and a
+        month lookup; anything else goes to the numeric DataExtractor._parse_date.
+        Results are cached.
+        """
+        match = _MONTH_DATE_RX.fullmatch(date_str)
+        if not match:
+            return DataExtractor._parse_date(date_str)
+        
+        day, month_name, year = match.groups()
         try:
-            # Handle different date separators
-            date_str = date_str.replace(".", "-").replace("/", "-")
-            # Try different date formats (German format first)
-            for fmt in ("%d-%m-%Y", "%Y-%m-%d", "%d-%m-%y"):
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-            return date_str
-        except Exception as e:
-            self.logger.warning(f"Failed to parse date '{date_str}': {e}")
+            return date(int(year), _MONTHS[month_name[:3].lower()], int(day)).isoformat()
+        except ValueError:
             return date_str
         
+    def _scan_labeled_fields(self, text: str, labels: str) -> Dict[str, Any]:
+        """Find the first match of several field patterns in a single pass over the text.
+        
+        Args:
+            text: Text to search
+            labels: Key of a pattern matching the field labels, with one named
+                group per field pattern (which must start with that label)
+            
+        Returns:
+            Dict mapping each found field to its match
+        """
+        label_pattern = self.patterns[labels]
+        matches = {}
+        for label_match in label_pattern.finditer(text):
+            field = next(name for name, value in label_match.groupdict().items() if value is not None)
+            if field in matches:
+                continue
+            match = self.patterns[field].match(text, label_match.start())
+            if match:
+                matches[field] = match
+                if len(matches) == len(label_match.groupdict()):
+                    break
+        return matches
+        
     def _validate_and_clean(self, data: Dict[str, Any]) -> None:
         """Validate and clean extracted data."""
         # Ensure required fields are present
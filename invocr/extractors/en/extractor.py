@@ -2,11 +2,296 @@
 English language extractor implementation.
 """
 from typing import Any, Dict, List, Optional
+import functools
+import itertools
 import re
 from datetime import datetime
 import logging
 
 from invocr.core.extractor import DataExtractor
+from invocr.utils.helpers import RE2_AVAILABLE, AsciiRe2Pattern, fold_case, original_group
+
+# DD/MM/YYYY-style dates (also '-' or '.'), which dateutil reads day-first here
+_DAY_FIRST_DATE_RX = re.compile(r"(\d{1,2})[-./](\d{1,2})[-./](\d{4})")
+# Written-out dates captured by _DATE_VALUE: "01 Jan 2023" or "Jan 01, 2023".
+# dateutil reads a day joined to the year by commas alone ("Jan 01,2023")
+# as one number, so that form is left to it
+_MONTH_DATE_RX = re.compile(
+    r"([0-9]{1,2})\s+([a-z]+)\s+([0-9]{4})|([a-z]+)[\s,]+([0-9]{1,2})[,\s]*\s[,\s]*([0-9]{4})",
+    re.IGNORECASE,
+)
+# Month number keyed by every name dateutil accepts for it
+_MONTHS = {
+    name: number
+    for number, names in enumerate((
+        ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+        ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+        ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"),
+        ("dec", "december"),
+    ), 1)
+    for name in names
+}
+
+
+def _trie_alternation(words) -> str:
+    """Build a regex matching any of words, with shared prefixes factored out.
+
+    ["mar", "may"] becomes "ma[ry]", so a position is rejected after one
+    character test instead of one per word. A trie prefers the longest
+    word, unlike the leftmost-first order of a plain alternation, so only
+    use it where that cannot change a match: words that are not prefixes
+    of each other, or a pattern that is only tested for a match.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        branches = []
+        chars = []
+        for char in sorted(key for key in node if key):
+            rest = build(node[char])
+            if rest:
+                branches.append(re.escape(char) + rest)
+            else:
+                chars.append(re.escape(char))
+        if chars:
+            branches.append(chars[0] if len(chars) == 1 else "[" + "".join(chars) + "]")
+        if not branches:
+            return ""
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+    # Several branches come back wrapped in a group, so the result can be
+    # concatenated with other pattern parts as is
+    return build(trie)
+
+
+_MONTH = _trie_alternation(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+)
+
+# Date value captured by the issue/due date patterns (no capturing group)
+_DATE_VALUE = "(?:" + "|".join([
+    r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",  # DD/MM/YYYY or DD-MM-YYYY
+    r"\d{4}[-/]\d{1,2}[-/]\d{1,2}",    # YYYY-MM-DD or YYYY/MM/DD
+    r"\d{1,2}\s+" + _MONTH + r"[a-z]*\s+\d{4}",  # 01 Jan 2023
+    _MONTH + r"[a-z]*[\s,]+\d{1,2}[,\s]+\d{4}"  # Jan 01, 2023
+]) + ")"
+
+# Payment methods named by any of a few literal words; their patterns are
+# alternations of just these words
+_PAYMENT_METHOD_WORDS = {
+    "credit_card": ("visa", "mastercard", "amex", "american express", "discover",
+                    "credit card", "debit card"),
+    "bank_transfer": ("bank transfer", "wire transfer", "sepa", "ach", "iban", "swift"),
+    "check": ("check", "cheque"),
+}
+
+# Extraction patterns keyed by field. Lists are tried in order and the first
+# match wins; (name, pattern) pairs fill the named field. The patterns are
+# written in lowercase and run on the case-folded text (see fold_case()),
+# which is cheaper than IGNORECASE; values are then sliced from the
+# original text by the match offsets
+_ENGLISH_PATTERNS_RAW = {
+    # Basic info
+    "document_number": [
+        r"(?:invoice|bill|receipt|inv|facture|fa)[\s:]*#?\s*([a-z0-9-]{3,})",
+        r"(?:no\.?|number|nr\.?|ref\.?|reference)[\s:]*#?\s*([a-z0-9-]{3,})",
+        r"(?:document|doc\.?)[\s:]*#?\s*([a-z0-9-]{3,})"
+    ],
+    "po_number": [
+        r"(?:po|p\.o\.|purchase order)[\s:]*#?\s*([a-z0-9-]+)",
+        r"(?:order|reference)[\s:]*#?\s*([a-z0-9-]+)"
+    ],
+    # A bare "Date" label is already one of the alternatives here, so a
+    # separate fallback for it could never match where this one failed
+    "issue_date": [
+        r"(?:date|dated|issued?|invoice date)[\s:]*(" + _DATE_VALUE + ")"
+    ],
+    "due_date": [
+        r"(?:due|payment due|due date|payment date)[\s:]*(" + _DATE_VALUE + ")",
+        r"(?:payable by|payment by)[\s:]*(" + _DATE_VALUE + ")"
+    ],
+    "currency": [
+        r"(?:amount|total|balance|subtotal|amt\.?)[\s:]*([a-z]{3}|[€$£¥])",
+        r"([€$£¥])\s*\d+(?:\.\d{2})?"
+    ],
+
+    # Parties
+    "company_name": [
+        r"^([^\n]{5,}?)\s*(?:\n|$)",
+        r"(?:company|business|trading as|t/a|d/b/a|doing business as)[\s:]*([^\n]+)"
+    ],
+    "tax_id": [
+        r"(?:vat|gst|tax|tax\s*id|vat\s*id|vat\s*no\.?|tax\s*no\.?)[\s:]*([a-z0-9\s-]+)",
+        r"(?:registration\s*no\.?|reg\.?\s*no\.?|reg\s*no\.?)[\s:]*([a-z0-9\s-]+)"
+    ],
+    # Matched on the original text
+    "address": r"(?s)(\d+[^\n]{10,}?)(?=\n\s*\n|\Z)",
+    "email": r"([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)",
+    "phone": r"(\+?[\d\s-]{8,})",
+
+    # Line items
+    "line_item": [
+        # Table with headers: Qty, Description, Unit Price, Amount
+        r"(?m)(?:qty|quantity).*?(?:description|item).*?(?:unit price|price).*?(?:amount|total)([\s\S]*?)(?=\n\s*\n|subtotal|total|$)",
+        # Simple item lines: 1 x Product Name @ $10.00 = $10.00
+        r"(\d+)\s*[x×]\s*([^@\n]+?)@\s*([$€£¥]?\s*\d+(?:\.\d{2})?)\s*[=]\s*([$€£¥]?\s*\d+(?:\.\d{2})?)",
+        # Just item and price: Product Name $10.00
+        r"(?m)^\s*([^\n]{5,}?)\s+([$€£¥]?\s*\d+(?:\.\d{2})?)\s*$"
+    ],
+
+    # Totals
+    "totals": [
+        ("subtotal", r"(?:subtotal|sub-total|total before tax)[\s:]*[$€£¥]?\s*(\d+(?:[.,]\d{2})?)"),
+        ("tax_amount", r"(?:tax|vat|gst|sales tax)[\s:]*[$€£¥]?\s*(\d+(?:[.,]\d{2})?)"),
+        ("tax_rate", r"(?:tax|vat|gst|sales tax)[\s:]*\(?(\d+(?:\.\d+)?)%\)?[\s:]*[$€£¥]?\s*(?:\d+(?:[.,]\d{2})?)?"),
+        ("total", r"(?:total|amount due|balance due|grand total)[\s:]*[$€£¥]?\s*(\d+(?:[.,]\d{2})?)")
+    ],
+
+    # Payment
+    "payment_terms": [
+        r"(?:payment terms|terms)[\s:]*([^\n]+)",
+        r"(?:net|due)[\s:]*([^\n]+)"
+    ],
+    "payment_method": [
+        ("credit_card", _trie_alternation(_PAYMENT_METHOD_WORDS["credit_card"])),
+        ("bank_transfer", _trie_alternation(_PAYMENT_METHOD_WORDS["bank_transfer"])),
+        ("paypal", r"pay(?:\s*|-)pal"),
+        ("check", _trie_alternation(_PAYMENT_METHOD_WORDS["check"]))
+    ],
+    "bank_details": [
+        ("bank_name", r"bank[\s:]*([^\n]+?)(?=\n|$)"),
+        ("account_number", r"(?:account|acc\.?|a\/c)[\s:]*([a-z0-9\s-]+)(?=\s|$)"),
+        ("routing_number", r"(?:routing|rtn|aba|routing no\.?)[\s:]*([0-9a-z\s-]+)(?=\s|$)"),
+        ("swift_code", r"(?:swift|bic|swift code|bic code)[\s:]*([a-z0-9]{8,11})(?=\s|$)"),
+        ("iban", r"(?:iban|international bank account number)[\s:]*([a-z]{2}[0-9a-z\s-]{10,30})(?=\s|$)")
+    ],
+}
+
+
+# Look-ahead or look-behind, which RE2 does not support
+_LOOKAROUND_RX = re.compile(r"\(\?<?[=!]")
+
+
+def _compile_pattern(pattern):
+    """Compile with RE2 when installed, which matches in linear time.
+
+    RE2 has no look-around, so patterns using it stay on ``re``. RE2's
+    character classes only match ASCII, so non-ASCII text (currency signs,
+    non-breaking spaces) is matched by ``re`` as well.
+    """
+    if RE2_AVAILABLE and not _LOOKAROUND_RX.search(pattern):
+        return AsciiRe2Pattern(pattern, fallback=re.compile(pattern))
+    return re.compile(pattern)
+
+
+def _compile_patterns(value):
+    """Compile a pattern, a list of patterns or a list of (name, pattern) pairs."""
+    if isinstance(value, str):
+        return _compile_pattern(value)
+    return tuple(
+        (item[0], _compile_pattern(item[1])) if isinstance(item, tuple) else _compile_pattern(item)
+        for item in value
+    )
+
+
+# Compiled once at import and shared by every EnglishExtractor instance
+_ENGLISH_PATTERNS = {
+    field: _compile_patterns(value) for field, value in _ENGLISH_PATTERNS_RAW.items()
+}
+
+# Start and stop keywords of the seller/buyer sections found by
+# _find_sections(): "bill to" and the like are read as their own section
+_SECTION_KEYWORDS = (
+    (("seller", "vendor", "provider", "from"), ("buyer", "client", "customer", "to")),
+    (("bill to", "invoice to", "sold to"), ("ship to",)),
+)
+
+
+def _find_first(lower: str, words, pos: int):
+    """Return (index, word) of the leftmost word found at or after pos, or None."""
+    best = None
+    for word in words:
+        # Once a word is found, only an earlier start can beat it
+        end = len(lower) if best is None else best[0] + len(word) - 1
+        index = lower.find(word, pos, end)
+        if index != -1:
+            best = (index, word)
+    return best
+
+
+def _find_sections(text: str, lower: str, starts, stops):
+    """Yield the sections of text that follow a start keyword, up to a stop keyword.
+
+    A section starts after the keyword and any whitespace or colons, and
+    ends at the next stop keyword or the end of the text; this is what a
+    lazy run closed by a look-ahead would match, found with str.find() on
+    the case-folded text instead of by backtracking.
+    """
+    pos = 0
+    while True:
+        start = _find_first(lower, starts, pos)
+        if start is None:
+            return
+        begin = start[0] + len(start[1])
+        while begin < len(text) and (text[begin].isspace() or text[begin] == ":"):
+            begin += 1
+        # "$" also matches before a final newline
+        end = len(text) - 1 if text.endswith("\n") and begin < len(text) else len(text)
+        stop = _find_first(lower, stops, begin)
+        if stop is not None and stop[0] < end:
+            end = stop[0]
+        yield text[begin:end]
+        pos = end
+
+
+# Literals of which at least one occurs (case-folded) wherever the pattern of
+# the keyed field matches; a pattern is skipped when none of them is present.
+# Except for the payment methods and line items, every match also starts
+# with one of them, so the search can begin at the first one found (see
+# _first_keyword())
+_FIELD_KEYWORDS = {
+    # Only the "qty x name @ price = amount" pattern can yield items
+    "line_item": ("=",),
+    "due_date": ("due", "pay"),
+    "subtotal": ("subtotal", "sub-total", "total before tax"),
+    "tax_amount": ("tax", "vat", "gst", "sales tax"),
+    "tax_rate": ("tax", "vat", "gst", "sales tax"),
+    "total": ("total", "amount due", "balance due", "grand total"),
+    **_PAYMENT_METHOD_WORDS,
+    "paypal": ("pal",),
+    "bank_name": ("bank",),
+    "account_number": ("acc", "a/c"),
+    "routing_number": ("routing", "rtn", "aba"),
+    "swift_code": ("swift", "bic"),
+    "iban": ("iban", "international bank account number"),
+}
+
+
+def _may_match(lower: str, field: str) -> bool:
+    """Tell whether the keywords of field occur in the case-folded text."""
+    return any(keyword in lower for keyword in _FIELD_KEYWORDS[field])
+
+
+def _first_keyword(lower: str, field: str) -> Optional[int]:
+    """Return where the first keyword of field occurs in lower, or None.
+
+    No match of the field's patterns starts before it, so searching from
+    there skips the text above the label, often most of it for totals.
+    """
+    found = _find_first(lower, _FIELD_KEYWORDS[field], 0)
+    return None if found is None else found[0]
+
+
+# Currency symbols mapped to their ISO code
+_CURRENCY_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY"}
 
 class EnglishExtractor(DataExtractor):
     """English language extractor implementation."""
@@ -14,146 +299,86 @@ class EnglishExtractor(DataExtractor):
     def __init__(self, languages=None):
         super().__init__(languages)
         self.logger = logging.getLogger(__name__)
+        self.patterns = self._load_extraction_patterns()
 
-    def extract_invoice_data(self, text: str, document_type: str = "invoice") -> Dict[str, Any]:
-        """Extract structured data from invoice text.
-        
-        Args:
-            text: Raw text from OCR
-            document_type: Type of document (e.g., "invoice", "receipt")
-            
-        Returns:
-            Dict containing structured invoice data
-        """
-        self.logger.debug(f"Extracting invoice data. Document type: {document_type}")
-        self.logger.debug(f"Raw text input (first 500 chars): {text[:500]}")
-        result = self._get_document_template(document_type)
-        
-        # Detect language if not specified
-        language = self._detect_language(text)
-        self.logger.debug(f"Detected language: {language}")
-        
-        # Extract basic info
-        basic_info = self._extract_basic_info(text, language)
-        self.logger.debug(f"Extracted basic info: {basic_info}")
-        result.update(basic_info)
-        
-        # Extract parties (seller/buyer)
-        parties = self._extract_parties(text, language)
-        self.logger.debug(f"Extracted parties: {parties}")
-        result.update(parties)
-        
-        # Extract line items
-        items = self._extract_items(text, language)
-        self.logger.debug(f"Extracted items: {items}")
-        if items:
-            result["items"] = items
-        
-        # Extract totals
-        totals = self._extract_totals(text, language)
-        self.logger.debug(f"Extracted totals: {totals}")
-        if totals:
-            result["totals"] = totals
-        
-        # Extract payment info
-        payment_info = self._extract_payment_info(text, language)
-        self.logger.debug(f"Extracted payment info: {payment_info}")
-        if payment_info:
-            result["payment"] = payment_info
-        
-        # Validate and clean the extracted data
-        self.logger.debug(f"Result before validation: {result}")
-        self._validate_and_clean(result)
-        self.logger.debug(f"Final result after validation: {result}")
-        return result
+    def _load_extraction_patterns(self) -> Dict[str, Any]:
+        """Return the English extraction patterns, compiled once at import."""
+        return _ENGLISH_PATTERNS
 
     def _extract_basic_info(self, text: str, language: str) -> Dict[str, Any]:
         """Extract basic invoice information."""
         result = {}
-        
-        # Common date sub-patterns (no capturing group)
-        date_subpatterns = [
-            r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",  # DD/MM/YYYY or DD-MM-YYYY
-            r"\d{4}[-/]\d{1,2}[-/]\d{1,2}",    # YYYY-MM-DD or YYYY/MM/DD
-            r"\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}",  # 01 Jan 2023
-            r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,]+\d{1,2}[,\s]+\d{4}"  # Jan 01, 2023
-        ]
-        date_union = "(?:" + "|".join(date_subpatterns) + ")"
-
-        # Document number patterns
-        doc_patterns = [
-            r"(?:Invoice|Bill|Receipt|INV|FACTURE|FA)[\s:]*#?\s*([A-Z0-9-]{3,})",
-            r"(?:No\.?|Number|Nr\.?|Ref\.?|Reference)[\s:]*#?\s*([A-Z0-9-]{3,})",
-            r"(?:Document|Doc\.?)[\s:]*#?\s*([A-Z0-9-]{3,})"
-        ]
-        
-        # PO number patterns
-        po_patterns = [
-            r"(?:PO|P\.O\.|Purchase Order)[\s:]*#?\s*([A-Z0-9-]+)",
-            r"(?:Order|Reference)[\s:]*#?\s*([A-Z0-9-]+)"
-        ]
-        
-        # Currency detection
-        currency_patterns = [
-            r"(?:Amount|Total|Balance|Subtotal|Amt\.?)[\s:]*([A-Z]{3}|[€$£¥])",
-            r"([€$£¥])\s*\d+(?:\.\d{2})?"
-        ]
+        patterns = self.patterns
+        lower = fold_case(text)
 
         # Extract document number
-        for pattern in doc_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in patterns["document_number"]:
+            match = pattern.search(lower)
             if match:
-                result["document_number"] = match.group(1).strip()
+                result["document_number"] = original_group(text, match).strip()
                 break
                 
         # Extract PO number
-        for pattern in po_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in patterns["po_number"]:
+            match = pattern.search(lower)
             if match:
-                result["po_number"] = match.group(1).strip()
+                result["po_number"] = original_group(text, match).strip()
                 break
 
         # Extract issue date
-        issue_date_patterns = [
-            rf"(?:Date|Dated|Issued?|Invoice Date)[\s:]*({date_union})",
-            rf"(?:Date)[\s:]*({date_union})"
-        ]
-        
-        for pattern in issue_date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in patterns["issue_date"]:
+            match = pattern.search(lower)
             if match:
-                date_str = match.group(1).strip()
+                date_str = original_group(text, match).strip()
                 result["issue_date"] = self._parse_date(date_str)
                 break
 
         # Extract due date
-        due_date_patterns = [
-            rf"(?:Due|Payment Due|Due Date|Payment Date)[\s:]*({date_union})",
-            rf"(?:Payable by|Payment by)[\s:]*({date_union})"
-        ]
-        
-        for pattern in due_date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                date_str = match.group(1).strip()
-                result["due_date"] = self._parse_date(date_str)
-                break
+        start = _first_keyword(lower, "due_date")
+        if start is not None:
+            for pattern in patterns["due_date"]:
+                match = pattern.search(lower, start)
+                if match:
+                    date_str = original_group(text, match).strip()
+                    result["due_date"] = self._parse_date(date_str)
+                    break
                 
         # Detect currency
-        for pattern in currency_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in patterns["currency"]:
+            match = pattern.search(lower)
             if match:
-                currency = match.group(1)
-                if currency in {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY"}:
-                    result["currency"] = {"$": "USD", "€": "EUR", "£": "GBP", "¥": "JPY"}[currency]
-                else:
-                    result["currency"] = currency
+                currency = original_group(text, match)
+                result["currency"] = _CURRENCY_SYMBOLS.get(currency, currency)
                 break
                 
         return result
         
-    def _parse_date(self, date_str: str) -> str:
-        """Parse a date string into YYYY-MM-DD format."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_date(date_str: str) -> str:
+        """Parse a date string into YYYY-MM-DD format (cached; dateutil is slow)."""
+        # Plain day-first numeric dates are built directly; dateutil is only
+        # needed for everything else
+        match = _DAY_FIRST_DATE_RX.fullmatch(date_str)
+        if match:
+            day, month, year = map(int, match.groups())
+            try:
+                return datetime(year, month, day).strftime("%Y-%m-%d")
+            except ValueError:
+                pass  # e.g. MM/DD order; let dateutil resolve it
+        
+        # Written-out months are unambiguous; dateutil would also turn a
+        # year below 100 into one of this century, so those are left to it
+        match = _MONTH_DATE_RX.fullmatch(date_str)
+        if match:
+            day, month_name, year = match.group(1, 2, 3) if match.group(1) else match.group(5, 4, 6)
+            month = _MONTHS.get(month_name.lower())
+            if month and int(year) >= 100:
+                try:
+                    return datetime(int(year), month, int(day)).strftime("%Y-%m-%d")
+                except ValueError:
+                    pass
+        
         from dateutil import parser
         try:
             date_obj = parser.parse(date_str, dayfirst=True, yearfirst=False)
@@ -168,138 +393,95 @@ class EnglishExtractor(DataExtractor):
             "buyer": {"name": "", "address": "", "tax_id": "", "email": "", "phone": ""}
         }
         
-        # Common patterns for company information
-        company_patterns = [
-            r"(?i)(?:seller|vendor|provider|from)[\s:]*([\s\S]*?)(?=(?:buyer|client|customer|to)|$)",
-            r"(?i)(?:bill to|invoice to|sold to)[\s:]*([\s\S]*?)(?=(?:ship to|$))"
-        ]
-        
         # Extract seller and buyer sections
         seller_text = ""
         buyer_text = ""
         
-        for pattern in company_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.DOTALL)
-            for i, match in enumerate(matches):
+        lower = fold_case(text)
+        for starts, stops in _SECTION_KEYWORDS:
+            sections = _find_sections(text, lower, starts, stops)
+            # The first section describes the seller, the second the buyer
+            for i, section in enumerate(itertools.islice(sections, 2)):
                 if i == 0:
-                    seller_text += "\n" + match.group(1).strip()
-                elif i == 1:
-                    buyer_text += "\n" + match.group(1).strip()
-        
-        # Extract company names
-        name_patterns = [
-            r"^([^\n]{5,}?)\s*(?:\n|$)",
-            r"(?:company|business|trading as|t/a|d/b/a|doing business as)[\s:]*([^\n]+)"
-        ]
+                    seller_text += "\n" + section.strip()
+                else:
+                    buyer_text += "\n" + section.strip()
         
-        # Extract seller info
         if seller_text:
-            # Extract name
-            for pattern in name_patterns:
-                match = re.search(pattern, seller_text, re.IGNORECASE)
-                if match:
-                    result["seller"]["name"] = match.group(1).strip()
-                    break
-            
-            # Extract tax ID (VAT, GST, etc.)
-            tax_patterns = [
-                r"(?:VAT|GST|TAX|Tax\s*ID|VAT\s*ID|VAT\s*No\.?|Tax\s*No\.?)[\s:]*([A-Z0-9\s-]+)",
-                r"(?:Registration\s*No\.?|Reg\.?\s*No\.?|Reg\s*No\.?)[\s:]*([A-Z0-9\s-]+)"
-            ]
-            
-            for pattern in tax_patterns:
-                match = re.search(pattern, seller_text, re.IGNORECASE)
-                if match:
-                    result["seller"]["tax_id"] = match.group(1).strip()
-                    break
-            
-            # Extract address
-            address_match = re.search(r"(\d+[^\n]{10,}?)(?=\n\s*\n|\Z)", seller_text, re.DOTALL)
-            if address_match:
-                result["seller"]["address"] = "\n".join(
-                    line.strip() for line in address_match.group(1).split("\n")
-                    if line.strip()
-                )
-            
-            # Extract contact info
-            email_match = re.search(r"([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)", seller_text)
-            if email_match:
-                result["seller"]["email"] = email_match.group(1)
-                
-            phone_match = re.search(r"(\+?[\d\s-]{8,})", seller_text)
-            if phone_match:
-                result["seller"]["phone"] = phone_match.group(1).strip()
-        
-        # Extract buyer info (similar to seller)
+            self._extract_party_details(seller_text, result["seller"])
         if buyer_text:
-            for pattern in name_patterns:
-                match = re.search(pattern, buyer_text, re.IGNORECASE)
-                if match:
-                    result["buyer"]["name"] = match.group(1).strip()
-                    break
-            
-            tax_patterns = [
-                r"(?:VAT|GST|TAX|Tax\s*ID|VAT\s*ID|VAT\s*No\.?|Tax\s*No\.?)[\s:]*([A-Z0-9\s-]+)",
-                r"(?:Registration\s*No\.?|Reg\.?\s*No\.?|Reg\s*No\.?)[\s:]*([A-Z0-9\s-]+)"
-            ]
-            
-            for pattern in tax_patterns:
-                match = re.search(pattern, buyer_text, re.IGNORECASE)
-                if match:
-                    result["buyer"]["tax_id"] = match.group(1).strip()
-                    break
-            
-            address_match = re.search(r"(\d+[^\n]{10,}?)(?=\n\s*\n|\Z)", buyer_text, re.DOTALL)
-            if address_match:
-                result["buyer"]["address"] = "\n".join(
-                    line.strip() for line in address_match.group(1).split("\n")
-                    if line.strip()
-                )
-            
-            email_match = re.search(r"([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)", buyer_text)
-            if email_match:
-                result["buyer"]["email"] = email_match.group(1)
-                
-            phone_match = re.search(r"(\+?[\d\s-]{8,})", buyer_text)
-            if phone_match:
-                result["buyer"]["phone"] = phone_match.group(1).strip()
+            self._extract_party_details(buyer_text, result["buyer"])
         
         return result
 
+    def _extract_party_details(self, party_text: str, party: Dict[str, str]) -> None:
+        """Fill name, tax ID, address and contact details of one party."""
+        patterns = self.patterns
+        lower = fold_case(party_text)
+
+        # Extract name
+        for pattern in patterns["company_name"]:
+            match = pattern.search(lower)
+            if match:
+                party["name"] = original_group(party_text, match).strip()
+                break
+        
+        # Extract tax ID (VAT, GST, etc.)
+        for pattern in patterns["tax_id"]:
+            match = pattern.search(lower)
+            if match:
+                party["tax_id"] = original_group(party_text, match).strip()
+                break
+        
+        # Extract address
+        address_match = patterns["address"].search(party_text)
+        if address_match:
+            party["address"] = "\n".join(
+                line.strip() for line in address_match.group(1).split("\n")
+                if line.strip()
+            )
+        
+        # Extract contact info
+        email_match = patterns["email"].search(party_text)
+        if email_match:
+            party["email"] = email_match.group(1)
+            
+        phone_match = patterns["phone"].search(party_text)
+        if phone_match:
+            party["phone"] = phone_match.group(1).strip()
+
     def _extract_items(self, text: str, language: str) -> List[Dict[str, Any]]:
         """Extract line items from the document."""
         items = []
-        
-        # Common patterns for item tables
-        item_patterns = [
-            # Table with headers: Qty, Description, Unit Price, Amount
-            r"(?:Qty|Quantity).*?(?:Description|Item).*?(?:Unit Price|Price).*?(?:Amount|Total)([\s\S]*?)(?=\n\s*\n|Subtotal|Total|$)",
-            # Simple item lines: 1 x Product Name @ $10.00 = $10.00
-            r"(\d+)\s*[x×]\s*([^@\n]+?)@\s*([$€£¥]?\s*\d+(?:\.\d{2})?)\s*[=]\s*([$€£¥]?\s*\d+(?:\.\d{2})?)",
-            # Just item and price: Product Name $10.00
-            r"(?m)^\s*([^\n]{5,}?)\s+([$€£¥]?\s*\d+(?:\.\d{2})?)\s*$"
-        ]
-        
-        for pattern in item_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if len(match.groups()) >= 4:
+        lower = fold_case(text)
+        if not _may_match(lower, "line_item"):
+            return items
+        
+        for pattern in self.patterns["line_item"]:
+            # Patterns with fewer than three groups never yield an item, so
+            # don't scan the whole document for them
+            if pattern.groups < 3:
+                continue
+            # Every match has as many groups as its pattern, so the row
+            # format is settled once per pattern rather than per match
+            table_format = pattern.groups >= 4
+            for match in pattern.finditer(lower):
+                if table_format:
                     # Table format
                     item = {
                         "quantity": match.group(1).strip(),
-                        "description": match.group(2).strip(),
+                        "description": original_group(text, match, 2).strip(),
                         "unit_price": match.group(3).replace("$", "").replace(",", "").strip(),
                         "amount": match.group(4).replace("$", "").replace(",", "").strip()
                     }
-                elif len(match.groups()) == 3:
+                else:
                     # Simple item format
+                    price = match.group(2).replace("$", "").replace(",", "").strip()
                     item = {
-                        "description": match.group(1).strip(),
-                        "unit_price": match.group(2).replace("$", "").replace(",", "").strip(),
-                        "amount": match.group(2).replace("$", "").replace(",", "").strip()
+                        "description": original_group(text, match).strip(),
+                        "unit_price": price,
+                        "amount": price
                     }
-                else:
-                    continue
                 
                 # Clean up the values
                 try:
@@ -318,23 +500,30 @@ class EnglishExtractor(DataExtractor):
                     item["amount"] = 0.0
                 
                 items.append(item)
+
+            # Like the Polish extractor, the first pattern that yields items
+            # wins; later alternatives would only add conflicting rows
+            if items:
+                break
         
         return items
 
-    def _extract_totals(self, text: str, language: str) -> Dict[str, float]:
-        """Extract financial totals."""
+    def _extract_totals(
+        self, text: str, language: str, items: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, float]:
+        """Extract financial totals.
+
+        ``items`` are the line items already extracted from the same text;
+        they are only extracted again when not given.
+        """
         result = {"subtotal": 0.0, "tax_amount": 0.0, "total": 0.0, "tax_rate": 0.0}
         
-        # Patterns for different total types
-        patterns = [
-            ("subtotal", r"(?:Subtotal|Sub-total|Total before tax)[\s:]*[$€£¥]?\s*(\d+(?:[.,]\d{2})?)"),
-            ("tax_amount", r"(?:Tax|VAT|GST|Sales Tax)[\s:]*[$€£¥]?\s*(\d+(?:[.,]\d{2})?)"),
-            ("tax_rate", r"(?:Tax|VAT|GST|Sales Tax)[\s:]*\(?(\d+(?:\.\d+)?)%\)?[\s:]*[$€£¥]?\s*(?:\d+(?:[.,]\d{2})?)?"),
-            ("total", r"(?:Total|Amount Due|Balance Due|Grand Total)[\s:]*[$€£¥]?\s*(\d+(?:[.,]\d{2})?)")
-        ]
-        
-        for field, pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        lower = fold_case(text)
+        for field, pattern in self.patterns["totals"]:
+            start = _first_keyword(lower, field)
+            if start is None:
+                continue
+            match = pattern.search(lower, start)
             if match:
                 try:
                     value = float(match.group(1).replace(",", "."))
@@ -345,7 +534,8 @@ class EnglishExtractor(DataExtractor):
         # If we have items but no subtotal, calculate it
         if "subtotal" not in result or result["subtotal"] == 0.0:
             # Try to get subtotal from items
-            items = self._extract_items(text, language)
+            if items is None:
+                items = self._extract_items(text, language)
             if items:
                 subtotal = sum(item.get("amount", 0) for item in items)
                 if subtotal > 0:
@@ -372,44 +562,34 @@ class EnglishExtractor(DataExtractor):
             "iban": ""
         }
         
+        patterns = self.patterns
+        lower = fold_case(text)
+
         # Payment terms
-        terms_patterns = [
-            r"(?:Payment Terms|Terms)[\s:]*([^\n]+)",
-            r"(?:Net|Due)[\s:]*([^\n]+)"
-        ]
-        
-        for pattern in terms_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in patterns["payment_terms"]:
+            match = pattern.search(lower)
             if match:
-                result["payment_terms"] = match.group(1).strip()
+                result["payment_terms"] = original_group(text, match).strip()
                 break
         
         # Payment method
-        payment_methods = [
-            ("credit_card", r"(?:Visa|MasterCard|Amex|American Express|Discover|Credit Card|Debit Card)"),
-            ("bank_transfer", r"(?:Bank Transfer|Wire Transfer|SEPA|ACH|IBAN|SWIFT)"),
-            ("paypal", r"Pay(?:\s*|-)Pal"),
-            ("check", r"Check|Cheque")
-        ]
-        
-        for method, pattern in payment_methods:
-            if re.search(pattern, text, re.IGNORECASE):
+        for method, pattern in patterns["payment_method"]:
+            if not _may_match(lower, method):
+                continue
+            # Any word of a literal method is a match of its pattern, so
+            # finding one with str.find is enough
+            if method in _PAYMENT_METHOD_WORDS or pattern.search(lower):
                 result["payment_method"] = method
                 break
         
         # Bank account details
-        bank_patterns = [
-            ("bank_name", r"Bank[\s:]*([^\n]+?)(?=\n|$)"),
-            ("account_number", r"(?:Account|Acc\.?|A\/C)[\s:]*([A-Z0-9\s-]+)(?=\s|$)"),
-            ("routing_number", r"(?:Routing|RTN|ABA|Routing No\.?)[\s:]*([0-9A-Z\s-]+)(?=\s|$)"),
-            ("swift_code", r"(?:SWIFT|BIC|SWIFT Code|BIC Code)[\s:]*([A-Z0-9]{8,11})(?=\s|$)"),
-            ("iban", r"(?:IBAN|International Bank Account Number)[\s:]*([A-Z]{2}[0-9A-Z\s-]{10,30})(?=\s|$)")
-        ]
-        
-        for field, pattern in bank_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for field, pattern in patterns["bank_details"]:
+            start = _first_keyword(lower, field)
+            if start is None:
+                continue
+            match = pattern.search(lower, start)
             if match:
-                result[field] = match.group(1).strip()
+                result[field] = original_group(text, match).strip()
         
         # Clean up empty values
         return {k: v for k, v in result.items() if v}
@@ -421,6 +601,15 @@ class EnglishExtractor(DataExtractor):
         return DataExtractor._detect_language(self, text)
 
     def extract_invoice_data(self, text: str, document_type: str = "invoice") -> dict:
+        """Extract structured data from invoice text.
+
+        Args:
+            text: Raw text from OCR
+            document_type: Type of document (e.g., "invoice", "receipt")
+
+        Returns:
+            Dict containing structured invoice data
+        """
         language = self._detect_language(text)
         data = {}
         data.update(self._extract_basic_info(text, language))
@@ -428,7 +617,7 @@ class EnglishExtractor(DataExtractor):
         data["seller"] = parties.get("seller", {})
         data["buyer"] = parties.get("buyer", {})
         data["items"] = self._extract_items(text, language)
-        data["totals"] = self._extract_totals(text, language)
+        data["totals"] = self._extract_totals(text, language, data["items"])
         data.update(self._extract_payment_info(text, language))
         data["_metadata"] = {
             "extraction_timestamp": datetime.utcnow().isoformat(),
@@ -442,6 +631,6 @@ class EnglishExtractor(DataExtractor):
         result = self._extract_basic_info(text, language)
         result["parties"] = self._extract_parties(text, language)
         result["items"] = self._extract_items(text, language)
-        result["totals"] = self._extract_totals(text, language)
+        result["totals"] = self._extract_totals(text, language, result["items"])
         result["payment_info"] = self._extract_payment_info(text, language)
         return result
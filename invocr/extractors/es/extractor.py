@@ -1,16 +1,46 @@
 """
 Spanish language extractor implementation.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern
 import re
-from datetime import datetime
 import logging
 
 from invocr.core.extractor import DataExtractor
+from invocr.utils.helpers import fold_case, original_group
+
+# Extraction patterns, keyed by the field they extract. They are written in
+# lowercase and run on the case-folded text (see fold_case()), which is
+# cheaper than IGNORECASE; values are then sliced from the original text
+_SPANISH_PATTERNS_RAW = {
+    "document_number": r'(?:n[úu]mero|n[úu]m\.?|factura)[\s:]*([a-z0-9\-/]+)',
+    "issue_date": r'(?:fecha de emisi[óo]n|fecha)[\s:]*([0-9]{1,2}[-/][0-9]{1,2}[-/][0-9]{2,4})',
+    "due_date": r'(?:fecha de vencimiento|vencimiento|pagar antes de)[\s:]*([0-9]{1,2}[-/][0-9]{1,2}[-/][0-9]{2,4})',
+    "currency": r'(?:moneda|importe en)[\s:]*([a-z]{3})',
+    "seller_name": r'(?:emisor|vendedor|proveedor|empresa)[\s:]*([^\n]+)(?:\n\s*[a-z0-9\s,.-]+){2,}',
+    "seller_tax_id": r'(?:nif|cif|nif\/cif)[\s:]*([a-z][0-9a-z][0-9]{7}|[0-9]{8}[a-z])',
+    "buyer_name": r'(?:receptor|cliente|comprador)[\s:]*([^\n]+)(?:\n\s*[a-z0-9\s,.-]+){2,}',
+    "line_item": r'(\d+[\.,]?\d*)\s+x\s+([^\n]+?)\s+(\d+[\s,.]\d{2})\s+[a-z]{3}\s+(\d+[\s,.]\d{2})',
+    "net_amount": r'(?:base imponible|importe neto)[\s:]*([\d\s,.-]+)\s*[a-z]{3}',
+    "tax_amount": r'(?:total iva|importe del iva|iva\s*\d+%?)[\s:]*([\d\s,.-]+)\s*[a-z]{3}',
+    "tax_rate": r'(?:tipo\s+)?(?:iva|tasa)[\s:]*(\d+)[\s%]*',
+    "total_amount": r'total(?: factura| a pagar| general)[\s:]*([\d\s,.-]+)\s*([a-z]{3})',
+    "payment_method": r'(?:forma de pago|método de pago|pago)[\s:]*([^\n]+)',
+    "bank_account": r'(?:iban|cuenta bancaria|n[úu]mero de cuenta)[\s:]*([a-z]{2}[0-9]{2}(?:[ \t]*[0-9a-z]){11,30})',
+    "bic": r'(?:bic|swift|código swift)[\s:]*([a-z0-9]{8,11})',
+    "payment_terms": r'(?:términos de pago|condiciones de pago|pago a)[\s:]*([^\n]+)',
+    "payment_terms_days": r'(\d+)\s*(?:d[ií]as|d[ií]a)',
+}
+
+# Compiled once at import and shared by every SpanishExtractor instance
+_SPANISH_PATTERNS = {
+    field: re.compile(pattern) for field, pattern in _SPANISH_PATTERNS_RAW.items()
+}
 
 class SpanishExtractor(DataExtractor):
     """Spanish language extractor implementation."""
 
+    DEFAULT_LANGUAGE = "es"
+
     def __init__(self, languages=None):
         """Initialize the Spanish extractor with supported languages.
 
@@ -19,6 +49,11 @@ class SpanishExtractor(DataExtractor):
         """
         super().__init__(languages or ["es"])
         self.logger = logging.getLogger(__name__)
+        self.patterns = self._load_extraction_patterns()
+
+    def _load_extraction_patterns(self) -> Dict[str, Pattern]:
+        """Return the Spanish extraction patterns, keyed by the field they extract."""
+        return _SPANISH_PATTERNS
 
     def extract_invoice_data(self, text: str, document_type: str = "invoice") -> Dict[str, Any]:
         """Extract structured data from Spanish invoice text.
@@ -34,8 +69,8 @@ class SpanishExtractor(DataExtractor):
         self.logger.debug(f"Raw text input (first 500 chars): {text[:500]}")
         result = self._get_document_template(document_type)
         
-        # Detect language if not specified
-        language = self._detect_language(text)
+        # Only detect the language if this extractor does not fix it
+        language = self.DEFAULT_LANGUAGE or self._detect_language(text)
         self.logger.debug(f"Detected language: {language}")
         
         # Extract basic info
@@ -70,39 +105,28 @@ class SpanishExtractor(DataExtractor):
         
     def _extract_basic_info(self, text: str, language: str) -> Dict[str, Any]:
         """Extract basic invoice information."""
+        lower = fold_case(text)
         result = {}
         
         # Document number (Número de factura)
-        doc_number_match = re.search(
-            r'(?i)(?:N[úu]mero|N[úu]m\.?|Factura)[\s:]*([A-Z0-9\-/]+)', 
-            text
-        )
+        doc_number_match = self.patterns["document_number"].search(lower)
         if doc_number_match:
-            result["document_number"] = doc_number_match.group(1).strip()
+            result["document_number"] = original_group(text, doc_number_match).strip()
         
         # Issue date (Fecha de emisión)
-        issue_date_match = re.search(
-            r'(?i)(?:Fecha de emisi[óo]n|Fecha)[\s:]*([0-9]{1,2}[-/][0-9]{1,2}[-/][0-9]{2,4})', 
-            text
-        )
+        issue_date_match = self.patterns["issue_date"].search(lower)
         if issue_date_match:
             result["issue_date"] = self._parse_date(issue_date_match.group(1))
             
         # Due date (Fecha de vencimiento)
-        due_date_match = re.search(
-            r'(?i)(?:Fecha de vencimiento|Vencimiento|Pagar antes de)[\s:]*([0-9]{1,2}[-/][0-9]{1,2}[-/][0-9]{2,4})', 
-            text
-        )
+        due_date_match = self.patterns["due_date"].search(lower)
         if due_date_match:
             result["due_date"] = self._parse_date(due_date_match.group(1))
             
         # Currency (Moneda)
-        currency_match = re.search(
-            r'(?i)(?:Moneda|Importe en)[\s:]*([A-Z]{3})', 
-            text
-        )
+        currency_match = self.patterns["currency"].search(lower)
         if currency_match:
-            result["currency"] = currency_match.group(1)
+            result["currency"] = original_group(text, currency_match)
         else:
             # Default to EUR for Spanish invoices
             result["currency"] = "EUR"
@@ -111,47 +135,37 @@ class SpanishExtractor(DataExtractor):
         
     def _extract_parties(self, text: str, language: str) -> Dict[str, Any]:
         """Extract seller and buyer information."""
+        lower = fold_case(text)
         result = {"seller": {}, "buyer": {}}
         
         # Extract seller name (Emisor/Vendedor)
-        seller_name_match = re.search(
-            r'(?i)(?:Emisor|Vendedor|Proveedor|Empresa)[\s:]*([^\n]+)(?:\n\s*[A-Z0-9\s,.-]+){2,}', 
-            text
-        )
+        seller_name_match = self.patterns["seller_name"].search(lower)
         if seller_name_match:
-            result["seller"]["name"] = seller_name_match.group(1).strip()
+            result["seller"]["name"] = original_group(text, seller_name_match).strip()
             
         # Extract seller tax ID (NIF/CIF)
-        tax_id_match = re.search(
-            r'(?i)(?:NIF|CIF|NIF\/CIF)[\s:]*([A-Z][0-9A-Z][0-9]{7}|[0-9]{8}[A-Z])', 
-            text
-        )
+        tax_id_match = self.patterns["seller_tax_id"].search(lower)
         if tax_id_match:
-            result["seller"]["tax_id"] = tax_id_match.group(1).strip()
+            result["seller"]["tax_id"] = original_group(text, tax_id_match).strip()
             
         # Extract buyer name (Receptor/Cliente)
-        buyer_name_match = re.search(
-            r'(?i)(?:Receptor|Cliente|Comprador)[\s:]*([^\n]+)(?:\n\s*[A-Z0-9\s,.-]+){2,}', 
-            text
-        )
+        buyer_name_match = self.patterns["buyer_name"].search(lower)
         if buyer_name_match:
-            result["buyer"]["name"] = buyer_name_match.group(1).strip()
+            result["buyer"]["name"] = original_group(text, buyer_name_match).strip()
             
         return result
         
     def _extract_items(self, text: str, language: str) -> List[Dict[str, Any]]:
         """Extract line items from the invoice."""
+        lower = fold_case(text)
         items = []
         
         # Look for item patterns in the text
-        item_matches = re.finditer(
-            r'(?i)(\d+[\.,]?\d*)\s+x\s+([^\n]+?)\s+(\d+[\s,.]\d{2})\s+[A-Z]{3}\s+(\d+[\s,.]\d{2})',
-            text
-        )
+        item_matches = self.patterns["line_item"].finditer(lower)
         
         for match in item_matches:
             items.append({
-                "description": match.group(2).strip(),
+                "description": original_group(text, match, 2).strip(),
                 "quantity": float(match.group(1).replace(",", ".")),
                 "unit_price": float(match.group(3).replace(",", ".").replace(" ", "")),
                 "amount": float(match.group(4).replace(",", ".").replace(" ", "")),
@@ -161,104 +175,68 @@ class SpanishExtractor(DataExtractor):
         
     def _extract_totals(self, text: str, language: str) -> Dict[str, Any]:
         """Extract total amounts from the invoice."""
+        lower = fold_case(text)
         result = {}
         
         # Net amount (Base imponible)
-        net_match = re.search(
-            r'(?i)(?:Base imponible|Importe neto)[\s:]*([\d\s,.-]+)\s*[A-Z]{3}', 
-            text
-        )
+        net_match = self.patterns["net_amount"].search(lower)
         if net_match:
             result["net_amount"] = float(net_match.group(1).replace(" ", "").replace(".", "").replace(",", "."))
             
         # Tax amount (IVA/Impuestos)
-        tax_match = re.search(
-            r'(?i)(?:Total IVA|Importe del IVA|IVA\s*\d+%?)[\s:]*([\d\s,.-]+)\s*[A-Z]{3}', 
-            text
-        )
+        tax_match = self.patterns["tax_amount"].search(lower)
         if tax_match:
             result["tax_amount"] = float(tax_match.group(1).replace(" ", "").replace(".", "").replace(",", "."))
         
         # Tax rate (Tipo de IVA)
-        tax_rate_match = re.search(
-            r'(?i)(?:Tipo\s+)?(?:IVA|Tasa)[\s:]*(\d+)[\s%]*', 
-            text
-        )
+        tax_rate_match = self.patterns["tax_rate"].search(lower)
         if tax_rate_match:
             result["tax_rate"] = float(tax_rate_match.group(1))
             
         # Total amount (Total factura)
-        total_match = re.search(
-            r'(?i)Total(?: factura| a pagar| general)[\s:]*([\d\s,.-]+)\s*([A-Z]{3})', 
-            text
-        )
+        total_match = self.patterns["total_amount"].search(lower)
         if total_match:
             result["total_amount"] = float(total_match.group(1).replace(" ", "").replace(".", "").replace(",", "."))
             if "currency" not in result:
-                result["currency"] = total_match.group(2)
+                result["currency"] = original_group(text, total_match, 2)
                 
         return result
         
     def _extract_payment_info(self, text: str, language: str) -> Dict[str, Any]:
         """Extract payment information."""
+        lower = fold_case(text)
         result = {}
         
         # Payment method (Forma de pago)
-        payment_method_match = re.search(
-            r'(?i)(?:Forma de pago|Método de pago|Pago)[\s:]*([^\n]+)', 
-            text
-        )
+        payment_method_match = self.patterns["payment_method"].search(lower)
         if payment_method_match:
-            result["payment_method"] = payment_method_match.group(1).strip()
+            result["payment_method"] = original_group(text, payment_method_match).strip()
             
         # Bank account (Cuenta bancaria)
-        iban_match = re.search(
-            r'(?i)(?:IBAN|Cuenta bancaria|N[úu]mero de cuenta)[\s:]*([A-Z]{2}\s*[0-9]{2}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{0,2})', 
-            text
-        )
+        iban_match = self.patterns["bank_account"].search(lower)
         if iban_match:
-            result["bank_account"] = iban_match.group(1).replace(" ", "")
+            # The capture may run on into the next word; cut it to the IBAN length
+            result["bank_account"] = self._trim_iban("".join(original_group(text, iban_match).split()))
+            if not self._validate_iban(result["bank_account"]):
+                self.logger.warning(f"IBAN checksum mismatch: {result['bank_account']}")
             
         # BIC/SWIFT
-        bic_match = re.search(
-            r'(?i)(?:BIC|SWIFT|Código SWIFT)[\s:]*([A-Z0-9]{8,11})', 
-            text
-        )
+        bic_match = self.patterns["bic"].search(lower)
         if bic_match:
-            result["bic"] = bic_match.group(1)
+            result["bic"] = original_group(text, bic_match)
             
         # Payment terms (Términos de pago)
-        terms_match = re.search(
-            r'(?i)(?:Términos de pago|Condiciones de pago|Pago a)[\s:]*([^\n]+)', 
-            text
-        )
+        terms_match = self.patterns["payment_terms"].search(lower)
         if terms_match:
             # Try to extract number of days
-            days_match = re.search(r'(\d+)\s*(?:d[ií]as|d[ií]a)', terms_match.group(1), re.IGNORECASE)
+            days_match = self.patterns["payment_terms_days"].search(terms_match.group(1))
             if days_match:
                 result["payment_terms_days"] = int(days_match.group(1))
             else:
-                result["payment_terms"] = terms_match.group(1).strip()
+                result["payment_terms"] = original_group(text, terms_match).strip()
             
         return result
         
-    def _parse_date(self, date_str: str) -> str:
-        """Parse date string into YYYY-MM-DD format."""
-        try:
-            # Handle different date separators
-            date_str = date_str.replace(".", "-").replace("/", "-")
-            # Try different date formats (Spanish format first)
-            for fmt in ("%d-%m-%Y", "%Y-%m-%d", "%d-%m-%y"):
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-            return date_str
-        except Exception as e:
-            self.logger.warning(f"Failed to parse date '{date_str}': {e}")
-            return date_str
-        
     def _validate_and_clean(self, data: Dict[str, Any]) -> None:
         """Validate and clean extracted data."""
         # Ensure required fields are present
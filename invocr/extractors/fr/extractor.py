@@ -1,16 +1,46 @@
 """
 French language extractor implementation.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Pattern
 import re
-from datetime import datetime
 import logging
 
 from invocr.core.extractor import DataExtractor
+from invocr.utils.helpers import fold_case, original_group
+
+# Extraction patterns, keyed by the field they extract. They are written in
+# lowercase and run on the case-folded text (see fold_case()), which is
+# cheaper than IGNORECASE; values are then sliced from the original text
+_FRENCH_PATTERNS_RAW = {
+    "document_number": r'(?:n[°º]|num[ée]ro|facture|ref)[\s:]*([a-z0-9\-/]+)',
+    "issue_date": r'(?:date\s+de\s+facturation|date\s+d\'émission|date)[\s:]*([0-9]{1,2}[-/][0-9]{1,2}[-/][0-9]{2,4})',
+    "due_date": r'(?:date\s+d\'[ée]ch[ée]ance|date\s+de\s+paiement|[ée]ch[ée]ance)[\s:]*([0-9]{1,2}[-/][0-9]{1,2}[-/][0-9]{2,4})',
+    "currency": r'(?:devise|montant en)[\s:]*([a-z]{3})',
+    "seller_name": r'(?:vendeur|fournisseur|soci[ée]t[ée]|entreprise)[\s:]*([^\n]+)(?:\n\s*[a-z0-9\s,.-]+){2,}',
+    "seller_tax_id": r'(?:siret|siren|tva|n° siret)[\s:]*([0-9\s]{14}|[0-9\s]{9})',
+    "buyer_name": r'(?:acheteur|client|destinataire)[\s:]*([^\n]+)(?:\n\s*[a-z0-9\s,.-]+){2,}',
+    "line_item": r'(\d+[\.,]?\d*)\s+x\s+([^\n]+?)\s+(\d+[\s,.]\d{2})\s+[a-z]{3}\s+(\d+[\s,.]\d{2})',
+    "net_amount": r'(?:montant ht|total ht|net [àa] payer)[\s:]*([\d\s,.-]+)\s*[a-z]{3}',
+    "tax_amount": r'(?:tva|montant tva|total tva)[\s:]*([\d\s,.-]+)\s*[a-z]{3}',
+    "tax_rate": r'(?:taux\s+)?(?:tva|tva\s*\d+%?)[\s:]*(\d+)[\s%]*',
+    "total_amount": r'total(?:\s+ttc|\s+[àa]\s+payer|\s+g[ée]n[ée]ral)?[\s:]*([\d\s,.-]+)\s*([a-z]{3})',
+    "payment_method": r'(?:mode de paiement|moyen de paiement|paiement)[\s:]*([^\n]+)',
+    "bank_account": r'(?:iban|r[ée]f[ée]rence bancaire|compte bancaire)[\s:]*([a-z]{2}[0-9]{2}(?:[ \t]*[0-9a-z]){11,30})',
+    "bic": r'(?:bic|swift|code banque)[\s:]*([a-z0-9]{8,11})',
+    "payment_terms": r'(?:conditions de paiement|modalit[ée]s de paiement|paiement sous)[\s:]*([^\n]+)',
+    "payment_terms_days": r'(\d+)\s*(?:jours|jour)',
+}
+
+# Compiled once at import and shared by every FrenchExtractor instance
+_FRENCH_PATTERNS = {
+    field: re.compile(pattern) for field, pattern in _FRENCH_PATTERNS_RAW.items()
+}
 
 class FrenchExtractor(DataExtractor):
     """French language extractor implementation."""
 
+    DEFAULT_LANGUAGE = "fr"
+
     def __init__(self, languages=None):
         """Initialize the French extractor with supported languages.
 
@@ -19,6 +49,11 @@ class FrenchExtractor(DataExtractor):
         """
         super().__init__(languages or ["fr"])
         self.logger = logging.getLogger(__name__)
+        self.patterns = self._load_extraction_patterns()
+
+    def _load_extraction_patterns(self) -> Dict[str, Pattern]:
+        """Return the French extraction patterns, keyed by the field they extract."""
+        return _FRENCH_PATTERNS
 
     def extract_invoice_data(self, text: str, document_type: str = "invoice") -> Dict[str, Any]:
         """Extract structured data from French invoice text.
@@ -34,8 +69,8 @@ class FrenchExtractor(DataExtractor):
         self.logger.debug(f"Raw text input (first 500 chars): {text[:500]}")
         result = self._get_document_template(document_type)
         
-        # Detect language if not specified
-        language = self._detect_language(text)
+        # Only detect the language if this extractor does not fix it
+        language = self.DEFAULT_LANGUAGE or self._detect_language(text)
         self.logger.debug(f"Detected language: {language}")
         
         # Extract basic info
@@ -70,39 +105,28 @@ class FrenchExtractor(DataExtractor):
         
     def _extract_basic_info(self, text: str, language: str) -> Dict[str, Any]:
         """Extract basic invoice information."""
+        lower = fold_case(text)
         result = {}
         
         # Document number (Numéro de facture)
-        doc_number_match = re.search(
-            r'(?i)(?:N[°º]|Num[ée]ro|Facture|Ref)[\s:]*([A-Z0-9\-/]+)',
-            text
-        )
+        doc_number_match = self.patterns["document_number"].search(lower)
         if doc_number_match:
-            result["document_number"] = doc_number_match.group(1).strip()
+            result["document_number"] = original_group(text, doc_number_match).strip()
         
         # Issue date (Date de facturation)
-        issue_date_match = re.search(
-            r'(?i)(?:Date\s+de\s+facturation|Date\s+d\'émission|Date)[\s:]*([0-9]{1,2}[-/][0-9]{1,2}[-/][0-9]{2,4})',
-            text
-        )
+        issue_date_match = self.patterns["issue_date"].search(lower)
         if issue_date_match:
             result["issue_date"] = self._parse_date(issue_date_match.group(1))
             
         # Due date (Date d'échéance)
-        due_date_match = re.search(
-            r'(?i)(?:Date\s+d\'[ée]ch[ée]ance|Date\s+de\s+paiement|[ée]ch[ée]ance)[\s:]*([0-9]{1,2}[-/][0-9]{1,2}[-/][0-9]{2,4})',
-            text
-        )
+        due_date_match = self.patterns["due_date"].search(lower)
         if due_date_match:
             result["due_date"] = self._parse_date(due_date_match.group(1))
             
         # Currency (Devise)
-        currency_match = re.search(
-            r'(?i)(?:Devise|Montant en)[\s:]*([A-Z]{3})', 
-            text
-        )
+        currency_match = self.patterns["currency"].search(lower)
         if currency_match:
-            result["currency"] = currency_match.group(1)
+            result["currency"] = original_group(text, currency_match)
         else:
             # Default to EUR for French invoices
             result["currency"] = "EUR"
@@ -111,47 +135,37 @@ class FrenchExtractor(DataExtractor):
         
     def _extract_parties(self, text: str, language: str) -> Dict[str, Any]:
         """Extract seller and buyer information."""
+        lower = fold_case(text)
         result = {"seller": {}, "buyer": {}}
         
         # Extract seller name (Vendeur/Fournisseur)
-        seller_name_match = re.search(
-            r'(?i)(?:Vendeur|Fournisseur|Soci[ée]t[ée]|Entreprise)[\s:]*([^\n]+)(?:\n\s*[A-Z0-9\s,.-]+){2,}', 
-            text
-        )
+        seller_name_match = self.patterns["seller_name"].search(lower)
         if seller_name_match:
-            result["seller"]["name"] = seller_name_match.group(1).strip()
+            result["seller"]["name"] = original_group(text, seller_name_match).strip()
             
         # Extract seller tax ID (SIRET/SIREN/TVA)
-        siret_match = re.search(
-            r'(?i)(?:SIRET|SIREN|TVA|N° SIRET)[\s:]*([0-9\s]{14}|[0-9\s]{9})', 
-            text
-        )
+        siret_match = self.patterns["seller_tax_id"].search(lower)
         if siret_match:
-            result["seller"]["tax_id"] = siret_match.group(1).replace(" ", "")
+            result["seller"]["tax_id"] = original_group(text, siret_match).replace(" ", "")
             
         # Extract buyer name (Acheteur/Client)
-        buyer_name_match = re.search(
-            r'(?i)(?:Acheteur|Client|Destinataire)[\s:]*([^\n]+)(?:\n\s*[A-Z0-9\s,.-]+){2,}', 
-            text
-        )
+        buyer_name_match = self.patterns["buyer_name"].search(lower)
         if buyer_name_match:
-            result["buyer"]["name"] = buyer_name_match.group(1).strip()
+            result["buyer"]["name"] = original_group(text, buyer_name_match).strip()
             
         return result
         
     def _extract_items(self, text: str, language: str) -> List[Dict[str, Any]]:
         """Extract line items from the invoice."""
+        lower = fold_case(text)
         items = []
         
         # Look for item patterns in the text
-        item_matches = re.finditer(
-            r'(?i)(\d+[\.,]?\d*)\s+x\s+([^\n]+?)\s+(\d+[\s,.]\d{2})\s+[A-Z]{3}\s+(\d+[\s,.]\d{2})',
-            text
-        )
+        item_matches = self.patterns["line_item"].finditer(lower)
         
         for match in item_matches:
             items.append({
-                "description": match.group(2).strip(),
+                "description": original_group(text, match, 2).strip(),
                 "quantity": float(match.group(1).replace(",", ".")),
                 "unit_price": float(match.group(3).replace(",", ".").replace(" ", "")),
                 "amount": float(match.group(4).replace(",", ".").replace(" ", "")),
@@ -161,104 +175,68 @@ class FrenchExtractor(DataExtractor):
         
     def _extract_totals(self, text: str, language: str) -> Dict[str, Any]:
         """Extract total amounts from the invoice."""
+        lower = fold_case(text)
         result = {}
         
         # Net amount (Montant HT)
-        net_match = re.search(
-            r'(?i)(?:Montant HT|Total HT|Net [àa] payer)[\s:]*([\d\s,.-]+)\s*[A-Z]{3}', 
-            text
-        )
+        net_match = self.patterns["net_amount"].search(lower)
         if net_match:
             result["net_amount"] = float(net_match.group(1).replace(" ", "").replace(",", "."))
             
         # Tax amount (TVA/Montant TVA)
-        tax_match = re.search(
-            r'(?i)(?:TVA|Montant TVA|Total TVA)[\s:]*([\d\s,.-]+)\s*[A-Z]{3}', 
-            text
-        )
+        tax_match = self.patterns["tax_amount"].search(lower)
         if tax_match:
             result["tax_amount"] = float(tax_match.group(1).replace(" ", "").replace(",", "."))
         
         # Tax rate (Taux de TVA)
-        tax_rate_match = re.search(
-            r'(?i)(?:Taux\s+)?(?:TVA|TVA\s*\d+%?)[\s:]*(\d+)[\s%]*', 
-            text
-        )
+        tax_rate_match = self.patterns["tax_rate"].search(lower)
         if tax_rate_match:
             result["tax_rate"] = float(tax_rate_match.group(1))
             
         # Total amount (Total TTC)
-        total_match = re.search(
-            r'(?i)Total(?:\s+TTC|\s+[àa]\s+payer|\s+g[ée]n[ée]ral)?[\s:]*([\d\s,.-]+)\s*([A-Z]{3})', 
-            text
-        )
+        total_match = self.patterns["total_amount"].search(lower)
         if total_match:
             result["total_amount"] = float(total_match.group(1).replace(" ", "").replace(",", "."))
             if "currency" not in result:
-                result["currency"] = total_match.group(2)
+                result["currency"] = original_group(text, total_match, 2)
                 
         return result
         
     def _extract_payment_info(self, text: str, language: str) -> Dict[str, Any]:
         """Extract payment information."""
+        lower = fold_case(text)
         result = {}
         
         # Payment method (Mode de paiement)
-        payment_method_match = re.search(
-            r'(?i)(?:Mode de paiement|Moyen de paiement|Paiement)[\s:]*([^\n]+)', 
-            text
-        )
+        payment_method_match = self.patterns["payment_method"].search(lower)
         if payment_method_match:
-            result["payment_method"] = payment_method_match.group(1).strip()
+            result["payment_method"] = original_group(text, payment_method_match).strip()
             
         # Bank account (Coordonnées bancaires)
-        iban_match = re.search(
-            r'(?i)(?:IBAN|R[ée]f[ée]rence bancaire|Compte bancaire)[\s:]*([A-Z]{2}\s*[0-9]{2}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{4}\s*[0-9]{0,2})', 
-            text
-        )
+        iban_match = self.patterns["bank_account"].search(lower)
         if iban_match:
-            result["bank_account"] = iban_match.group(1).replace(" ", "")
+            # The capture may run on into the next word; cut it to the IBAN length
+            result["bank_account"] = self._trim_iban("".join(original_group(text, iban_match).split()))
+            if not self._validate_iban(result["bank_account"]):
+                self.logger.warning(f"IBAN checksum mismatch: {result['bank_account']}")
             
         # BIC/SWIFT
-        bic_match = re.search(
-            r'(?i)(?:BIC|SWIFT|Code banque)[\s:]*([A-Z0-9]{8,11})', 
-            text
-        )
+        bic_match = self.patterns["bic"].search(lower)
         if bic_match:
-            result["bic"] = bic_match.group(1)
+            result["bic"] = original_group(text, bic_match)
             
         # Payment terms (Conditions de paiement)
-        terms_match = re.search(
-            r'(?i)(?:Conditions de paiement|Modalit[ée]s de paiement|Paiement sous)[\s:]*([^\n]+)', 
-            text
-        )
+        terms_match = self.patterns["payment_terms"].search(lower)
         if terms_match:
             # Try to extract number of days
-            days_match = re.search(r'(\d+)\s*(?:jours|jour)', terms_match.group(1), re.IGNORECASE)
+            days_match = self.patterns["payment_terms_days"].search(terms_match.group(1))
             if days_match:
                 result["payment_terms_days"] = int(days_match.group(1))
             else:
-                result["payment_terms"] = terms_match.group(1).strip()
+                result["payment_terms"] = original_group(text, terms_match).strip()
             
         return result
         
-    def _parse_date(self, date_str: str) -> str:
-        """Parse date string into YYYY-MM-DD format."""
-        try:
-            # Handle different date separators
-            date_str = date_str.replace(".", "-").replace("/", "-")
-            # Try different date formats (French format first)
-            for fmt in ("%d-%m-%Y", "%Y-%m-%d", "%d-%m-%y"):
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-            return date_str
-        except Exception as e:
-            self.logger.warning(f"Failed to parse date '{date_str}': {e}")
-            return date_str
-        
     def _validate_and_clean(self, data: Dict[str, Any]) -> None:
         """Validate and clean extracted data."""
         # Ensure required fields are present
@@ -7,6 +7,85 @@ from datetime import datetime
 import logging
 
 from invocr.core.extractor import DataExtractor
+from invocr.utils.helpers import RE2_AVAILABLE, AsciiRe2Pattern, fold_case, keep_numeric
+
+
+def _compile_pattern(pattern: str, flags: int = 0):
+    """Compile a pattern scanned over the whole document, with RE2 when installed.
+
+    Flat OCR output often comes without Polish letters; RE2 then searches
+    the encoded text in linear time. On text with Polish letters RE2 would
+    re-encode it and map offsets back on every call, which is slower than re.
+    """
+    if RE2_AVAILABLE:
+        return AsciiRe2Pattern(pattern, flags, fallback=re.compile(pattern, flags))
+    return re.compile(pattern, flags)
+
+
+# Flat OCR layout read by extract_invoice_data; most run on the lowercased text
+_FLAT_NUMBER_RX = _compile_pattern(r"nr faktury\s*([0-9]+)")
+_FLAT_ISSUE_DATE_RX = _compile_pattern(r"data\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4})")
+_FLAT_DUE_DATE_RX = _compile_pattern(r"termin wymagalnosci\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4})")
+_FLAT_BUYER_RX = re.compile(r"klient\s+(.+?)(?=\d{2}-\d{3}|nip[:\s]*[0-9]{10}|nr vat[:\s]*[A-Z0-9]+|polska)", re.IGNORECASE)
+_FLAT_NIP_RX = _compile_pattern(r"nip[:\s]*([0-9]{10})", re.IGNORECASE)
+_FLAT_PLN_AMOUNT_RX = _compile_pattern(r"pln[\s:]*([0-9]+[\.,][0-9]{2})|([0-9]+[\.,][0-9]{2})[\s]*pln")
+_FLAT_IBAN_RX = _compile_pattern(r"iban[:\s]*([a-z0-9]+)")
+_FLAT_SWIFT_RX = _compile_pattern(r"swift[:\s]*([a-z0-9]+)")
+
+# Basic info
+_DOCUMENT_NUMBER_RX = _compile_pattern(r'(?i)(?:nr|numer|faktura)[\s]*(?:faktury)?[\s:]*([A-Z0-9-]+)')
+_ISSUE_DATE_RX = _compile_pattern(r'(?i)(?:data|data wystawienia|data sprzedaży)[\s:]*([0-9]{1,2}[-/.][0-9]{1,2}[-/.][0-9]{2,4})')
+_DUE_DATE_RX = _compile_pattern(r'(?i)(?:termin[\s]+wymagalności|termin płatności|zapłacono do)[\s:]*([0-9]{1,2}[-/.][0-9]{1,2}[-/.][0-9]{2,4})')
+_CURRENCY_RX = _compile_pattern(r'(?i)(?:płatność w|kwota w|waluta):?\s*([A-Z]{3})')
+
+# Parties
+_SELLER_RX = re.compile(r'(?i)(?:sprzedawca|sprzedaż):?\s*([^\n]+)(?:\n\s*[^\n]*){0,3}?\n\s*NIP:\s*(\d{10}|\d{3}-\d{3}-\d{2}-\d{2})')
+_NIP_RX = _compile_pattern(r'(?i)NIP\s*:?\s*([A-Z]{2}?\s*\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d?)')
+_VAT_NUMBER_RX = _compile_pattern(r'(?i)Nr\s*VAT\s*:?\s*([A-Z]{2}?\s*\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d?)')
+_NON_ALNUM_RX = re.compile(r'[^A-Za-z0-9]')
+
+# Buyer block: the lines after "KLIENT" up to the first tax ID or totals label
+_BUYER_SECTION_RX = re.compile(
+    r'(?i)KLIENT\s*\n(.+?)(?=\s*(?:NIP|Nr\s*VAT|Nr\s*wpisu|Suma|Razem|$))',
+    re.DOTALL
+)
+_BUYER_NAME_RX = re.compile(r'KLIENT\s*\n([^\n]+)', re.IGNORECASE)
+# Up to three address lines, matched right after an occurrence of the buyer name
+_ADDRESS_AFTER_NAME_RX = re.compile(
+    r'(?i)\s*\n([^\n]+(?:\n[^\n]+){0,2}?)(?=\s*(?:NIP|Nr\s*VAT|Suma|Razem|$))',
+    re.DOTALL
+)
+_ADDRESS_TAX_INFO_RX = re.compile(r'\s*(?:NIP|VAT|REGON|KRS|Nr\s*wpisu)\s*:?\s*[\d\-\sA-Za-z]*', re.IGNORECASE)
+_WHITESPACE_RX = re.compile(r'\s+')
+_TRAILING_PUNCTUATION_RX = re.compile(r'[\s,.;]+$')
+
+# Items section, with a looser header as fallback
+_ITEMS_SECTION_PATTERNS = tuple(re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    r'(?i)(?:produkt/usługa|towar/usługa|nazwa towaru/usługi).*?\n(?:.*\n){0,2}?(.*?)\n\s*(?:suma|razem|podsumowanie|podliczenie|kwota)',
+    r'(?i)(?:produkt|usługa|nazwa).*?\n(?:.*\n){0,2}?(.*?)\n\s*(?:suma|razem|podsumowanie|podliczenie|kwota)',
+))
+_ITEM_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # Pattern: Description [whitespace] Price [whitespace] Qty [whitespace] Tax% [whitespace] Amount
+    r'(?m)^(.+?)\s{2,}(\d+[\s,.]\d{2})\s+(\d+)\s*(?:\([^)]+\))?\s*(\d+%)\s+(\d+[\s,.]\d{2})',
+    # Pattern: Description [whitespace] Amount [currency]
+    r'(?m)^(.+?)\s{2,}(\d+[\s,.]\d{2})\s*([A-Z]{3})',
+    # Pattern: Just description and amount (most basic)
+    r'(?m)^(.+?)\s{2,}(\d+[\s,.]\d{2})'
+))
+
+# Totals
+_TOTAL_RX = _compile_pattern(r'(?i)Kwota\s+taczna\s+faktury\s*[^\d]*?([\d\s,]+(?:\.[\d\s]+)?)\s*PLN')
+_TOTAL_FALLBACK_RX = _compile_pattern(r'(?i)(?:kwota\s+łączna\s+faktur[^\d]*|razem\s+do\s+zapłaty\s*:?\s*)(?:[A-Z]{3})?\s*([\d\s,]+(?:\.[\d\s]+)?)')
+_SUBTOTAL_RX = _compile_pattern(r'(?i)Suma\s+bez\s+VAT\s+0%\s+([\d\s,]+(?:\.[\d\s]+)?)')
+_TAX_RX = _compile_pattern(r'(?i)VAT\s+0%\s+([\d\s,]+(?:\.[\d\s]+)?)')
+
+
+def _clean_address(address: str) -> str:
+    """Drop tax-related information, extra whitespace and trailing punctuation."""
+    address = _ADDRESS_TAX_INFO_RX.sub('', address)
+    address = _WHITESPACE_RX.sub(' ', address).strip()
+    return _TRAILING_PUNCTUATION_RX.sub('', address)
+
 
 class PolishExtractor(DataExtractor):
     """Polish language extractor implementation."""
@@ -27,16 +106,20 @@ class PolishExtractor(DataExtractor):
         result = self._get_document_template(document_type)
 
         text_lower = text.lower()
+        # Flat OCR text often comes without Polish letters, so they are no
+        # guard for this pass; the costlier searches below are skipped on
+        # their own when their label is missing, as on most other documents
+        folded = fold_case(text)
         # Invoice number
-        match = re.search(r"nr faktury\s*([0-9]+)", text_lower)
+        match = _FLAT_NUMBER_RX.search(text_lower)
         if match:
             result["document_number"] = match.group(1)
         # Issue date
-        match = re.search(r"data\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4})", text_lower)
+        match = _FLAT_ISSUE_DATE_RX.search(text_lower)
         if match:
             result["issue_date"] = self._parse_date(match.group(1))
         # Due date
-        match = re.search(r"termin wymagalnosci\s*([0-9]{2}\.[0-9]{2}\.[0-9]{4})", text_lower)
+        match = _FLAT_DUE_DATE_RX.search(text_lower)
         if match:
             result["due_date"] = self._parse_date(match.group(1))
         # Seller (Softreck OU)
@@ -49,11 +132,11 @@ class PolishExtractor(DataExtractor):
         # --- Buyer robust extraction ---
         buyer = {}
         # Pobierz buyer.name jako tekst po 'KLIENT' aż do pierwszego numeru lub słowa 'NIP'/'Nr VAT'/'Polska'
-        buyer_block = re.search(r"klient\s+(.+?)(?=\d{2}-\d{3}|nip[:\s]*[0-9]{10}|nr vat[:\s]*[A-Z0-9]+|polska)", text, re.IGNORECASE)
+        buyer_block = _FLAT_BUYER_RX.search(text) if "klient" in folded else None
         if buyer_block:
             buyer_name = buyer_block.group(1).strip().replace("\n", ", ")
             buyer["name"] = buyer_name
-        nip_match = re.search(r"nip[:\s]*([0-9]{10})", text, re.IGNORECASE)
+        nip_match = _FLAT_NIP_RX.search(text) if "nip" in folded else None
         if nip_match:
             buyer["tax_id"] = nip_match.group(1)
         if buyer:
@@ -61,14 +144,15 @@ class PolishExtractor(DataExtractor):
         # --- Items robust extraction ---
         items = []
         # Szukaj zarówno 'PLN xxx.xx' jak i 'xxx.xx PLN'
-        for m in re.finditer(r"pln[\s:]*([0-9]+[\.,][0-9]{2})|([0-9]+[\.,][0-9]{2})[\s]*pln", text_lower):
-            val = None
-            if m.group(1):
-                val = float(m.group(1).replace(",","."))
-            elif m.group(2):
-                val = float(m.group(2).replace(",","."))
-            if val and val > 1:
-                items.append({"description": "item", "quantity": 1, "unit_price": val, "amount": val})
+        if "pln" in text_lower:
+            for m in _FLAT_PLN_AMOUNT_RX.finditer(text_lower):
+                val = None
+                if m.group(1):
+                    val = float(m.group(1).replace(",","."))
+                elif m.group(2):
+                    val = float(m.group(2).replace(",","."))
+                if val and val > 1:
+                    items.append({"description": "item", "quantity": 1, "unit_price": val, "amount": val})
         if items:
             result["items"] = items
         # --- Totals robust extraction ---
@@ -88,8 +172,8 @@ class PolishExtractor(DataExtractor):
                 "currency": "PLN"
             }
         # Payment info (IBAN, SWIFT)
-        iban = re.search(r"iban[:\s]*([a-z0-9]+)", text_lower)
-        swift = re.search(r"swift[:\s]*([a-z0-9]+)", text_lower)
+        iban = _FLAT_IBAN_RX.search(text_lower)
+        swift = _FLAT_SWIFT_RX.search(text_lower)
         if iban:
             result["bank_account"] = iban.group(1).upper()
         if swift:
@@ -134,34 +218,22 @@ class PolishExtractor(DataExtractor):
         result = {}
         
         # Document number (numer faktury)
-        doc_number_match = re.search(
-            r'(?i)(?:nr|numer|faktura)[\s]*(?:faktury)?[\s:]*([A-Z0-9-]+)', 
-            text
-        )
+        doc_number_match = _DOCUMENT_NUMBER_RX.search(text)
         if doc_number_match:
             result["document_number"] = doc_number_match.group(1).strip()
         
         # Issue date (data)
-        issue_date_match = re.search(
-            r'(?i)(?:data|data wystawienia|data sprzedaży)[\s:]*([0-9]{1,2}[-/.][0-9]{1,2}[-/.][0-9]{2,4})', 
-            text
-        )
+        issue_date_match = _ISSUE_DATE_RX.search(text)
         if issue_date_match:
             result["issue_date"] = self._parse_date(issue_date_match.group(1))
             
         # Due date (termin płatności)
-        due_date_match = re.search(
-            r'(?i)(?:termin[\s]+wymagalności|termin płatności|zapłacono do)[\s:]*([0-9]{1,2}[-/.][0-9]{1,2}[-/.][0-9]{2,4})', 
-            text
-        )
+        due_date_match = _DUE_DATE_RX.search(text)
         if due_date_match:
             result["due_date"] = self._parse_date(due_date_match.group(1))
             
         # Currency (waluta)
-        currency_match = re.search(
-            r'(?i)(?:płatność w|kwota w|waluta):?\s*([A-Z]{3})', 
-            text
-        )
+        currency_match = _CURRENCY_RX.search(text)
         if currency_match:
             result["currency"] = currency_match.group(1)
         else:
@@ -175,39 +247,26 @@ class PolishExtractor(DataExtractor):
         result = {"seller": {}, "buyer": {}}
         
         # Extract seller information
-        seller_match = re.search(
-            r'(?i)(?:sprzedawca|sprzedaż):?\s*([^\n]+)(?:\n\s*[^\n]*){0,3}?\n\s*NIP:\s*(\d{10}|\d{3}-\d{3}-\d{2}-\d{2})',
-            text
-        )
+        seller_match = _SELLER_RX.search(text)
         if seller_match:
             result["seller"]["name"] = seller_match.group(1).strip()
             result["seller"]["tax_id"] = seller_match.group(2).replace("-", "")
             
         # Extract buyer information with more precise patterns for Softreck invoices
         # First, extract the buyer's tax ID (NIP) which is more reliably formatted
-        nip_match = re.search(
-            r'(?i)NIP\s*:?\s*([A-Z]{2}?\s*\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d?)',
-            text
-        )
+        nip_match = _NIP_RX.search(text)
         if nip_match:
-            result["buyer"]["tax_id"] = re.sub(r'[^A-Za-z0-9]', '', nip_match.group(1)).upper()
+            result["buyer"]["tax_id"] = _NON_ALNUM_RX.sub('', nip_match.group(1)).upper()
         
         # Extract VAT number if different from NIP
-        vat_match = re.search(
-            r'(?i)Nr\s*VAT\s*:?\s*([A-Z]{2}?\s*\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d[\s\-]?\d?)',
-            text
-        )
+        vat_match = _VAT_NUMBER_RX.search(text)
         if vat_match:
-            vat_num = re.sub(r'[^A-Za-z0-9]', '', vat_match.group(1)).upper()
+            vat_num = _NON_ALNUM_RX.sub('', vat_match.group(1)).upper()
             if not result["buyer"].get("tax_id") or vat_num != result["buyer"].get("tax_id", ""):
                 result["buyer"]["vat_number"] = vat_num
         
         # Extract buyer name and address - look for the text between KLIENT and NIP/VAT
-        buyer_section = re.search(
-            r'(?i)KLIENT\s*\n(.+?)(?=\s*(?:NIP|Nr\s*VAT|Nr\s*wpisu|Suma|Razem|$))',
-            text,
-            re.DOTALL
-        )
+        buyer_section = _BUYER_SECTION_RX.search(text)
         
         if buyer_section:
             buyer_text = buyer_section.group(1).strip()
@@ -220,37 +279,27 @@ class PolishExtractor(DataExtractor):
                 
                 # The rest is the address (if there are multiple lines)
                 if len(lines) > 1:
-                    # Join address lines and clean up
-                    address = ' '.join(lines[1:])
-                    # Remove any tax-related information
-                    address = re.sub(r'\s*(?:NIP|VAT|REGON|KRS|Nr\s*wpisu)\s*:?\s*[\d\-\sA-Za-z]*', '', address, flags=re.IGNORECASE)
-                    # Clean up multiple spaces and trim
-                    address = re.sub(r'\s+', ' ', address).strip()
-                    # Remove any trailing commas or other punctuation
-                    address = re.sub(r'[\s,.;]+$', '', address)
-                    result["buyer"]["address"] = address
+                    result["buyer"]["address"] = _clean_address(' '.join(lines[1:]))
         
         # If we still don't have a buyer name, try a simpler pattern
         if not result["buyer"].get("name"):
-            name_match = re.search(r'KLIENT\s*\n([^\n]+)', text, re.IGNORECASE)
+            name_match = _BUYER_NAME_RX.search(text)
             if name_match:
                 result["buyer"]["name"] = name_match.group(1).strip()
         
         # If we still don't have an address, try to find it after the buyer name
         if not result["buyer"].get("address") and result["buyer"].get("name"):
-            # Look for the address after the buyer name and before any tax info
-            address_pattern = (
-                r'(?i)' + re.escape(result["buyer"]["name"]) + 
-                r'\s*\n([^\n]+(?:\n[^\n]+){0,2}?)(?=\s*(?:NIP|Nr\s*VAT|Suma|Razem|$))'
-            )
-            address_section = re.search(address_pattern, text, re.DOTALL)
+            # Look for the address after the buyer name and before any tax info.
+            # Only the name is compiled per document; the address part is
+            # matched at each occurrence of it, as one combined search would
+            name_rx = re.compile(re.escape(result["buyer"]["name"]), re.IGNORECASE)
+            address_section = None
+            occurrence = name_rx.search(text)
+            while occurrence and not address_section:
+                address_section = _ADDRESS_AFTER_NAME_RX.match(text, occurrence.end())
+                occurrence = name_rx.search(text, occurrence.start() + 1)
             if address_section:
-                address = address_section.group(1).strip()
-                # Clean up the address
-                address = re.sub(r'\s*(?:NIP|VAT|REGON|KRS|Nr\s*wpisu)\s*:?\s*[\d\-\sA-Za-z]*', '', address, flags=re.IGNORECASE)
-                address = re.sub(r'\s+', ' ', address).strip()
-                address = re.sub(r'[\s,.;]+$', '', address)
-                result["buyer"]["address"] = address
+                result["buyer"]["address"] = _clean_address(address_section.group(1).strip())
             
         return result
         
@@ -259,19 +308,11 @@ class PolishExtractor(DataExtractor):
         items = []
         
         # First, try to find the items section with a more flexible pattern
-        items_section_match = re.search(
-            r'(?i)(?:produkt/usługa|towar/usługa|nazwa towaru/usługi).*?\n(?:.*\n){0,2}?(.*?)\n\s*(?:suma|razem|podsumowanie|podliczenie|kwota)',
-            text,
-            re.DOTALL | re.IGNORECASE
-        )
+        items_section_match = _ITEMS_SECTION_PATTERNS[0].search(text)
         
         if not items_section_match:
             # Alternative pattern if the first one doesn't match
-            items_section_match = re.search(
-                r'(?i)(?:produkt|usługa|nazwa).*?\n(?:.*\n){0,2}?(.*?)\n\s*(?:suma|razem|podsumowanie|podliczenie|kwota)',
-                text,
-                re.DOTALL | re.IGNORECASE
-            )
+            items_section_match = _ITEMS_SECTION_PATTERNS[1].search(text)
         
         if not items_section_match:
             self.logger.warning("Could not find items section in the invoice")
@@ -281,20 +322,10 @@ class PolishExtractor(DataExtractor):
         self.logger.debug(f"Items section found: {items_text}")
         
         # Try different patterns to match line items
-        # Pattern 1: Description followed by price, quantity, tax, and amount
-        item_patterns = [
-            # Pattern: Description [whitespace] Price [whitespace] Qty [whitespace] Tax% [whitespace] Amount
-            r'(?m)^(.+?)\s{2,}(\d+[\s,.]\d{2})\s+(\d+)\s*(?:\([^)]+\))?\s*(\d+%)\s+(\d+[\s,.]\d{2})',
-            # Pattern: Description [whitespace] Amount [currency]
-            r'(?m)^(.+?)\s{2,}(\d+[\s,.]\d{2})\s*([A-Z]{3})',
-            # Pattern: Just description and amount (most basic)
-            r'(?m)^(.+?)\s{2,}(\d+[\s,.]\d{2})'
-        ]
-        
-        for pattern in item_patterns:
-            item_matches = list(re.finditer(pattern, items_text))
+        for pattern in _ITEM_PATTERNS:
+            item_matches = list(pattern.finditer(items_text))
             if item_matches:
-                self.logger.debug(f"Found {len(item_matches)} items with pattern: {pattern}")
+                self.logger.debug(f"Found {len(item_matches)} items with pattern: {pattern.pattern}")
                 break
         else:
             self.logger.warning("No items matched any pattern")
@@ -318,7 +349,7 @@ class PolishExtractor(DataExtractor):
                         continue
                     
                     # Clean up the description
-                    description = re.sub(r'\s+', ' ', description).strip()
+                    description = _WHITESPACE_RX.sub(' ', description).strip()
                     
                     # Extract amount (always the last number)
                     amount_str = match.group(len(match.groups())).replace(' ', '').replace(',', '.')
@@ -364,22 +395,16 @@ class PolishExtractor(DataExtractor):
         result = {}
         
         # First, try to find the total amount directly with a specific pattern
-        total_match = re.search(
-            r'(?i)Kwota\s+taczna\s+faktury\s*[^\d]*?([\d\s,]+(?:\.[\d\s]+)?)\s*PLN',
-            text
-        )
+        total_match = _TOTAL_RX.search(text)
     
         if not total_match:
             # Look for any amount that looks like a total
-            total_match = re.search(
-                r'(?i)(?:kwota\s+łączna\s+faktur[^\d]*|razem\s+do\s+zapłaty\s*:?\s*)(?:[A-Z]{3})?\s*([\d\s,]+(?:\.[\d\s]+)?)',
-                text
-            )
+            total_match = _TOTAL_FALLBACK_RX.search(text)
     
         if total_match:
             try:
                 # Clean up the number and convert to float
-                total_amount = float(re.sub(r'[^\d,]', '', total_match.group(1).replace(',', '.')))
+                total_amount = float(keep_numeric(total_match.group(1).replace(',', '.'), ','))
                 result["totals"]["total"] = total_amount
                 result["totals"]["currency"] = "PLN"  # Default to PLN for this invoice
                 result["total"] = total_amount  # For backward compatibility
@@ -391,19 +416,12 @@ class PolishExtractor(DataExtractor):
             self.logger.warning("Total amount not found")
     
         # Try to extract subtotal and tax amount if available
-        subtotal_match = re.search(
-            r'(?i)Suma\s+bez\s+VAT\s+0%\s+([\d\s,]+(?:\.[\d\s]+)?)',
-            text
-        )
-    
-        tax_match = re.search(
-            r'(?i)VAT\s+0%\s+([\d\s,]+(?:\.[\d\s]+)?)',
-            text
-        )
+        subtotal_match = _SUBTOTAL_RX.search(text)
+        tax_match = _TAX_RX.search(text)
     
         if subtotal_match:
             try:
-                subtotal = float(re.sub(r'[^\d,]', '', subtotal_match.group(1).replace(',', '.')))
+                subtotal = float(keep_numeric(subtotal_match.group(1).replace(',', '.'), ','))
                 result["totals"]["subtotal"] = subtotal
                 self.logger.info(f"Extracted subtotal: {subtotal}")
             except (ValueError, AttributeError) as e:
@@ -411,7 +429,7 @@ class PolishExtractor(DataExtractor):
     
         if tax_match:
             try:
-                tax_amount = float(re.sub(r'[^\d,]', '', tax_match.group(1).replace(',', '.')))
+                tax_amount = float(keep_numeric(tax_match.group(1).replace(',', '.'), ','))
                 result["totals"]["tax_amount"] = tax_amount
                 result["tax_amount"] = tax_amount  # For backward compatibility
                 self.logger.info(f"Extracted tax amount: {tax_amount}")
@@ -12,6 +12,134 @@ from datetime import datetime
 from invocr.formats.pdf.extractors.base_extractor import BaseInvoiceExtractor
 from invocr.formats.pdf.models import Invoice, InvoiceItem, Address, ContactInfo as Party
 
+# Patterns used to build the mock JSON structure from plain text
+_INVOICE_NUMBER_RX = re.compile(r"Invoice\s+Number\s+([\w-]+)", re.IGNORECASE)
+_INVOICE_DATE_RX = re.compile(r"Invoice\s+Date\s+(\d{1,2}-[A-Z]{3}-\d{4})", re.IGNORECASE)
+_CURRENCY_LABEL_RX = re.compile(r"Currency\s+([A-Z]{3})", re.IGNORECASE)
+_PAYMENT_TERMS_RX = re.compile(r"Payment\s+Terms\s+(.+?)\s+VAT\s+No", re.IGNORECASE | re.DOTALL)
+_SELLER_NAME_RX = re.compile(r"(Adobe\s+Systems\s+Software\s+Ireland\s+Ltd)", re.IGNORECASE)
+_BILL_TO_BLOCK_RX = re.compile(r"Bill\s+To\s+(.+?)\s+Customer\s+VAT\s+No", re.IGNORECASE | re.DOTALL)
+_SELLER_VAT_LABEL_RX = re.compile(r"VAT\s+No:\s+([A-Z0-9]+)", re.IGNORECASE)
+_BUYER_VAT_LABEL_RX = re.compile(r"Customer\s+VAT\s+No:\s+([A-Z0-9]+)", re.IGNORECASE)
+
+# Field patterns used by the multi-level detection
+_TRANSACTION_FILENAME_RX = re.compile(r'Adobe_Transaction_No_(\d+)')
+_ORDER_NUMBER_RX = re.compile(r'Order Number\s+(\d+)')
+_SERVICE_TERM_RX = re.compile(r'Service Term:\s+(\d{2}-[A-Z]{3}-\d{4})\s+to')
+_SERVICE_TERM_END_RX = re.compile(r'to\s+(\d{2}-[A-Z]{3}-\d{4})')
+_FILENAME_DATE_RX = re.compile(r'_(\d{8})\.json$')
+_CURRENCY_RX = re.compile(r'Currency\s+([A-Z]{3})')
+_NET_AMOUNT_CURRENCY_RX = re.compile(r'NET AMOUNT \(([A-Z]{3})\)')
+_GRAND_TOTAL_CURRENCY_RX = re.compile(r'GRAND TOUAL \(([A-Z]{3})\)')
+_BILL_TO_RX = re.compile(r'Bill To\s+(.*?)(?=\s+Customer VAT No:|$)', re.DOTALL)
+_CUSTOMER_VAT_RX = re.compile(r'Customer VAT No:\s+([A-Z0-9]+)')
+_PAYPAL_VAT_RX = re.compile(r'PayPal VAT No:\s+([A-Z0-9]+)')
+
+# Look for standard invoice number format with enhanced refund/credit patterns
+_INVOICE_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Standard invoice patterns
+    r'Invoice\s+Number\s+([\w\-]+)',
+    r'Invoice\s+#\s*([\w\-]+)',
+    r'INV([\w\-]+)',
+
+    # Credit note and refund patterns
+    r'Credit\s+Note\s+Number\s*[:#]?\s*([\w\-]+)',
+    r'Credit\s+Note\s+#\s*([\w\-]+)',
+    r'Credit\s+#\s*([\w\-]+)',
+    r'Refund\s+Number\s*[:#]?\s*([\w\-]+)',
+    r'Refund\s+#\s*([\w\-]+)',
+    r'Reference\s+Number\s*[:#]?\s*([\w\-]+)',
+    r'Reference\s+#\s*([\w\-]+)',
+    r'Transaction\s+ID\s*[:#]?\s*([\w\-]+)',
+    r'Transaction\s+Number\s*[:#]?\s*([\w\-]+)',
+    r'Document\s+Number\s*[:#]?\s*([\w\-]+)',
+
+    # Adobe-specific patterns
+    r'Adobe\s+Document\s+ID\s*[:#]?\s*([\w\-]+)',
+    r'Adobe\s+Transaction\s+ID\s*[:#]?\s*([\w\-]+)',
+    r'CR([\w\-]+)'  # Credit note abbreviation pattern
+))
+
+# Fallback for refund documents that might use different terminology
+_FALLBACK_NUMBER_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b([A-Z0-9]{6,})\b',  # Alphanumeric sequence of 6+ characters
+    r'\b(\d{4,}-\d{4,})\b',  # Number-dash-number pattern
+    r'\b(CR-\d+)\b'  # CR-number pattern
+))
+_DATE_LIKE_RX = re.compile(r'\d{1,2}-\d{1,2}-\d{4}')
+_LONG_NUMBER_RX = re.compile(r'\d{5,}')
+
+# Various item section header patterns
+_ITEM_SECTION_PATTERNS = tuple(re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    r'(?:Item|ITEM)\]?\s*Details.*?Service Term:.*?(PRODUCT\s*NUMBER.*?)(?:Invoice Total|$)',
+    r'(?:PRODUCT\s*NUMBER).*?(\d+\s+[\w\s]+\s+\d+\s+[A-Z]{2}\s+[\d.]+\s+[\d.]+)',
+    r'(\d+\s+[\w\s]+\s+\d+\s+EA\s+[\d.]+\s+[\d.]+)',
+))
+
+# Individual item patterns, trying multiple formats
+_ITEM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Full Adobe invoice format with all columns
+    r'(\d+)\s+([\w\s]+)\s+(\d+)\s+([A-Z]{2})\s+([\d.,\(\)\-]+)\s+([\d.,\(\)\-]+)\s+([\d.,]+%)\s+([\d.,\(\)\-]+)\s+([\d.,\(\)\-]+)',
+
+    # Simplified format with fewer columns
+    r'(\d+)\s+([\w\s]+)\s+(\d+)\s+([A-Z]{2})\s+([\d.,\(\)\-]+)\s+([\d.,\(\)\-]+)',
+
+    # Format for OCR text that might be misaligned
+    r'([\d]+)\s+([\w\s]+?)\s+([\d]+)\s+([A-Z]{2})\s+([\d.,\(\)\-]+)\s+([\d.,\(\)\-]+)',
+
+    # Format for refund items with negative values
+    r'(\d+)\s+([\w\s]+)\s+(\d+)\s+([A-Z]{2})\s+\(([\d.,]+)\)\s+\(([\d.,]+)\)',
+
+    # Format for credit items with negative values
+    r'(\d+)\s+([\w\s]+Credit[\w\s]*)\s+(\d+)\s+([A-Z]{2})\s+([\d.,]+)\s+([\d.,]+)'
+))
+
+# Adobe invoice specific phrases that indicate English
+_ADOBE_ENGLISH_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Adobe Systems Software Ireland',
+    r'Invoice Information',
+    r'Invoice Number',
+    r'Invoice Date',
+    r'Payment Terms',
+    r'Purchase Order',
+    r'PRODUCT DESCRIPTION',
+    r'GRAND TO[TU]AL',  # Handles both TOTAL and TOUAL typo
+))
+
+# Estonian specific patterns
+_ESTONIAN_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'TALLINN',
+    r'Pärnu',
+    r'EESTI|ESTONIA'
+))
+
+_INVOICE_TOTAL_SECTION_RX = re.compile(r'Invoice\s+Total.*?(?:GRAND\s+TO[TU]AL|$)', re.IGNORECASE | re.DOTALL)
+
+# Subtotal (NET AMOUNT) patterns
+_SUBTOTAL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'NET\s+AMOUNT\s*\(?[A-Z]{3}\)?\s*([\d.,\(\)\-]+)',
+    r'NET\s+AMOUNT.*?([\d.,\(\)\-]+)\s',
+    r'SubTotal\s*[:\s]\s*([\d.,\(\)\-]+)',
+    r'CREDIT.*?AMOUNT.*?([\d.,\(\)\-]+)'
+))
+
+# Tax amount patterns - make sure we're not capturing product codes
+_TAX_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'TAXES\s*(?:\(SEE\s+DETAILS\s+FOR\s+RATES\)|\(?[A-Z]{3}\)?)?\s*([\d.,]+)',
+    r'VAT\s*(?:AMOUNT)?\s*:?\s*([\d.,]+)',
+    r'TAX\s*(?:AMOUNT)?\s*:?\s*([\d.,]+)'
+))
+
+# Total amount patterns - look for "GRAND TOTAL" or variations
+_TOTAL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'GRAND\s+TO[TU]AL.*?\(?[A-Z]{3}\)?\s*([\d.,\(\)\-]+)', # Matches GRAND TOTAL and GRAND TOUAL
+    r'TOTAL\s*AMOUNT\s*(?:\(?[A-Z]{3}\)?)?\s*([\d.,\(\)\-]+)',
+    r'Invoice\s+Total.*?GRAND.*?([\d.,\(\)\-]+)',
+    r'CREDIT.*?TOTAL.*?([\d.,\(\)\-]+)',
+    r'NET\s+AMOUNT.*?([\d.,\(\)\-]+)', # Fallback to NET AMOUNT if total not found
+    r'TOTAL.*?:\s*([\d.,\(\)\-]+)'
+))
+
 
 class AdobeInvoiceExtractor(BaseInvoiceExtractor):
     """Specialized extractor for Adobe invoice JSON data with OCR verification."""
@@ -115,22 +243,22 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         }
         
         # Extract invoice number
-        invoice_number_match = re.search(r"Invoice\s+Number\s+([\w-]+)", text, re.IGNORECASE)
+        invoice_number_match = _INVOICE_NUMBER_RX.search(text)
         if invoice_number_match:
             json_data["invoice_number"] = invoice_number_match.group(1)
         
         # Extract date
-        date_match = re.search(r"Invoice\s+Date\s+(\d{1,2}-[A-Z]{3}-\d{4})", text, re.IGNORECASE)
+        date_match = _INVOICE_DATE_RX.search(text)
         if date_match:
             json_data["issue_date"] = date_match.group(1)
         
         # Extract currency
-        currency_match = re.search(r"Currency\s+([A-Z]{3})", text, re.IGNORECASE)
+        currency_match = _CURRENCY_LABEL_RX.search(text)
         if currency_match:
             json_data["currency"] = currency_match.group(1)
         
         # Extract payment terms
-        payment_terms_match = re.search(r"Payment\s+Terms\s+(.+?)\s+VAT\s+No", text, re.IGNORECASE | re.DOTALL)
+        payment_terms_match = _PAYMENT_TERMS_RX.search(text)
         if payment_terms_match:
             json_data["payment_terms"] = payment_terms_match.group(1).strip()
         
@@ -138,12 +266,12 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         json_data["seller"]["address"] = text
         
         # Extract seller name
-        seller_match = re.search(r"(Adobe\s+Systems\s+Software\s+Ireland\s+Ltd)", text, re.IGNORECASE)
+        seller_match = _SELLER_NAME_RX.search(text)
         if seller_match:
             json_data["seller"]["name"] = seller_match.group(1)
             
         # Extract buyer name and address
-        buyer_match = re.search(r"Bill\s+To\s+(.+?)\s+Customer\s+VAT\s+No", text, re.IGNORECASE | re.DOTALL)
+        buyer_match = _BILL_TO_BLOCK_RX.search(text)
         if buyer_match:
             buyer_text = buyer_match.group(1).strip()
             lines = buyer_text.split("\n")
@@ -152,11 +280,11 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
                 json_data["buyer"]["address"] = "\n".join(lines[1:]).strip() if len(lines) > 1 else ""
         
         # Extract tax IDs
-        seller_vat_match = re.search(r"VAT\s+No:\s+([A-Z0-9]+)", text, re.IGNORECASE)
+        seller_vat_match = _SELLER_VAT_LABEL_RX.search(text)
         if seller_vat_match:
             json_data["seller"]["tax_id"] = seller_vat_match.group(1)
             
-        buyer_vat_match = re.search(r"Customer\s+VAT\s+No:\s+([A-Z0-9]+)", text, re.IGNORECASE)
+        buyer_vat_match = _BUYER_VAT_LABEL_RX.search(text)
         if buyer_vat_match:
             json_data["buyer"]["tax_id"] = buyer_vat_match.group(1)
         
@@ -167,7 +295,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         # Level 1: Try from transaction ID in filename
         filename = data.get("_metadata", {}).get("filename", "")
         if filename:
-            match = re.search(r'Adobe_Transaction_No_(\d+)', filename)
+            match = _TRANSACTION_FILENAME_RX.search(filename)
             if match:
                 return match.group(1)
         
@@ -177,7 +305,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
             
         # Level 3: Try from payment terms where order number might be
         if "payment_terms" in data:
-            match = re.search(r'Order Number\s+(\d+)', data["payment_terms"])
+            match = _ORDER_NUMBER_RX.search(data["payment_terms"])
             if match:
                 return match.group(1)
         
@@ -185,55 +313,25 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         seller_address = data.get("seller", {}).get("address", "")
         
         # Look for standard invoice number format with enhanced refund/credit patterns
-        invoice_patterns = [
-            # Standard invoice patterns
-            r'Invoice\s+Number\s+([\w\-]+)',
-            r'Invoice\s+#\s*([\w\-]+)',
-            r'INV([\w\-]+)',
-            
-            # Credit note and refund patterns
-            r'Credit\s+Note\s+Number\s*[:#]?\s*([\w\-]+)',
-            r'Credit\s+Note\s+#\s*([\w\-]+)',
-            r'Credit\s+#\s*([\w\-]+)',
-            r'Refund\s+Number\s*[:#]?\s*([\w\-]+)',
-            r'Refund\s+#\s*([\w\-]+)',
-            r'Reference\s+Number\s*[:#]?\s*([\w\-]+)',
-            r'Reference\s+#\s*([\w\-]+)',
-            r'Transaction\s+ID\s*[:#]?\s*([\w\-]+)',
-            r'Transaction\s+Number\s*[:#]?\s*([\w\-]+)',
-            r'Document\s+Number\s*[:#]?\s*([\w\-]+)',
-            
-            # Adobe-specific patterns
-            r'Adobe\s+Document\s+ID\s*[:#]?\s*([\w\-]+)',
-            r'Adobe\s+Transaction\s+ID\s*[:#]?\s*([\w\-]+)',
-            r'CR([\w\-]+)'  # Credit note abbreviation pattern
-        ]
-        
-        for pattern in invoice_patterns:
-            match = re.search(pattern, seller_address, re.IGNORECASE)
+        for pattern in _INVOICE_NUMBER_PATTERNS:
+            match = pattern.search(seller_address)
             if match:
                 return match.group(1)
                 
         # Level 5: Look for any alphanumeric sequence that looks like an invoice number
         # This is a fallback for refund documents that might use different terminology
-        fallback_patterns = [
-            r'\b([A-Z0-9]{6,})\b',  # Alphanumeric sequence of 6+ characters
-            r'\b(\d{4,}-\d{4,})\b',  # Number-dash-number pattern
-            r'\b(CR-\d+)\b'  # CR-number pattern
-        ]
-        
-        for pattern in fallback_patterns:
-            matches = re.findall(pattern, seller_address, re.IGNORECASE)
+        for pattern in _FALLBACK_NUMBER_PATTERNS:
+            matches = pattern.findall(seller_address)
             if matches:
                 # Filter out common false positives
                 filtered_matches = [m for m in matches 
-                                  if not re.match(r'\d{1,2}-\d{1,2}-\d{4}', m)  # Not a date
-                                  and not re.match(r'\d{5,}', m)  # Not a long number (e.g. phone)
+                                  if not _DATE_LIKE_RX.match(m)  # Not a date
+                                  and not _LONG_NUMBER_RX.match(m)  # Not a long number (e.g. phone)
                                   and m not in ['000000', 'FFFFFF']]  # Not placeholder values
                 if filtered_matches:
                     return filtered_matches[0]
                 
-        match = re.search(r'Order Number\s+(\d+)', seller_address)
+        match = _ORDER_NUMBER_RX.search(seller_address)
         if match:
             return match.group(1)
             
@@ -246,7 +344,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         payment_terms = data.get("payment_terms", "")
         
         for text in [address, payment_terms]:
-            match = re.search(r'Service Term:\s+(\d{2}-[A-Z]{3}-\d{4})\s+to', text)
+            match = _SERVICE_TERM_RX.search(text)
             if match:
                 try:
                     return datetime.strptime(match.group(1), "%d-%b-%Y")
@@ -256,7 +354,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         # Level 2: Extract from filename
         filename = data.get("_metadata", {}).get("filename", "")
         if filename:
-            match = re.search(r'_(\d{8})\.json$', filename)
+            match = _FILENAME_DATE_RX.search(filename)
             if match:
                 try:
                     return datetime.strptime(match.group(1), "%Y%m%d")
@@ -271,7 +369,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         payment_terms = data.get("payment_terms", "")
         
         for text in [address, payment_terms]:
-            match = re.search(r'to\s+(\d{2}-[A-Z]{3}-\d{4})', text)
+            match = _SERVICE_TERM_END_RX.search(text)
             if match:
                 try:
                     return datetime.strptime(match.group(1), "%d-%b-%Y")
@@ -288,17 +386,17 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         
         # Level 2: Look in payment terms
         if "payment_terms" in data:
-            match = re.search(r'Currency\s+([A-Z]{3})', data["payment_terms"])
+            match = _CURRENCY_RX.search(data["payment_terms"])
             if match:
                 return match.group(1)
         
         # Level 3: Look in address field where data is often mixed
         address = data.get("seller", {}).get("address", "")
-        match = re.search(r'NET AMOUNT \(([A-Z]{3})\)', address)
+        match = _NET_AMOUNT_CURRENCY_RX.search(address)
         if match:
             return match.group(1)
             
-        match = re.search(r'GRAND TOUAL \(([A-Z]{3})\)', address)
+        match = _GRAND_TOTAL_CURRENCY_RX.search(address)
         if match:
             return match.group(1)
         
@@ -313,7 +411,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         payment_terms = data.get("payment_terms", "")
         
         # Extract buyer name and address
-        bill_to_match = re.search(r'Bill To\s+(.*?)(?=\s+Customer VAT No:|$)', payment_terms, re.DOTALL)
+        bill_to_match = _BILL_TO_RX.search(payment_terms)
         if bill_to_match:
             lines = bill_to_match.group(1).strip().split('\n')
             if lines:
@@ -321,7 +419,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
                 buyer.address = Address(street='\n'.join(lines[1:]).strip())
         
         # Extract buyer VAT number
-        vat_match = re.search(r'Customer VAT No:\s+([A-Z0-9]+)', payment_terms)
+        vat_match = _CUSTOMER_VAT_RX.search(payment_terms)
         if vat_match:
             buyer.tax_id = vat_match.group(1)
         
@@ -329,7 +427,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         seller.name = "Adobe"
         
         # Look for seller VAT in payment terms
-        seller_vat_match = re.search(r'PayPal VAT No:\s+([A-Z0-9]+)', payment_terms)
+        seller_vat_match = _PAYPAL_VAT_RX.search(payment_terms)
         if seller_vat_match:
             seller.tax_id = seller_vat_match.group(1)
         
@@ -358,22 +456,15 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
                 continue
                 
             # First try to find the item details section using multiple patterns
-            item_section_patterns = [
-                # Various item section header patterns
-                r'(?:Item|ITEM)\]?\s*Details.*?Service Term:.*?(PRODUCT\s*NUMBER.*?)(?:Invoice Total|$)',
-                r'(?:PRODUCT\s*NUMBER).*?(\d+\s+[\w\s]+\s+\d+\s+[A-Z]{2}\s+[\d.]+\s+[\d.]+)',
-                r'(\d+\s+[\w\s]+\s+\d+\s+EA\s+[\d.]+\s+[\d.]+)',
-            ]
-            
             item_section = None
             pattern_used = None
             
-            for pattern in item_section_patterns:
-                item_section_match = re.search(pattern, source, re.DOTALL | re.IGNORECASE)
+            for pattern in _ITEM_SECTION_PATTERNS:
+                item_section_match = pattern.search(source)
                 if item_section_match:
                     item_section = item_section_match.group(1)
                     pattern_used = pattern
-                    print(f"  ✓ Found item section using pattern: {pattern[:30]}...")
+                    print(f"  ✓ Found item section using pattern: {pattern.pattern[:30]}...")
                     print(f"  Item section snippet: {item_section[:50]}...")
                     break
             
@@ -382,27 +473,10 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
                 continue
                 
             # Extract individual items with regex patterns, trying multiple formats
-            item_patterns = [
-                # Full Adobe invoice format with all columns
-                r'(\d+)\s+([\w\s]+)\s+(\d+)\s+([A-Z]{2})\s+([\d.,\(\)\-]+)\s+([\d.,\(\)\-]+)\s+([\d.,]+%)\s+([\d.,\(\)\-]+)\s+([\d.,\(\)\-]+)',
-                
-                # Simplified format with fewer columns
-                r'(\d+)\s+([\w\s]+)\s+(\d+)\s+([A-Z]{2})\s+([\d.,\(\)\-]+)\s+([\d.,\(\)\-]+)',
-                
-                # Format for OCR text that might be misaligned
-                r'([\d]+)\s+([\w\s]+?)\s+([\d]+)\s+([A-Z]{2})\s+([\d.,\(\)\-]+)\s+([\d.,\(\)\-]+)',
-                
-                # Format for refund items with negative values
-                r'(\d+)\s+([\w\s]+)\s+(\d+)\s+([A-Z]{2})\s+\(([\d.,]+)\)\s+\(([\d.,]+)\)',
-                
-                # Format for credit items with negative values
-                r'(\d+)\s+([\w\s]+Credit[\w\s]*)\s+(\d+)\s+([A-Z]{2})\s+([\d.,]+)\s+([\d.,]+)'
-            ]
-            
             items_found = False
             
-            for pattern_idx, pattern in enumerate(item_patterns):
-                item_matches = list(re.finditer(pattern, item_section, re.IGNORECASE))
+            for pattern_idx, pattern in enumerate(_ITEM_PATTERNS):
+                item_matches = list(pattern.finditer(item_section))
                 if item_matches:
                     print(f"  ✓ Found {len(item_matches)} items using pattern {pattern_idx+1}")
                     items_found = True
@@ -519,28 +593,11 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
         Returns:
             ISO language code ('en', 'et', etc.)
         """
-        # Check for Adobe invoice specific phrases that indicate English
-        adobe_patterns = [
-            r'Adobe Systems Software Ireland',
-            r'Invoice Information',
-            r'Invoice Number',
-            r'Invoice Date',
-            r'Payment Terms',
-            r'Purchase Order',
-            r'PRODUCT DESCRIPTION',
-            r'GRAND TO[TU]AL',  # Handles both TOTAL and TOUAL typo
-        ]
-        
         # Count matches for Adobe's English patterns
-        english_score = sum(1 for pattern in adobe_patterns if re.search(pattern, text, re.IGNORECASE))
+        english_score = sum(1 for pattern in _ADOBE_ENGLISH_PATTERNS if pattern.search(text))
         
         # Check for Estonian specific patterns
-        estonian_patterns = [
-            r'TALLINN',
-            r'Pärnu',
-            r'EESTI|ESTONIA'
-        ]
-        estonian_score = sum(1 for pattern in estonian_patterns if re.search(pattern, text, re.IGNORECASE))
+        estonian_score = sum(1 for pattern in _ESTONIAN_PATTERNS if pattern.search(text))
         
         print(f"Language verification scores - English: {english_score}, Estonian: {estonian_score}")
         
@@ -608,8 +665,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
                 continue
                 
             # Try to find the Invoice Total section first to ensure we're looking in the right place
-            invoice_total_section_match = re.search(r'Invoice\s+Total.*?(?:GRAND\s+TO[TU]AL|$)', 
-                                                   source, re.IGNORECASE | re.DOTALL)
+            invoice_total_section_match = _INVOICE_TOTAL_SECTION_RX.search(source)
                 
             if invoice_total_section_match:
                 invoice_total_section = invoice_total_section_match.group(0)
@@ -618,57 +674,35 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
                 invoice_total_section = source  # Fallback to full source if section not found
             
             # Extract subtotal (NET AMOUNT)
-            subtotal_patterns = [
-                r'NET\s+AMOUNT\s*\(?[A-Z]{3}\)?\s*([\d.,\(\)\-]+)',
-                r'NET\s+AMOUNT.*?([\d.,\(\)\-]+)\s',
-                r'SubTotal\s*[:\s]\s*([\d.,\(\)\-]+)',
-                r'CREDIT.*?AMOUNT.*?([\d.,\(\)\-]+)'
-            ]
-            
-            for pattern in subtotal_patterns:
-                subtotal_match = re.search(pattern, invoice_total_section, re.IGNORECASE)
+            for pattern in _SUBTOTAL_PATTERNS:
+                subtotal_match = pattern.search(invoice_total_section)
                 if subtotal_match:
                     try:
                         subtotal = self._parse_amount(subtotal_match.group(1))
-                        print(f"  ✓ Subtotal found: {subtotal} using pattern: {pattern}")
+                        print(f"  ✓ Subtotal found: {subtotal} using pattern: {pattern.pattern}")
                         break
                     except ValueError:
                         continue
             
             # Extract tax amount - make sure we're not capturing product codes
-            tax_patterns = [
-                r'TAXES\s*(?:\(SEE\s+DETAILS\s+FOR\s+RATES\)|\(?[A-Z]{3}\)?)?\s*([\d.,]+)',
-                r'VAT\s*(?:AMOUNT)?\s*:?\s*([\d.,]+)',
-                r'TAX\s*(?:AMOUNT)?\s*:?\s*([\d.,]+)'
-            ]
-            
-            for pattern in tax_patterns:
-                tax_match = re.search(pattern, invoice_total_section, re.IGNORECASE)
+            for pattern in _TAX_PATTERNS:
+                tax_match = pattern.search(invoice_total_section)
                 if tax_match:
                     try:
                         tax_amount = self._parse_amount(tax_match.group(1))
-                        print(f"  ✓ Tax amount found: {tax_amount} using pattern: {pattern}")
+                        print(f"  ✓ Tax amount found: {tax_amount} using pattern: {pattern.pattern}")
                         break
                     except ValueError:
                         continue
             
             # Extract total amount - look for "GRAND TOTAL" or variations
             # Make sure we're looking after "Invoice Total" to avoid picking up line items
-            total_patterns = [
-                r'GRAND\s+TO[TU]AL.*?\(?[A-Z]{3}\)?\s*([\d.,\(\)\-]+)', # Matches GRAND TOTAL and GRAND TOUAL
-                r'TOTAL\s*AMOUNT\s*(?:\(?[A-Z]{3}\)?)?\s*([\d.,\(\)\-]+)',
-                r'Invoice\s+Total.*?GRAND.*?([\d.,\(\)\-]+)',
-                r'CREDIT.*?TOTAL.*?([\d.,\(\)\-]+)',
-                r'NET\s+AMOUNT.*?([\d.,\(\)\-]+)', # Fallback to NET AMOUNT if total not found
-                r'TOTAL.*?:\s*([\d.,\(\)\-]+)'
-            ]
-            
-            for pattern in total_patterns:
-                total_match = re.search(pattern, invoice_total_section, re.IGNORECASE)
+            for pattern in _TOTAL_PATTERNS:
+                total_match = pattern.search(invoice_total_section)
                 if total_match:
                     try:
                         total_amount = self._parse_amount(total_match.group(1))
-                        print(f"  ✓ Total amount found: {total_amount} using pattern: {pattern}")
+                        print(f"  ✓ Total amount found: {total_amount} using pattern: {pattern.pattern}")
                         break
                     except ValueError:
                         continue
@@ -753,7 +787,7 @@ class AdobeInvoiceExtractor(BaseInvoiceExtractor):
             
         # Verify invoice number if not already extracted
         if not invoice.invoice_number:
-            invoice_number_match = re.search(r"Invoice\s+Number\s+([\w-]+)", self.ocr_text, re.IGNORECASE)
+            invoice_number_match = _INVOICE_NUMBER_RX.search(self.ocr_text)
             if invoice_number_match:
                 invoice.invoice_number = invoice_number_match.group(1)
                 print(f"Found invoice number from OCR: {invoice.invoice_number}")
@@ -13,10 +13,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pdfplumber
-from dateutil.parser import parse as parse_date
 from pdf2image import convert_from_path
 
-from ..utils.helpers import ensure_directory
+from ..utils.helpers import ensure_directory, keep_numeric
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -229,6 +228,9 @@ class PDFProcessor:
         else:
             patterns = date_patterns
 
+        # dateutil is a heavy import, only paid for once a date is parsed
+        from dateutil.parser import parse as parse_date
+
         for pattern in patterns:
             match = re.search(pattern, text)
             if match:
@@ -254,7 +256,8 @@ class PDFProcessor:
         """
         party = {"name": "", "address": "", "email": "", "tax_id": ""}
 
-        # Common patterns for seller/buyer sections
+        # Common patterns for seller/buyer sections. An (anchor, pattern) pair
+        # stands for "anchor[\s\S]*?pattern"
         patterns = {
             "name": [
                 rf"(?i){party_type}[\s:]*([^\n\r]+)",
@@ -262,17 +265,17 @@ class PDFProcessor:
                 rf"(?i)to:?\s*([^\n\r]+)",
             ],
             "address": [
-                rf"(?i){party_type}[\s\S]*?\b(?:address|location)[\s:]*([^\n\r]+(?:\n[^\n\r]+){0,3})",
-                rf"(?i)(?:from|to)[\s\S]*?\b(?:address|location)[\s:]*([^\n\r]+(?:\n[^\n\r]+){0,3})",
+                (party_type, rf"\b(?:address|location)[\s:]*([^\n\r]+(?:\n[^\n\r]+){0,3})"),
+                (r"(?:from|to)", rf"\b(?:address|location)[\s:]*([^\n\r]+(?:\n[^\n\r]+){0,3})"),
             ],
             "email": [
-                rf"(?i){party_type}[\s\S]*?\b(?:email|e-mail|mail)[\s:]*([\w\.-]+@[\w\.-]+\.\w+)",
-                rf"(?i)(?:from|to)[\s\S]*?\b(?:email|e-mail|mail)[\s:]*([\w\.-]+@[\w\.-]+\.\w+)",
+                (party_type, r"\b(?:email|e-mail|mail)[\s:]*([\w\.-]+@[\w\.-]+\.\w+)"),
+                (r"(?:from|to)", r"\b(?:email|e-mail|mail)[\s:]*([\w\.-]+@[\w\.-]+\.\w+)"),
                 rf"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
             ],
             "tax_id": [
-                rf"(?i){party_type}[\s\S]*?\b(?:tax\s*id|vat\s*id|tax\s*number|vat\s*number)[\s:]*([A-Z0-9-]+)",
-                rf"(?i)(?:from|to)[\s\S]*?\b(?:tax\s*id|vat\s*id|tax\s*number|vat\s*number)[\s:]*([A-Z0-9-]+)",
+                (party_type, r"\b(?:tax\s*id|vat\s*id|tax\s*number|vat\s*number)[\s:]*([A-Z0-9-]+)"),
+                (r"(?:from|to)", r"\b(?:tax\s*id|vat\s*id|tax\s*number|vat\s*number)[\s:]*([A-Z0-9-]+)"),
                 r"\b(?:VAT|TAX)[\s:]*[A-Z]{0,3}[0-9\-\s]+\b",
             ],
         }
@@ -280,7 +283,20 @@ class PDFProcessor:
         # Extract each field using patterns
         for field, field_patterns in patterns.items():
             for pattern in field_patterns:
-                match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+                if isinstance(pattern, tuple):
+                    # A lazy run from every occurrence of the anchor ("to"
+                    # even occurs in "total") rescans the rest of the text
+                    # when the label is missing. The first anchor is the only
+                    # one that matters: the pattern matches after it exactly
+                    # when it matches after any later one
+                    anchor, pattern = pattern
+                    anchor_match = re.search(anchor, text, re.IGNORECASE)
+                    if not anchor_match:
+                        continue
+                    regex = re.compile(pattern, re.IGNORECASE | re.DOTALL)
+                    match = regex.search(text, anchor_match.end())
+                else:
+                    match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
                 if match:
                     # Get the first non-empty group
                     value = next((g for g in match.groups() if g), "").strip()
@@ -389,7 +405,7 @@ class PDFProcessor:
                             if field == "quantity":
                                 try:
                                     item[field] = float(
-                                        re.sub(r"[^\d.]", "", value) or "1"
+                                        keep_numeric(value, ".") or "1"
                                     )
                                     valid_item = True
                                 except (ValueError, TypeError):
@@ -397,7 +413,7 @@ class PDFProcessor:
                             elif field in ["unit_price", "total"]:
                                 try:
                                     item[field] = float(
-                                        re.sub(r"[^\d.]", "", value) or "0"
+                                        keep_numeric(value, ".") or "0"
                                     )
                                     valid_item = True
                                 except (ValueError, TypeError):
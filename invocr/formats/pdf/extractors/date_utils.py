@@ -5,6 +5,7 @@ This module contains functions for parsing and extracting dates from invoice tex
 in various formats.
 """
 
+import functools
 import re
 from datetime import date, datetime, timedelta
 from typing import Optional, Union
@@ -41,6 +42,16 @@ def parse_date(
         result_date = ref_date + timedelta(days=days)
         return datetime.combine(result_date, datetime.min.time())
 
+    return _parse_date_str(date_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str(date_str: str) -> Optional[datetime]:
+    """Cached worker for absolute dates in parse_date.
+
+    Tries dozens of strptime formats, so repeated date strings are worth
+    remembering. datetime objects are immutable and safe to share.
+    """
     # Strip any leading/trailing whitespace and special characters
     date_str = date_str.strip()
     date_str = re.sub(r'^[^\w\d]+|[^\w\d]+$', '', date_str)
@@ -157,7 +157,7 @@ class DocumentClassifier:
             r'\b\d+\s*\|\s*[\w\s]+\s*\|\s*\d+\s*\|\s*[\d\.,]+\s*\|\s*[\d\.,]+\b'  # Typical table row
         ]
         
-        return any(re.search(pattern, text, re.IGNORECASE | re.MULTILINE) 
+        return any(re.search(pattern, text, re.IGNORECASE) 
                   for pattern in table_patterns)
     
     def detect_document_type(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Tuple[str, float, Dict[str, Any]]:
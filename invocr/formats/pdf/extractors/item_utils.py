@@ -13,6 +13,16 @@ from invocr.formats.pdf.extractors.numeric_utils import parse_float
 
 logger = get_logger(__name__)
 
+# Line checks used by is_valid_item_line, one compiled search each instead of
+# per-keyword substring tests on a lowercased copy of the line
+_HEADER_WORD_RX = re.compile(r"DESCRIPTION|ITEM|QTY|PRICE|AMOUNT|TOTAL")
+_SUMMARY_LINE_RX = re.compile(
+    r"subtotal|total|tax|vat|shipping|discount|amount due|balance|payment",
+    re.IGNORECASE,
+)
+_WORD_RX = re.compile(r"[a-zA-Z]{3,}")
+_PRICE_RX = re.compile(r"\d[,.]\d{2}")
+
 
 def normalize_description(description: str) -> str:
     """
@@ -64,32 +74,15 @@ def is_valid_item_line(line: str) -> bool:
         return False
     
     # Skip header-like lines (all uppercase with keywords)
-    if line.isupper() and any(word in line for word in [
-        "DESCRIPTION", "ITEM", "QTY", "PRICE", "AMOUNT", "TOTAL"
-    ]):
+    if line.isupper() and _HEADER_WORD_RX.search(line):
         return False
     
     # Skip summary lines
-    summary_indicators = [
-        "subtotal", "total", "tax", "vat", "shipping", "discount", 
-        "amount due", "balance", "payment"
-    ]
-    if any(indicator in line.lower() for indicator in summary_indicators):
-        return False
-    
-    # Check for numeric content (prices/quantities)
-    if not re.search(r'\d+(?:[,.]\d+)?', line):
+    if _SUMMARY_LINE_RX.search(line):
         return False
     
-    # Must have some text content
-    if not re.search(r'[a-zA-Z]{3,}', line):
-        return False
-    
-    # Check for price-like pattern
-    if re.search(r'\d+(?:[,.]\d{2})', line):
-        return True
-    
-    return False
+    # Must have some text content and a price-like number
+    return bool(_WORD_RX.search(line) and _PRICE_RX.search(line))
 
 
 def extract_items(text: str) -> List[Dict[str, Any]]:
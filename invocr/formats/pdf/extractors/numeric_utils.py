@@ -5,9 +5,11 @@ This module contains functions for parsing and extracting numeric values from in
 including amounts, quantities, and other numeric fields.
 """
 
+import functools
 import re
 from typing import Optional
 
+from invocr.utils.helpers import keep_numeric
 from invocr.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,9 +27,15 @@ def parse_float(value_str: str) -> float:
     """
     if not value_str:
         return 0.0
-    
+
+    return _parse_float_str(str(value_str))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_float_str(value_str: str) -> float:
+    """Cached worker for parse_float; amounts like "0.00" repeat a lot."""
     # Remove currency symbols and any non-numeric characters except decimal and negative
-    value_str = re.sub(r'[^\d\-.,]', '', str(value_str))
+    value_str = keep_numeric(value_str, "-.,")
     
     # Handle European-style numbers (comma as decimal separator)
     if ',' in value_str and '.' in value_str:
@@ -41,9 +49,6 @@ def parse_float(value_str: str) -> float:
         # If only comma exists, treat it as decimal separator
         value_str = value_str.replace(',', '.')
     
-    # Final cleanup - remove any remaining invalid characters
-    value_str = re.sub(r'[^\d\-.]', '', value_str)
-    
     try:
         return float(value_str)
     except (ValueError, TypeError):
@@ -310,8 +310,7 @@ class RegexExtractor(BaseInvoiceExtractor):
         
         # Example pattern for line items
         line_item_pattern = re.compile(
-            r"(\d+)\s+([A-Za-z0-9\s\.,]+)\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)",
-            re.MULTILINE
+            r"(\d+)\s+([A-Za-z0-9\s\.,]+)\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)\s+(\d+(?:\.\d+)?)"
         )
         
         for match in line_item_pattern.finditer(text):
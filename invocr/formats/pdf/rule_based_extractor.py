@@ -10,6 +10,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
 
+from ...utils.helpers import keep_numeric
 from .document import Address, Invoice, InvoiceItem, Party, PaymentTerms
 from .extractor_base import ExtractionResult, FieldExtractor, InvoiceExtractor
 
@@ -426,13 +427,13 @@ class RuleBasedExtractor(InvoiceExtractor):
 
         try:
             if value_type == "int":
-                return int(re.sub(r"[^\d-]", "", value))
+                return int(keep_numeric(value, "-"))
             elif value_type == "float":
-                return float(re.sub(r"[^\d.-]", "", value).replace(",", "."))
+                return float(keep_numeric(value, ".-").replace(",", "."))
             elif value_type == "decimal":
                 from decimal import Decimal
 
-                return Decimal(re.sub(r"[^\d.-]", "", value).replace(",", "."))
+                return Decimal(keep_numeric(value, ".-").replace(",", "."))
             elif value_type == "date":
                 if format_str:
                     return datetime.strptime(value.strip(), format_str).date()
@@ -474,8 +475,6 @@ class RuleBasedExtractor(InvoiceExtractor):
                 mapping = post_process.get("mapping", {})
                 return mapping.get(str(value).lower(), value)
             elif post_process.get("type") == "regex_replace":
-                import re
-
                 pattern = post_process.get("pattern", "")
                 replacement = post_process.get("replacement", "")
                 return re.sub(pattern, replacement, str(value))
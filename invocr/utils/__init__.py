@@ -4,6 +4,8 @@ Utility modules for InvOCR
 
 from .config import Settings, get_settings
 from .helpers import (
+    RE2_AVAILABLE,
+    AsciiRe2Pattern,
     batch_process,
     calculate_processing_time,
     check_disk_space,
@@ -13,14 +15,18 @@ from .helpers import (
     ensure_directory,
     extract_numbers,
     format_duration,
+    fold_case,
     format_file_size,
     generate_job_id,
     get_file_extension,
     get_file_hash,
+    keep_numeric,
     measure_performance,
     normalize_text,
+    original_group,
     parse_currency_amount,
     retry_on_failure,
+    write_json,
 )
 from .validation import (
     is_valid_pdf,
@@ -55,4 +61,10 @@ __all__ = [
     "sanitize_input",
     "check_disk_space",
     "parse_currency_amount",
+    "keep_numeric",
+    "fold_case",
+    "original_group",
+    "AsciiRe2Pattern",
+    "RE2_AVAILABLE",
+    "write_json",
 ]
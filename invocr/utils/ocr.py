@@ -11,7 +11,8 @@ import subprocess
 import tempfile
 import logging
 import shutil
-from typing import List, Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,20 @@ TESSERACT_AVAILABLE = shutil.which('tesseract') is not None
 PDFTOTEXT_AVAILABLE = shutil.which('pdftotext') is not None
 PDFTOPPM_AVAILABLE = shutil.which('pdftoppm') is not None
 
+# Common invoice words per language, used by get_document_language_confidence
+_LANGUAGE_MARKERS = {
+    'en': ['invoice', 'total', 'payment', 'date', 'amount', 'tax', 'number', 'description', 'quantity', 'price'],
+    'pl': ['faktura', 'razem', 'płatność', 'data', 'kwota', 'podatek', 'numer', 'opis', 'ilość', 'cena'],
+    'de': ['rechnung', 'gesamt', 'zahlung', 'datum', 'betrag', 'steuer', 'nummer', 'beschreibung', 'menge', 'preis'],
+    'es': ['factura', 'total', 'pago', 'fecha', 'importe', 'impuesto', 'número', 'descripción', 'cantidad', 'precio'],
+    'fr': ['facture', 'total', 'paiement', 'date', 'montant', 'taxe', 'numéro', 'description', 'quantité', 'prix'],
+    'it': ['fattura', 'totale', 'pagamento', 'data', 'importo', 'tassa', 'numero', 'descrizione', 'quantità', 'prezzo'],
+    'et': ['arve', 'kokku', 'makse', 'kuupäev', 'summa', 'maks', 'number', 'kirjeldus', 'kogus', 'hind']
+}
+_UNIQUE_LANGUAGE_MARKERS = frozenset(
+    marker for markers in _LANGUAGE_MARKERS.values() for marker in markers
+)
+
 def extract_text(file_path: str, languages: Optional[List[str]] = None, 
                  use_layout: bool = True, pages: Optional[List[int]] = None) -> str:
     """
@@ -61,6 +76,92 @@ def extract_text(file_path: str, languages: Optional[List[str]] = None,
     logger.warning("Falling back to basic text extraction")
     return extract_basic_text(file_path)
 
+def iter_page_text(file_path: str, languages: Optional[List[str]] = None,
+                   use_layout: bool = True, ocr_workers: int = 1) -> Iterator[str]:
+    """
+    Yield text from a PDF file page by page, using the same fallback order as extract_text.
+    
+    Pages are produced as soon as each one is extracted, so callers can start working
+    on the first pages while the rest of the document is still being processed.
+    
+    Args:
+        file_path: Path to the PDF file
+        languages: List of language codes for OCR (e.g., ['eng', 'pol', 'deu'])
+        use_layout: Whether to preserve layout information
+        ocr_workers: Number of pages to OCR concurrently when falling back to Tesseract
+        
+    Yields:
+        Text of each page in document order
+    """
+    if not os.path.exists(file_path):
+        logger.error(f"File not found: {file_path}")
+        return
+    
+    logger.info(f"Extracting text page by page from {file_path}")
+    
+    # Method 1: pdftotext; hold pages back until there is enough text to trust it
+    if PDFTOTEXT_AVAILABLE:
+        logger.info("Attempting extraction with pdftotext")
+        held_pages = []
+        held_length = 0
+        for page in _iter_pdftotext_pages(file_path, use_layout):
+            if held_pages is None:
+                yield page
+                continue
+            held_pages.append(page)
+            held_length += len(page.strip())
+            if held_length > 100:
+                logger.info("Successfully extracted text with pdftotext")
+                yield from held_pages
+                held_pages = None
+        if held_pages is None:
+            return
+    
+    # Method 2: Tesseract OCR
+    if TESSERACT_AVAILABLE and PDFTOPPM_AVAILABLE:
+        logger.info("Attempting extraction with Tesseract OCR")
+        found_text = False
+        for page in _iter_tesseract_pages(file_path, languages, workers=ocr_workers):
+            found_text = True
+            yield page
+        if found_text:
+            return
+    
+    # Method 3: Fallback to basic text extraction
+    logger.warning("Falling back to basic text extraction")
+    text = extract_basic_text(file_path)
+    if text:
+        yield text
+
+def _iter_pdftotext_pages(file_path: str, use_layout: bool = True) -> Iterator[str]:
+    """Stream pdftotext output, yielding one page per form feed."""
+    cmd = ['pdftotext']
+    if use_layout:
+        cmd.append('-layout')
+    cmd.extend([file_path, '-'])
+    
+    try:
+        # stderr goes to a file: a pipe nobody reads while stdout streams
+        # fills up on damaged PDFs and blocks pdftotext
+        with tempfile.TemporaryFile(mode='w+') as stderr, \
+                subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr,
+                                 text=True) as proc:
+            page = []
+            for line in proc.stdout:
+                *finished, rest = line.split('\f')
+                for part in finished:
+                    page.append(part)
+                    yield ''.join(page)
+                    page = []
+                page.append(rest)
+            if any(page):
+                yield ''.join(page)
+            if proc.wait() != 0:
+                stderr.seek(0)
+                logger.error(f"pdftotext error: {stderr.read()}")
+    except Exception as e:
+        logger.error(f"Error in pdftotext extraction: {e}")
+
 def extract_with_pdftotext(file_path: str, use_layout: bool = True) -> str:
     """
     Extract text from PDF using pdftotext command line tool.
@@ -106,6 +207,36 @@ def extract_with_tesseract(file_path: str, languages: Optional[List[str]] = None
     Returns:
         Extracted text
     """
+    return '\n\n'.join(_iter_tesseract_pages(file_path, languages, pages))
+
+def extract_text_parallel(file_path: str, languages: Optional[List[str]] = None,
+                          workers: Optional[int] = None,
+                          pages: Optional[List[int]] = None) -> str:
+    """
+    Extract text from PDF using Tesseract OCR on several pages at once.
+    
+    Args:
+        file_path: Path to the PDF file
+        languages: List of language codes for OCR
+        workers: Number of concurrent Tesseract processes (default: min(cpu count, 6))
+        pages: Specific pages to extract
+        
+    Returns:
+        Extracted text, pages joined in document order
+    """
+    workers = workers or min(os.cpu_count() or 1, 6)
+    return '\n\n'.join(_iter_tesseract_pages(file_path, languages, pages, workers=workers))
+
+def _iter_tesseract_pages(file_path: str, languages: Optional[List[str]] = None,
+                          pages: Optional[List[int]] = None,
+                          workers: int = 1) -> Iterator[str]:
+    """
+    Rasterize the PDF and yield Tesseract output one page at a time.
+    
+    With workers > 1 the pages are OCR'd concurrently; each Tesseract run is its own
+    process, so threads are enough to keep several cores busy. Pages are still
+    yielded in document order.
+    """
     try:
         # Create temp directory for image files
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -129,31 +260,45 @@ def extract_with_tesseract(file_path: str, languages: Optional[List[str]] = None
             ])
             
             # Process each image with Tesseract
-            full_text = []
-            for img_file in image_files:
-                # Build tesseract command
-                cmd = ['tesseract', img_file, 'stdout']
-                if languages:
-                    lang_str = '+'.join(languages)
-                    cmd.extend(['-l', lang_str])
-                
-                # Run tesseract
-                result = subprocess.run(
-                    cmd,
-                    check=True,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                full_text.append(result.stdout)
-            
-            return '\n\n'.join(full_text)
+            if workers > 1 and len(image_files) > 1:
+                # One OpenMP thread per Tesseract process avoids oversubscribing the cores
+                env = dict(os.environ, OMP_THREAD_LIMIT='1')
+                executor = ThreadPoolExecutor(max_workers=workers)
+                try:
+                    yield from executor.map(
+                        lambda img_file: _run_tesseract(img_file, languages, env),
+                        image_files
+                    )
+                finally:
+                    # Drop queued pages if the caller stopped reading early
+                    executor.shutdown(wait=True, cancel_futures=True)
+            else:
+                for img_file in image_files:
+                    yield _run_tesseract(img_file, languages)
     except subprocess.CalledProcessError as e:
         logger.error(f"OCR error: {e.stderr if hasattr(e, 'stderr') else str(e)}")
-        return ""
     except Exception as e:
         logger.error(f"Error in OCR extraction: {e}")
-        return ""
+
+def _run_tesseract(img_file: str, languages: Optional[List[str]] = None,
+                   env: Optional[Dict[str, str]] = None) -> str:
+    """Run Tesseract on a single page image and return its text."""
+    # Build tesseract command
+    cmd = ['tesseract', img_file, 'stdout']
+    if languages:
+        lang_str = '+'.join(languages)
+        cmd.extend(['-l', lang_str])
+    
+    # Run tesseract
+    result = subprocess.run(
+        cmd,
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env
+    )
+    return result.stdout
 
 def extract_basic_text(file_path: str) -> str:
     """
@@ -309,27 +454,15 @@ def get_document_language_confidence(text: str) -> Dict[str, float]:
     Returns:
         Dictionary mapping language codes to confidence scores
     """
-    # Simple language detection based on common words
-    language_markers = {
-        'en': ['invoice', 'total', 'payment', 'date', 'amount', 'tax', 'number', 'description', 'quantity', 'price'],
-        'pl': ['faktura', 'razem', 'płatność', 'data', 'kwota', 'podatek', 'numer', 'opis', 'ilość', 'cena'],
-        'de': ['rechnung', 'gesamt', 'zahlung', 'datum', 'betrag', 'steuer', 'nummer', 'beschreibung', 'menge', 'preis'],
-        'es': ['factura', 'total', 'pago', 'fecha', 'importe', 'impuesto', 'número', 'descripción', 'cantidad', 'precio'],
-        'fr': ['facture', 'total', 'paiement', 'date', 'montant', 'taxe', 'numéro', 'description', 'quantité', 'prix'],
-        'it': ['fattura', 'totale', 'pagamento', 'data', 'importo', 'tassa', 'numero', 'descrizione', 'quantità', 'prezzo'],
-        'et': ['arve', 'kokku', 'makse', 'kuupäev', 'summa', 'maks', 'number', 'kirjeldus', 'kogus', 'hind']
-    }
-    
+    # Count each distinct marker once; several are shared between languages
     text_lower = text.lower()
-    scores = {}
-    
-    for lang, markers in language_markers.items():
-        # Count occurrences of each marker
-        count = sum(text_lower.count(marker) for marker in markers)
-        # Calculate score as percentage of markers found
-        scores[lang] = count / len(markers)
+    counts = {marker: text_lower.count(marker) for marker in _UNIQUE_LANGUAGE_MARKERS}
     
-    return scores
+    # Score is the number of marker hits relative to the number of markers
+    return {
+        lang: sum(counts[marker] for marker in markers) / len(markers)
+        for lang, markers in _LANGUAGE_MARKERS.items()
+    }
 
 def extract_html_with_regions(file_path: str, languages: Optional[List[str]] = None) -> str:
     """
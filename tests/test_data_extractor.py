@@ -0,0 +1,123 @@
+"""
+Tests for the DataExtractor base class.
+"""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from invocr.core.extractor import DataExtractor, _run_batch, extract_batch
+
+_PARENT_PID = os.getpid()
+
+
+class _EchoExtractor:
+    """Picklable stand-in extractor returning its input."""
+
+    def __init__(self, languages=None):
+        self.languages = languages
+
+    def extract_invoice_data(self, text, document_type="invoice"):
+        if text == "boom":
+            raise ValueError("cannot extract")
+        if text == "crash" and os.getpid() != _PARENT_PID:
+            os._exit(1)
+        return {"text": text, "document_type": document_type}
+
+
+class _ParentOnlyExtractor(_EchoExtractor):
+    """Extractor that cannot be created in a worker process."""
+
+    def __init__(self, languages=None):
+        if os.getpid() != _PARENT_PID:
+            raise RuntimeError("not available in worker processes")
+        super().__init__(languages)
+
+
+def _without_timestamp(results):
+    for result in results:
+        result["_metadata"].pop("extraction_timestamp", None)
+    return results
+
+
+class TestParseDate:
+    @pytest.mark.parametrize(
+        "date_str, expected",
+        [
+            # DD-MM-YYYY
+            ("15-10-2023", "2023-10-15"),
+            ("5.1.2024", "2024-01-05"),
+            ("15/10/2023", "2023-10-15"),
+            # YYYY-MM-DD
+            ("2023-10-15", "2023-10-15"),
+            ("2024/1/5", "2024-01-05"),
+            # DD-MM-YY, with strptime's %y pivot
+            ("15-10-23", "2023-10-15"),
+            ("01-01-68", "2068-01-01"),
+            ("01-01-69", "1969-01-01"),
+            # Mixed separators
+            ("15-10.2023", "2023-10-15"),
+            ("2023/10-15", "2023-10-15"),
+        ],
+    )
+    def test_valid_dates(self, date_str, expected):
+        """Test parsing of numeric dates into ISO format."""
+        assert DataExtractor._parse_date(date_str) == expected
+
+    @pytest.mark.parametrize(
+        "date_str",
+        ["31-02-2024", "29-02-2023", "2024-13-01", "00-10-2023", "15 Oct 2023", ""],
+    )
+    def test_invalid_dates_unchanged(self, date_str):
+        """Test that invalid calendar dates and other text are returned unchanged."""
+        assert DataExtractor._parse_date(date_str) == date_str
+
+
+class TestExtractBatch:
+    texts = [
+        f"INVOICE\nInvoice Number: INV-{i:03d}\nTotal: {i}0.00 EUR\n" for i in range(6)
+    ]
+
+    def test_results_in_input_order(self):
+        """Test that pooled results come back in input order."""
+        results = extract_batch(self.texts, ["en"], workers=2)
+        assert [result["totals"]["total"] for result in results] == [
+            i * 10.0 for i in range(6)
+        ]
+
+    def test_serial_paths_match_pool(self):
+        """Test that the workers=1 and single-text paths match the pool."""
+        pooled = _without_timestamp(extract_batch(self.texts, ["en"], workers=2))
+        serial = _without_timestamp(extract_batch(self.texts, ["en"], workers=1))
+        single = [
+            _without_timestamp(extract_batch([text], ["en"], workers=2))[0]
+            for text in self.texts
+        ]
+        assert serial == pooled
+        assert single == pooled
+
+    def test_unpicklable_factory_runs_serially(self):
+        """Test that a factory that cannot be sent to workers is run in-process."""
+        texts = ["a", "b", "c"]
+        results = _run_batch(
+            lambda languages: _EchoExtractor(languages), None, texts, "receipt", 2
+        )
+        assert results == [{"text": text, "document_type": "receipt"} for text in texts]
+
+    def test_worker_init_failure_runs_serially(self):
+        """Test that a factory failing in the workers runs in-process instead."""
+        texts = ["a", "b", "c"]
+        results = _run_batch(_ParentOnlyExtractor, None, texts, "invoice", 2)
+        assert results == [{"text": text, "document_type": "invoice"} for text in texts]
+
+    def test_worker_dying_is_not_rerun(self):
+        """Test that a worker dying on a text raises instead of rerunning the batch."""
+        with pytest.raises(BrokenProcessPool):
+            _run_batch(_EchoExtractor, None, ["a", "crash", "c"], "invoice", 2)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_extraction_error_propagates(self, workers):
+        """Test that an error raised by the extractor reaches the caller."""
+        with pytest.raises(ValueError, match="cannot extract"):
+            _run_batch(_EchoExtractor, None, ["a", "boom", "c"], "invoice", workers)
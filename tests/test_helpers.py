@@ -0,0 +1,82 @@
+"""
+Tests for helper utilities.
+"""
+
+import json
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+
+from invocr.core.detection.decision_tree import InvoiceType
+from invocr.utils import helpers
+
+
+class _Status(Enum):
+    PAID = "paid"
+    OPEN = "open"
+
+
+@dataclass
+class _Party:
+    name: str
+
+
+def _sample():
+    items = defaultdict(list)
+    items["widgets"].append({"qty": 2, "price": 10.5})
+    return {
+        "header": OrderedDict([("number", "INV-001"), ("currency", "EUR")]),
+        "items": items,
+        "issued": date(2024, 3, 15),
+        "created": datetime(2024, 3, 15, 12, 30),
+        "seller": _Party("ACME"),
+        "total": Decimal("21.00"),
+        "rates": {19: 0.19},
+        "paid": False,
+        "notes": None,
+        "status": _Status.PAID,
+        "type": InvoiceType.RECEIPT,
+        "ratios": [float("nan"), float("inf"), -float("inf"), 0.5],
+    }
+
+
+class TestWriteJson:
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_backends_agree(self, tmp_path, monkeypatch, compact):
+        """Test that orjson and the stdlib fallback write the same JSON."""
+        pytest.importorskip("orjson")
+        fast_path = tmp_path / "orjson.json"
+        helpers.write_json(fast_path, _sample(), compact=compact)
+        monkeypatch.setattr(helpers, "ORJSON_AVAILABLE", False)
+        std_path = tmp_path / "stdlib.json"
+        helpers.write_json(std_path, _sample(), compact=compact)
+
+        written = json.loads(fast_path.read_text(encoding="utf-8"))
+        assert written == json.loads(std_path.read_text(encoding="utf-8"))
+        assert written["header"] == {"number": "INV-001", "currency": "EUR"}
+        assert written["items"] == {"widgets": [{"qty": 2, "price": 10.5}]}
+        assert written["issued"] == "2024-03-15"
+        assert written["created"] == "2024-03-15 12:30:00"
+        assert written["seller"] == "_Party(name='ACME')"
+        assert written["total"] == "21.00"
+        assert written["rates"] == {"19": 0.19}
+        assert written["status"] == "paid"
+        assert written["type"] == 1
+        assert written["ratios"] == [None, None, None, 0.5]
+
+    def test_stdlib_non_finite_floats(self, tmp_path, monkeypatch):
+        """Test that the stdlib fallback writes NaN and infinities as null."""
+        monkeypatch.setattr(helpers, "ORJSON_AVAILABLE", False)
+        path = tmp_path / "out.json"
+        helpers.write_json(path, {"a": float("nan"), "b": (1.5, float("inf"))}, True)
+        assert path.read_text(encoding="utf-8") == '{"a":null,"b":[1.5,null]}'
+
+    def test_compact_has_no_whitespace(self, tmp_path):
+        """Test that compact output has no indentation or separator spaces."""
+        path = tmp_path / "out.json"
+        helpers.write_json(path, {"a": [1, 2], "b": "x"}, compact=True)
+        assert path.read_text(encoding="utf-8") == '{"a":[1,2],"b":"x"}'
@@ -0,0 +1,193 @@
+"""
+Tests for the language-specific invoice extractors.
+"""
+
+import copy
+import logging
+
+import pytest
+
+from invocr.extractors import _extract_cached, extract_invoice_data, get_extractor
+from invocr.extractors.de.extractor import GermanExtractor
+from invocr.extractors.en.extractor import EnglishExtractor
+from invocr.extractors.es.extractor import SpanishExtractor
+from invocr.extractors.fr.extractor import FrenchExtractor
+
+
+class TestIbanExtraction:
+    @pytest.mark.parametrize(
+        "extractor_class, text, iban",
+        [
+            (
+                GermanExtractor,
+                "IBAN: DE89 3704 0044 0532 0130 00\nBIC: COBADEFFXXX",
+                "DE89370400440532013000",
+            ),
+            (
+                SpanishExtractor,
+                "IBAN: ES91 2100 0418 4502 0005 1332\nBIC: CAIXESBBXXX",
+                "ES9121000418450200051332",
+            ),
+            (
+                FrenchExtractor,
+                "IBAN : FR14 2004 1010 0505 0001 3M02 606\nBIC : PSSTFRPPPAR",
+                "FR1420041010050500013M02606",
+            ),
+        ],
+    )
+    def test_valid_iban(self, caplog, extractor_class, text, iban):
+        """Test that a valid IBAN is captured in full and not reported."""
+        with caplog.at_level(logging.WARNING):
+            result = extractor_class()._extract_payment_info(text, "")
+        assert result["bank_account"] == iban
+        assert "IBAN checksum mismatch" not in caplog.text
+
+    @pytest.mark.parametrize(
+        "extractor_class, text, iban",
+        [
+            (
+                GermanExtractor,
+                "IBAN: DE89 3704 0044 0532 0130 01\nBIC: COBADEFFXXX",
+                "DE89370400440532013001",
+            ),
+            (
+                SpanishExtractor,
+                "IBAN: ES91 2100 0418 4502 0005 1333\nBIC: CAIXESBBXXX",
+                "ES9121000418450200051333",
+            ),
+            (
+                FrenchExtractor,
+                "IBAN : FR14 2004 1010 0505 0001 3M02 607\nBIC : PSSTFRPPPAR",
+                "FR1420041010050500013M02607",
+            ),
+        ],
+    )
+    def test_corrupted_iban(self, caplog, extractor_class, text, iban):
+        """Test that an IBAN with a wrong check digit is kept but reported."""
+        with caplog.at_level(logging.WARNING):
+            result = extractor_class()._extract_payment_info(text, "")
+        assert result["bank_account"] == iban
+        assert f"IBAN checksum mismatch: {iban}" in caplog.text
+
+
+class TestGermanDates:
+    @pytest.mark.parametrize(
+        "date_str, expected",
+        [
+            ("5. März 2024", "2024-03-05"),
+            ("15. Maerz 2024", "2024-03-15"),
+            ("05. Dez. 2024", "2024-12-05"),
+            ("1.Januar 2025", "2025-01-01"),
+            # Numeric dates go to DataExtractor._parse_date
+            ("15.03.2024", "2024-03-15"),
+            ("15.03.24", "2024-03-15"),
+            # Invalid calendar dates are returned unchanged
+            ("31. Feb. 2024", "31. Feb. 2024"),
+        ],
+    )
+    def test_parse_german_date(self, date_str, expected):
+        """Test parsing of written-out and numeric German dates."""
+        assert GermanExtractor._parse_german_date(date_str) == expected
+
+    def test_written_out_issue_date(self):
+        """Test that a written-out issue date is not mistaken for the due date."""
+        text = "Rechnungsdatum: 15. März 2024\nFällig: 14.04.2024\n"
+        result = GermanExtractor()._extract_basic_info(text, "de")
+        assert result["issue_date"] == "2024-03-15"
+        assert result["due_date"] == "2024-04-14"
+
+
+class TestExtractMany:
+    def test_matches_sequential_extraction(self):
+        """Test that extract_many matches extracting one text at a time."""
+        texts = [
+            f"INVOICE\nInvoice Number: INV-{i:03d}\nDate: 15/03/2024\n"
+            f"Total: {i}0.00 EUR\n"
+            for i in range(4)
+        ]
+        extractor = EnglishExtractor(["en"])
+        batched = extractor.extract_many(texts, workers=2)
+        sequential = [extractor.extract_invoice_data(text) for text in texts]
+        for result in batched + sequential:
+            result["_metadata"].pop("extraction_timestamp")
+        assert batched == sequential
+
+
+class TestSharedExtraction:
+    text = "INVOICE\nInvoice Number: INV-042\nDate: 15/03/2024\nTotal: 42.00 EUR\n"
+
+    def test_mutating_result_does_not_change_cache(self):
+        """Test that changes to a returned result do not leak into the cache."""
+        _extract_cached.cache_clear()
+        first = extract_invoice_data(self.text)
+        expected = copy.deepcopy(first)
+        first["totals"]["total"] = -1
+        first["_metadata"]["language"] = "xx"
+        first["items"].append({"description": "injected"})
+        assert extract_invoice_data(self.text) == expected
+
+    def test_no_cache_bypasses_cache(self, monkeypatch):
+        """Test that no_cache runs the extractor and leaves the cache untouched."""
+        _extract_cached.cache_clear()
+        extract_invoice_data(self.text)
+        extractor = get_extractor("en")
+        calls = []
+        original = extractor.extract_invoice_data
+
+        def counting_extract(text, document_type="invoice"):
+            calls.append(text)
+            return original(text, document_type)
+
+        monkeypatch.setattr(extractor, "extract_invoice_data", counting_extract)
+        before = _extract_cached.cache_info()
+        extract_invoice_data(self.text, no_cache=True)
+        extract_invoice_data(self.text + "\n", no_cache=True)
+        assert calls == [self.text, self.text + "\n"]
+        assert _extract_cached.cache_info() == before
+
+    def test_get_extractor_shares_instance(self):
+        """Test that get_extractor shares one instance per language, in any case."""
+        extractor = get_extractor("de")
+        assert isinstance(extractor, GermanExtractor)
+        assert get_extractor("de") is extractor
+        assert get_extractor("DE") is extractor
+        assert get_extractor("en") is not extractor
+
+    def test_get_extractor_unsupported_language(self):
+        """Test that an unsupported language code is rejected."""
+        with pytest.raises(ValueError, match="Unsupported language: xx"):
+            get_extractor("xx")
+
+
+class TestRe2NonAsciiText:
+    """Non-ASCII text must be matched by re, whose \\s and \\d are not ASCII-only."""
+
+    def test_german_nbsp_and_umlauts(self):
+        """Test German fields separated by non-breaking spaces, next to umlauts."""
+        pytest.importorskip("re2")
+        text = (
+            "Rechnung\nRechnungsnummer:\xa0RE-2024-001\n"
+            "Rechnungsdatum:\xa015.03.2024\nFällig:\xa014.04.2024\n"
+            "Nettobetrag:\xa0100,00\xa0EUR\nMwSt\xa019%:\xa019,00\xa0EUR\n"
+            "Gesamtbetrag:\xa0119,00\xa0EUR\n"
+            "IBAN:\xa0DE89\xa03704\xa00044\xa00532\xa00130\xa000\n"
+        )
+        result = GermanExtractor().extract_invoice_data(text)
+        assert result["document_number"] == "RE-2024-001"
+        assert result["issue_date"] == "2024-03-15"
+        assert result["due_date"] == "2024-04-14"
+        assert result["net_amount"] == 100.0
+        assert result["total_amount"] == 119.0
+        assert "".join(result["bank_account"].split()) == "DE89370400440532013000"
+
+    def test_english_nbsp_and_currency_signs(self):
+        """Test English fields separated by non-breaking spaces, next to a euro sign."""
+        pytest.importorskip("re2")
+        text = (
+            "INVOICE\nInvoice Number:\xa0INV-001\nDate:\xa015/03/2024\n"
+            "Tax:\xa0$8.00\nTotal:\xa0$108.00\nPaid in €\n"
+        )
+        result = EnglishExtractor().extract_invoice_data(text)
+        assert result["issue_date"] == "2024-03-15"
+        assert result["totals"]["tax_amount"] == 8.0
+        assert result["totals"]["total"] == 108.0